@@ -0,0 +1,117 @@
+import sys
+import time
+from pathlib import Path
+
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+try:
+    from drawing_module import DrawingModule
+except ImportError:
+    from src.drawing_module import DrawingModule
+
+"""
+    Описание:
+        Сравнивает стоимость кадра при пересоздании многоугольников (canvas.delete + create_polygon)
+        и при обновлении существующих элементов через canvas.coords для 1, 100 и 1000 фигур.
+        При наличии дисплея используется настоящий tk.Canvas, иначе - записывающая заглушка,
+        которая считает вызовы и выделенные элементы холста.
+
+        Запуск: python benchmarks/bench_canvas_update.py
+
+"""
+
+SHAPE_COUNTS = (1, 100, 1000)
+FRAMES = 50
+
+
+class RecordingCanvas:
+    """
+        Заглушка холста, которая только считает вызовы и созданные элементы.
+        Таймеры after не запускаются, а лишь получают идентификатор.
+
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.next_item = 0
+
+    def create_polygon(self, *coords, **options):
+        self.calls += 1
+        self.next_item += 1
+        return self.next_item
+
+    def coords(self, item, *coords):
+        self.calls += 1
+
+    def delete(self, tag_or_item):
+        self.calls += 1
+
+    def after(self, delay, callback, *args):
+        self.calls += 1
+        return f'after#{self.calls}'
+
+    def after_cancel(self, after_id):
+        self.calls += 1
+
+
+def make_canvas():
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return RecordingCanvas(), None
+    canvas = tk.Canvas(root, width=750, height=600)
+    canvas.pack()
+    return canvas, root
+
+
+def frame_coords(shape_count, frame):
+    return [(i % 50 * 15 + frame % 5, i // 50 * 15, i % 50 * 15 + 10, i // 50 * 15, i % 50 * 15 + 5, i // 50 * 15 + 10)
+            for i in range(shape_count)]
+
+
+def run_recreate(canvas, shape_count):
+    frames = [frame_coords(shape_count, frame) for frame in range(FRAMES)]
+    start = time.perf_counter()
+    for coords in frames:
+        canvas.delete('triangle')
+        for triangle in coords:
+            canvas.create_polygon(*triangle, tags='triangle', fill='pink')
+        if hasattr(canvas, 'update_idletasks'):
+            canvas.update_idletasks()
+    elapsed = time.perf_counter() - start
+    canvas.delete('triangle')
+    return elapsed / FRAMES
+
+
+def run_coords(canvas, shape_count):
+    drawing_module = DrawingModule(canvas)
+    frames = [frame_coords(shape_count, frame) for frame in range(FRAMES)]
+    start = time.perf_counter()
+    for coords in frames:
+        for index, triangle in enumerate(coords):
+            drawing_module.draw_shape(f'triangle{index}', triangle)
+        if hasattr(canvas, 'update_idletasks'):
+            canvas.update_idletasks()
+    elapsed = time.perf_counter() - start
+    for index in range(shape_count):
+        drawing_module.remove_shape(f'triangle{index}')
+    return elapsed / FRAMES
+
+
+def main():
+    canvas, root = make_canvas()
+    backend = 'tk' if root is not None else 'recording stub'
+    print(f'backend: {backend}, frames: {FRAMES}')
+    print(f"{'shapes':>8} {'delete+create, ms':>20} {'coords, ms':>12} {'speedup':>8}")
+    for shape_count in SHAPE_COUNTS:
+        recreate = run_recreate(canvas, shape_count)
+        reuse = run_coords(canvas, shape_count)
+        print(f'{shape_count:>8} {recreate * 1000:>20.3f} {reuse * 1000:>12.3f} {recreate / reuse:>8.2f}')
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from collision import CollisionDetector, triangles_intersect
+from rotation_engine import rotate_triangles
+
+"""
+    Описание:
+        Сравнивает обнаружение пересечений перебором всех пар с сеткой широкой фазы и кэшем
+        пар-кандидатов CollisionDetector. Плотность сцены постоянна: площадь растет вместе с
+        количеством треугольников. Время кадра детектора - среднее по FRAMES кадрам вращения
+        после первого, на котором строится широкая фаза.
+
+        Запуск: python benchmarks/bench_collision.py
+
+"""
+
+SIZES = (1000, 10000, 100000)
+NAIVE_LIMIT = 2000
+FRAMES = 20
+SIZE = 10.0
+
+
+def scene(count, rng):
+    side = np.sqrt(count) * 4 * SIZE
+    centers = rng.uniform(0, side, size=(count, 2))
+    offsets = rng.uniform(-SIZE, SIZE, size=(count, 3, 2))
+    return (centers[:, np.newaxis, :] + offsets).reshape(count, 6), centers, rng.uniform(-180, 180, size=count)
+
+
+def naive(triangles):
+    first, second = np.triu_indices(len(triangles), 1)
+    hits = triangles_intersect(triangles[first], triangles[second])
+    return first[hits], second[hits]
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for count in SIZES:
+        triangles, centers, speeds = scene(count, rng)
+        detector = CollisionDetector()
+        start = time.perf_counter()
+        pairs = detector.detect(triangles, centers)
+        build = time.perf_counter() - start
+        if count <= NAIVE_LIMIT:
+            start = time.perf_counter()
+            expected = naive(triangles)
+            naive_time = f'{(time.perf_counter() - start) * 1000:10.1f} ms'
+            assert all(np.array_equal(a, b) for a, b in zip(pairs, expected))
+        else:
+            naive_time = f'{"-":>13}'
+        start = time.perf_counter()
+        for frame in range(1, FRAMES + 1):
+            detector.detect(rotate_triangles(triangles, centers, speeds * frame / 60), centers)
+        frame_time = (time.perf_counter() - start) / FRAMES
+        print(f'{count:7d} shapes: naive {naive_time}  build {build * 1000:8.1f} ms  '
+              f'frame {frame_time * 1000:7.2f} ms  candidates {len(detector.candidates[0]):7d}  '
+              f'colliding {len(detector.pairs[0]):6d}  rebuilds {detector.rebuilds}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from bench_canvas_update import RecordingCanvas
+from control_client import ControlClient
+from control_server import ControlServer
+from drawing_module import DrawingModule
+
+"""
+    Описание:
+        Измеряет пропускную способность и задержку сервера управления control_server без дисплея.
+        Основной поток играет роль цикла Tk: раз в кадр разбирает очередь команд и рисует кадр
+        на записывающей заглушке холста, а клиент в другом потоке отправляет команды через
+        TCP на localhost.
+
+        Пропускная способность - команды update, отправленные конвейером пакетами по PIPELINE;
+        задержка - время ответа на одиночные команды ping, которое включает ожидание следующего
+        кадра: команда, отправленная сразу после предыдущего ответа, ждет почти целый интервал кадра.
+
+        Запуск: python benchmarks/bench_control.py
+
+"""
+
+SHAPES = 1000
+UPDATES = 20000
+PIPELINE = 1000
+PINGS = 200
+
+
+def pump(server, client_thread):
+    loop = server.drawing_module.animation_loop
+    interval = server.poll_interval_ms / 1000
+    frames = 0
+    while client_thread.is_alive():
+        started = time.perf_counter()
+        server.process_commands()
+        if len(loop):
+            loop.frame()
+            frames += 1
+        time.sleep(max(0.0, interval - (time.perf_counter() - started)))
+    return frames
+
+
+def main():
+    rng = np.random.default_rng(0)
+    triangles = rng.uniform(0, 700, size=(SHAPES, 6))
+    centers = triangles.reshape(SHAPES, 3, 2).mean(axis=1)
+    server = ControlServer(DrawingModule(RecordingCanvas()))
+    address = server.start()
+    results = {}
+
+    def client():
+        with ControlClient(address) as control:
+            control.start((f'shape{index}', triangle, center, 45.0)
+                          for index, (triangle, center) in enumerate(zip(triangles.tolist(), centers.tolist())))
+            speeds = rng.uniform(-360, 360, size=UPDATES).tolist()
+            start = time.perf_counter()
+            for first in range(0, UPDATES, PIPELINE):
+                control.request_many([{'command': 'update', 'updates': [{'key': f'shape{(first + index) % SHAPES}',
+                                                                         'speed': speed}]}
+                                      for index, speed in enumerate(speeds[first:first + PIPELINE])])
+            results['throughput'] = UPDATES / (time.perf_counter() - start)
+            latencies = []
+            for _ in range(PINGS):
+                start = time.perf_counter()
+                control.request('ping')
+                latencies.append(time.perf_counter() - start)
+            results['latency'] = np.percentile(latencies, (50, 99)) * 1000
+
+    thread = threading.Thread(target=client)
+    thread.start()
+    frames = pump(server, thread)
+    thread.join()
+    server.stop()
+    print(f'shapes: {SHAPES}, frame interval: {server.poll_interval_ms} ms')
+    print(f'update throughput:  {results["throughput"]:10.0f} commands/s '
+          f'({server.commands} commands applied in {server.batches} batches, {frames} frames drawn)')
+    print(f'ping latency:       p50 {results["latency"][0]:6.2f} ms  p99 {results["latency"][1]:6.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from parallel_trajectories import TrajectoryPool
+from trajectory_cli import iter_trajectory_chunks
+
+"""
+    Описание:
+        Измеряет масштабирование параллельного расчета траекторий по числу процессов:
+        сцена из SHAPES треугольников на FRAMES кадров рассчитывается однопроцессным
+        путем trajectory_cli и пулом TrajectoryPool с 1, 2, 4, ... процессами до числа ядер.
+        Время пула включает только расчет (процессы пула запускаются заранее) и
+        проверяет побитовое совпадение с однопроцессным результатом.
+
+        Запуск: python benchmarks/bench_parallel.py
+
+"""
+
+SHAPES = 200000
+FRAMES = 64
+
+
+def main():
+    rng = np.random.default_rng(0)
+    triangles = rng.uniform(0, 700, size=(SHAPES, 6))
+    centers = rng.uniform(0, 700, size=(SHAPES, 2))
+    speeds = rng.uniform(-360, 360, size=SHAPES)
+
+    start = time.perf_counter()
+    expected = np.concatenate(list(iter_trajectory_chunks(triangles, centers, speeds, FRAMES, 0.02, chunk_size=16)))
+    single = time.perf_counter() - start
+    print(f'shapes: {SHAPES}, frames: {FRAMES}, cores: {os.cpu_count()}')
+    print(f'single process:      {single:8.3f} s')
+
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        with TrajectoryPool(triangles, centers, speeds, processes) as pool:
+            with pool.precompute(1, 0.02):
+                pass
+            start = time.perf_counter()
+            with pool.precompute(FRAMES, 0.02) as output:
+                elapsed = time.perf_counter() - start
+                identical = output.array.tobytes() == expected.tobytes()
+        print(f'{processes:3d} processes:       {elapsed:8.3f} s  speedup {single / elapsed:5.2f}x  '
+              f'bit-identical: {identical}')
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main()
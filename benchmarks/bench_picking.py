@@ -0,0 +1,54 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from hit_testing import pick_triangles
+from spatial_index import UniformGrid
+
+"""
+    Описание:
+        Измеряет задержку запроса «какая фигура под курсором» для 10 000 треугольников на
+        холсте 750x600: полный перебор pick_triangles против равномерной сетки UniformGrid.
+        Также измеряется время перестроения индекса, которое цикл анимации платит после
+        изменения положений фигур.
+
+        Запуск: python benchmarks/bench_picking.py
+
+"""
+
+SHAPES = 10000
+QUERIES = 2000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    corners = rng.uniform((0, 0), (750, 600), size=(SHAPES, 1, 2))
+    triangles = (corners + rng.uniform(-8, 8, size=(SHAPES, 3, 2))).reshape(SHAPES, 6)
+    points = rng.uniform((0, 0), (750, 600), size=(QUERIES, 2))
+
+    start = time.perf_counter()
+    for point in points:
+        pick_triangles(point, triangles)
+    brute_force = (time.perf_counter() - start) / QUERIES
+
+    grid = UniformGrid(cell_size=16)
+    start = time.perf_counter()
+    grid.build(triangles)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for x, y in points:
+        grid.query(x, y)
+    indexed = (time.perf_counter() - start) / QUERIES
+
+    print(f'shapes: {SHAPES}, queries: {QUERIES}')
+    print(f'brute force query: {brute_force * 1e6:10.1f} us')
+    print(f'grid query:        {indexed * 1e6:10.1f} us')
+    print(f'grid build:        {build * 1e3:10.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
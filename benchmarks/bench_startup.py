@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+"""
+    Описание:
+        Измеряет время холодного запуска программы с помощью python -X importtime.
+        Импортируются те же модули, что и в src/main.py (без создания окна), после чего
+        выводится суммарное время импорта и самые дорогие модули. Тест
+        tests/test_startup.py проверяет то же измерение против бюджета STARTUP_BUDGET_MS.
+
+        Запуск: python benchmarks/bench_startup.py
+
+"""
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+STARTUP_MODULES = ('tkinter_module', 'input_module', 'drawing_module', 'controller_module')
+STARTUP_BUDGET_MS = 150
+
+
+def measure_imports(modules=STARTUP_MODULES):
+    """
+        Запускает новый интерпретатор с -X importtime и разбирает его отчет.
+
+        Возвращаемое значение:
+            dict: Накопленное время импорта в микросекундах для каждого загруженного модуля.
+
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {', '.join(modules)}"],
+                            capture_output=True, text=True, env=env, check=True)
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def main():
+    timings = measure_imports()
+    total = sum(timings[module] for module in STARTUP_MODULES if module in timings)
+    print(f'startup imports: {total / 1000:.1f} ms (budget {STARTUP_BUDGET_MS} ms)')
+    for name, cumulative in sorted(timings.items(), key=lambda item: -item[1])[:10]:
+        print(f'{cumulative / 1000:10.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
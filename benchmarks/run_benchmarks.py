@@ -0,0 +1,211 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+try:
+    from animation_loop import AnimationLoop
+    from bench_canvas_update import RecordingCanvas
+    from controller_module import ControllerModule
+    from drawing_module import DrawingModule
+    from hit_testing import points_in_triangles
+    from input_module import InputModule
+    from rotation_engine import rotate_triangles
+except ImportError:
+    from benchmarks.bench_canvas_update import RecordingCanvas
+    from src.animation_loop import AnimationLoop
+    from src.controller_module import ControllerModule
+    from src.drawing_module import DrawingModule
+    from src.hit_testing import points_in_triangles
+    from src.input_module import InputModule
+    from src.rotation_engine import rotate_triangles
+
+"""
+    Описание:
+        Набор воспроизводимых бенчмарков горячих путей программы, не требующий дисплея.
+        Холст заменяется записывающей заглушкой RecordingCanvas, поэтому измеряется стоимость
+        Python-кода кадра, а не отрисовки Tk. Результаты сохраняются в JSON, который можно
+        сравнить с результатами другого коммита и завершиться с ошибкой при регрессии.
+
+        Путь к src добавляется в sys.path только при запуске файла как скрипта; при импорте
+        (например, из тестов) модули программы импортируются как пакет src.
+
+        Запуск:
+            python benchmarks/run_benchmarks.py --output results.json
+            python benchmarks/run_benchmarks.py --compare baseline.json --threshold 0.25
+
+"""
+
+BATCH_SIZES = (1, 10, 100, 1000, 10000, 100000)
+FRAME_SHAPE_COUNTS = (1, 100, 1000)
+HIT_TEST_POINTS = 100
+
+
+def random_triangles(count, seed=0):
+    rng = np.random.default_rng(seed)
+    corners = rng.uniform((0, 0), (750, 600), size=(count, 1, 2))
+    triangles = (corners + rng.uniform(-20, 20, size=(count, 3, 2))).reshape(count, 6)
+    centers = triangles.reshape(count, 3, 2).mean(axis=1)
+    return triangles, centers
+
+
+def bench_rotate_triangle_frame():
+    drawing_module = DrawingModule(RecordingCanvas())
+    drawing_module.rotate_triangle((0, 0, 200, 0, 100, 100), (100, 50), 90.0)
+    return drawing_module.animation_loop.frame
+
+
+def bench_loop_frame(shape_count):
+    triangles, centers = random_triangles(shape_count)
+    drawing_module = DrawingModule(RecordingCanvas())
+    loop = AnimationLoop(drawing_module.canvas, drawing_module.draw_shape, drawing_module.remove_shape)
+    for index, (triangle, center) in enumerate(zip(triangles, centers)):
+        loop.start(f'shape{index}', triangle, center, 45.0)
+    return loop.frame
+
+
+def bench_rotate_batch(shape_count):
+    triangles, centers = random_triangles(shape_count)
+    angles = np.linspace(0, 360, shape_count)
+    return lambda: rotate_triangles(triangles, centers, angles)
+
+
+def bench_point_in_triangle_cross_product():
+    controller = ControllerModule(Mock(), Mock(), Mock())
+    return lambda: controller.point_in_triangle_cross_product(0, 0, 200, 0, 100, 100, 100, 50)
+
+
+def bench_points_in_triangles(shape_count):
+    triangles, _ = random_triangles(shape_count)
+    points = np.random.default_rng(1).uniform((0, 0), (750, 600), size=(HIT_TEST_POINTS, 2))
+    return lambda: points_in_triangles(points, triangles)
+
+
+def bench_get_input_values():
+    input_module = InputModule(Mock())
+    values = ('0', '0', '200', '0', '100', '100', '90', '100', '50')
+    return lambda: input_module.get_input_values(*values)
+
+
+def benchmarks():
+    """
+        Возвращает словарь бенчмарков: имя -> функция, подготавливающая измеряемый вызов.
+
+    """
+    suite = {'rotate_triangle_frame': bench_rotate_triangle_frame,
+             'point_in_triangle_cross_product': bench_point_in_triangle_cross_product,
+             'get_input_values': bench_get_input_values}
+    for count in FRAME_SHAPE_COUNTS:
+        suite[f'loop_frame_{count}'] = lambda count=count: bench_loop_frame(count)
+    for count in BATCH_SIZES:
+        suite[f'rotate_batch_{count}'] = lambda count=count: bench_rotate_batch(count)
+        suite[f'points_in_triangles_{HIT_TEST_POINTS}x{count}'] = lambda count=count: bench_points_in_triangles(count)
+    return suite
+
+
+def measure(function, repeats=5, min_time=0.05):
+    """
+        Измеряет время одного вызова function.
+
+        Описание:
+            Количество вызовов в серии подбирается так, чтобы серия длилась не меньше
+            min_time секунд; из repeats серий берется минимальное время на вызов.
+
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best, number
+
+
+def run(selected=None, repeats=5, stream=None):
+    """
+        Выполняет бенчмарки и возвращает результаты в виде словаря для JSON.
+
+        Ключевые аргументы:
+            selected (list): Подстроки имен бенчмарков для запуска или None для всех.
+            repeats (int): Количество серий измерений.
+            stream: Поток для строк с результатами по мере измерения или None, чтобы не выводить их.
+
+    """
+    results = {}
+    for name, setup in benchmarks().items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        seconds, number = measure(setup(), repeats)
+        results[name] = {'seconds': seconds, 'number': number}
+        if stream is not None:
+            print(f'{name:40s} {seconds * 1e6:14.2f} us', file=stream)
+    return {'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'results': results}
+
+
+def compare(current, baseline, threshold):
+    """
+        Сравнивает результаты с базовыми и возвращает список регрессий.
+
+        Ключевые аргументы:
+            current (dict): Текущие результаты run().
+            baseline (dict): Базовые результаты run().
+            threshold (float): Допустимое относительное замедление, например 0.25 = 25 %.
+
+        Возвращаемое значение:
+            list: Кортежи (имя, базовое время, текущее время) для бенчмарков, замедлившихся
+            больше чем на threshold.
+
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is not None and result['seconds'] > base['seconds'] * (1 + threshold):
+            regressions.append((name, base['seconds'], result['seconds']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки вращения, проверки попадания и отрисовки")
+    parser.add_argument('--output', help="файл для результатов в JSON")
+    parser.add_argument('--compare', help="файл базовых результатов в JSON")
+    parser.add_argument('--threshold', type=float, default=0.25, help="допустимое замедление, доля")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--select', nargs='*', help="подстроки имен бенчмарков для запуска")
+    args = parser.parse_args(argv)
+    current = run(args.select, args.repeats, sys.stderr)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for name, base, now in regressions:
+            print(f'REGRESSION {name}: {base * 1e6:.2f} us -> {now * 1e6:.2f} us', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,241 @@
+import numpy as np
+
+"""
+    Описание:
+        Пакетные аффинные преобразования многоугольников с произвольным числом вершин.
+        Преобразования задаются однородными матрицами 3x3 формы (N, 3, 3), по одной на
+        многоугольник, и комбинируются функцией compose. Вершины всех многоугольников хранятся
+        в одном упакованном буфере PolygonBuffer со смещениями, и весь буфер преобразуется одним
+        пакетным умножением матриц. Треугольник - частный случай многоугольника из трех вершин.
+
+        Направление поворота совпадает с rotation_engine.rotate_triangles:
+        x' = cx + dx * cos - dy * sin, y' = cy + dx * sin + dy * cos.
+
+"""
+
+
+def identity(count=1):
+    """
+        Возвращает единичные матрицы формы (count, 3, 3).
+
+    """
+    return np.broadcast_to(np.eye(3), (count, 3, 3)).copy()
+
+
+def _matrices(*values):
+    values = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+    matrices = np.zeros(values[0].shape + (3, 3))
+    matrices[..., 2, 2] = 1.0
+    return values, matrices
+
+
+def translation(dx, dy):
+    """
+        Возвращает матрицы переноса на (dx, dy).
+
+        Ключевые аргументы:
+            dx, dy (array_like): Смещения по осям, скаляры или массивы формы (N,).
+
+        Возвращаемое значение:
+            numpy.ndarray: Матрицы формы (..., 3, 3).
+
+    """
+    (dx, dy), matrices = _matrices(dx, dy)
+    matrices[..., 0, 0] = matrices[..., 1, 1] = 1.0
+    matrices[..., 0, 2] = dx
+    matrices[..., 1, 2] = dy
+    return matrices
+
+
+def scaling(sx, sy=None, center_x=0.0, center_y=0.0):
+    """
+        Возвращает матрицы масштабирования относительно точки (center_x, center_y).
+
+        Ключевые аргументы:
+            sx, sy (array_like): Коэффициенты масштаба по осям; если sy не задан, sy = sx.
+            center_x, center_y (array_like): Неподвижная точка масштабирования.
+
+        Возвращаемое значение:
+            numpy.ndarray: Матрицы формы (..., 3, 3).
+
+    """
+    (sx, sy, center_x, center_y), matrices = _matrices(sx, sx if sy is None else sy, center_x, center_y)
+    matrices[..., 0, 0] = sx
+    matrices[..., 1, 1] = sy
+    matrices[..., 0, 2] = center_x - sx * center_x
+    matrices[..., 1, 2] = center_y - sy * center_y
+    return matrices
+
+
+def rotation(angles, center_x=0.0, center_y=0.0):
+    """
+        Возвращает матрицы поворота на углы angles вокруг точки (center_x, center_y).
+
+        Ключевые аргументы:
+            angles (array_like): Углы поворота в градусах.
+            center_x, center_y (array_like): Центр поворота.
+
+        Возвращаемое значение:
+            numpy.ndarray: Матрицы формы (..., 3, 3).
+
+    """
+    (angles, center_x, center_y), matrices = _matrices(angles, center_x, center_y)
+    radians = np.radians(angles)
+    cos = np.cos(radians)
+    sin = np.sin(radians)
+    matrices[..., 0, 0] = cos
+    matrices[..., 0, 1] = -sin
+    matrices[..., 1, 0] = sin
+    matrices[..., 1, 1] = cos
+    matrices[..., 0, 2] = center_x - cos * center_x + sin * center_y
+    matrices[..., 1, 2] = center_y - sin * center_x - cos * center_y
+    return matrices
+
+
+def compose(*matrices):
+    """
+        Комбинирует преобразования в порядке их применения.
+
+        Ключевые аргументы:
+            matrices: Матрицы формы (..., 3, 3); первая применяется первой.
+
+        Возвращаемое значение:
+            numpy.ndarray: Матрицы M_k @ ... @ M_1 с размерностями, приведенными по правилам broadcasting.
+
+    """
+    result = matrices[0]
+    for matrix in matrices[1:]:
+        result = np.matmul(matrix, result)
+    return result
+
+
+def orbit(spin_angles, center_x, center_y, orbit_angles, pivot_x, pivot_y):
+    """
+        Возвращает матрицы вращения вокруг собственного центра, который сам обращается вокруг опоры.
+
+        Ключевые аргументы:
+            spin_angles (array_like): Углы поворота фигуры вокруг ее исходного центра в градусах.
+            center_x, center_y (array_like): Исходный центр фигуры.
+            orbit_angles (array_like): Углы обращения центра вокруг опоры в градусах.
+            pivot_x, pivot_y (array_like): Точка опоры орбиты.
+
+        Возвращаемое значение:
+            numpy.ndarray: Матрицы формы (..., 3, 3).
+
+        Описание:
+            Фигура сначала поворачивается вокруг своего центра, а затем вместе с ним - вокруг
+            опоры, поэтому центр вращения движется по окружности.
+
+    """
+    return compose(rotation(spin_angles, center_x, center_y), rotation(orbit_angles, pivot_x, pivot_y))
+
+
+class PolygonBuffer:
+    """
+       Класс упакованного буфера вершин многоугольников разного размера.
+
+       Ключевые атрибуты:
+           vertices (numpy.ndarray): Вершины всех многоугольников подряд, форма (V, 2).
+           offsets (numpy.ndarray): Смещения многоугольников в vertices, форма (N + 1,);
+               многоугольник i - это vertices[offsets[i]:offsets[i + 1]].
+           owners (numpy.ndarray): Номер многоугольника для каждой вершины, форма (V,).
+
+       Методы:
+
+           from_polygons(cls, polygons):
+               Упаковывает последовательность многоугольников.
+
+           from_triangles(cls, triangles):
+               Упаковывает треугольники формы (N, 6) как многоугольники из трех вершин.
+
+           polygon(self, index):
+               Возвращает вершины одного многоугольника.
+
+           coords(self):
+               Возвращает плоские списки координат (x1, y1, x2, y2, ...) для холста.
+
+           transform(self, matrices):
+               Применяет к каждому многоугольнику свою матрицу преобразования.
+
+    """
+
+    def __init__(self, vertices, offsets, owners=None):
+        self.vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        if self.offsets[0] != 0 or self.offsets[-1] != len(self.vertices) or np.any(np.diff(self.offsets) < 0):
+            raise ValueError("Смещения многоугольников не согласованы с буфером вершин")
+        if owners is None:
+            owners = np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+        self.owners = owners
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def counts(self):
+        return np.diff(self.offsets)
+
+    @classmethod
+    def from_polygons(cls, polygons):
+        """
+            Упаковывает последовательность многоугольников.
+
+            Ключевые аргументы:
+                polygons (iterable): Многоугольники в виде плоских последовательностей
+                    (x1, y1, x2, y2, ...) или массивов формы (k, 2).
+
+        """
+        arrays = [np.asarray(polygon, dtype=float).reshape(-1, 2) for polygon in polygons]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([len(array) for array in arrays], out=offsets[1:])
+        vertices = np.concatenate(arrays) if arrays else np.empty((0, 2))
+        return cls(vertices, offsets)
+
+    @classmethod
+    def from_triangles(cls, triangles):
+        """
+            Упаковывает треугольники формы (N, 6) как многоугольники из трех вершин.
+
+        """
+        triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+        return cls(triangles.reshape(-1, 2), np.arange(len(triangles) + 1) * 3)
+
+    def polygon(self, index):
+        """
+            Возвращает вершины одного многоугольника формы (k, 2).
+
+        """
+        return self.vertices[self.offsets[index]:self.offsets[index + 1]]
+
+    def coords(self):
+        """
+            Возвращает плоские списки координат (x1, y1, x2, y2, ...) для холста.
+
+        """
+        flat = self.vertices.reshape(-1).tolist()
+        bounds = (self.offsets * 2).tolist()
+        return [flat[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    def transform(self, matrices):
+        """
+            Применяет к каждому многоугольнику свою матрицу преобразования.
+
+            Ключевые аргументы:
+                matrices (array_like): Матрицы формы (N, 3, 3), по одной на многоугольник,
+                    или одна матрица (3, 3) для всех.
+
+            Возвращаемое значение:
+                PolygonBuffer: Новый буфер с преобразованными вершинами и теми же смещениями.
+
+            Описание:
+                Матрицы раздаются вершинам по owners, и все вершины буфера преобразуются одним
+                пакетным умножением матриц (V, 2, 2) @ (V, 2, 1) с последующим переносом.
+
+        """
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.ndim == 2:
+            vertices = self.vertices @ matrices[:2, :2].T + matrices[:2, 2]
+        else:
+            per_vertex = matrices[self.owners]
+            vertices = np.matmul(per_vertex[:, :2, :2], self.vertices[:, :, np.newaxis])[:, :, 0] + per_vertex[:, :2, 2]
+        return PolygonBuffer(vertices, self.offsets, self.owners)
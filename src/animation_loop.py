@@ -0,0 +1,607 @@
+from time import perf_counter
+
+import numpy as np
+
+try:
+    from rotation_engine import rotate_vertices
+    from frame_scheduler import FrameScheduler
+    from spatial_index import UniformGrid
+    from scene import Scene
+    from orbit_store import OrbitStore
+    from polygon_store import PolygonStore
+    from visibility import VisibilityFilter
+except ImportError:
+    from src.rotation_engine import rotate_vertices
+    from src.frame_scheduler import FrameScheduler
+    from src.spatial_index import UniformGrid
+    from src.scene import Scene
+    from src.orbit_store import OrbitStore
+    from src.polygon_store import PolygonStore
+    from src.visibility import VisibilityFilter
+
+
+class AnimationLoop:
+    """
+       Класс единого цикла анимации, который управляет всеми запущенными вращениями.
+
+       Ключевые атрибуты:
+           canvas (tk.Canvas): Холст, таймер которого используется для планирования кадров.
+           draw_shape (function): Функция отрисовки фигуры draw_shape(key, coords).
+           remove_shape (function): Функция удаления фигуры remove_shape(key).
+           scheduler (FrameScheduler): Планировщик кадров цикла.
+           shapes (Scene): Исходные вершины, центры и угловые скорости всех зарегистрированных фигур.
+           keys (list): Ключи фигур в порядке их столбцов в shapes.
+           slots (dict): Номер столбца фигуры в shapes по ее ключу.
+           base_angles (numpy.ndarray): Углы, накопленные до последнего запуска или паузы.
+           resumed_at (numpy.ndarray): Время последнего запуска; NaN, если вращение на паузе.
+           incremental (numpy.ndarray): True, если кадр строится поворотом предыдущего кадра на speed * dt.
+           current (numpy.ndarray): Координаты вершин формы (capacity, 6), отрисованные на последнем кадре.
+           after_id: Идентификатор единственного ожидающего таймера canvas.after или None.
+           spatial_index (UniformGrid): Пространственный индекс текущих положений фигур.
+           frame_hooks (list): Функции hook(compute_time, draw_time, lateness, shape_count), вызываемые
+               после каждого кадра. Пока список пуст, время этапов кадра не измеряется.
+           start_hooks (list): Функции hook(keys, records), вызываемые при каждом запуске вращения
+               треугольников методами start и start_scene; records - входные записи (x1, y1, ..., y3,
+               center_x, center_y, speed) формы (len(keys), 9).
+           replays (dict): Готовые траектории (frames, dt) фигур, вершины которых не рассчитываются.
+           orbit_store (OrbitStore): Таблицы одного цикла периодических вращений (max_orbit_frames -
+               наибольший период в кадрах, orbit_budget - наибольший общий размер таблиц в байтах).
+           polygons (PolygonStore): Вращения многоугольников с произвольным числом вершин.
+           visibility (VisibilityFilter): Отбор видимых изменений по viewport и min_pixel_change.
+           submitted (numpy.ndarray): Координаты вершин формы (capacity, 6), последними отправленные на холст.
+           drawn_shapes, skipped_shapes (int): Сколько раз фигуры были перерисованы и пропущены за все кадры.
+           last_drawn, last_skipped (int): То же для последнего кадра.
+
+       Методы:
+
+           start(self, key, triangle, center, angular_speed, incremental=False):
+               Регистрирует вращение фигуры или заменяет уже зарегистрированное.
+
+           start_scene(self, keys, scene, incremental=False):
+               Регистрирует вращение всех треугольников сцены одной операцией.
+
+           start_polygon(self, key, vertices, center, angular_speed):
+               Регистрирует вращение многоугольника с произвольным числом вершин.
+
+           stop(self, key):
+               Удаляет вращение из реестра и фигуру с холста.
+
+           stop_many(self, keys):
+               Удаляет несколько вращений за один проход по реестру.
+
+           stop_all(self):
+               Останавливает все вращения.
+
+           pause(self, key):
+               Приостанавливает вращение, сохраняя текущий угол.
+
+           resume(self, key):
+               Продолжает приостановленное вращение.
+
+           update_many(self, keys, centers=None, speeds=None):
+               Меняет центры и угловые скорости вращения фигур без скачка их положения.
+
+           shape(self, key):
+               Возвращает представление Triangle исходной фигуры по ключу.
+
+           replay(self, key, frames, dt):
+               Подменяет расчет вершин фигуры чтением заранее рассчитанных кадров.
+
+           frame(self):
+               Рисует один кадр для всех активных вращений и планирует следующий.
+
+           pick(self, x, y):
+               Возвращает ключ верхней фигуры под точкой (x, y).
+
+       Описание:
+           Реестр хранится структурой массивов: N фигур - это буфер Scene и несколько массивов
+           состояния, а не N объектов Python. Параметр dtype=numpy.float32 вдвое уменьшает память
+           под вершины очень больших сцен; время и углы всегда хранятся в float64.
+
+           Периодические вращения берут вершины из таблиц одного цикла orbit_store по номеру кадра
+           без синусов и косинусов (см. модуль orbit_store).
+
+           Многоугольники хранятся отдельно от треугольников в PolygonStore и поворачиваются одним
+           пакетным умножением на матрицы affine.rotation (см. модуль polygon_store). Треугольники
+           намеренно не переведены на этот путь и рассчитываются rotate_vertices прямо из буфера
+           Scene: он не строит матриц 3x3 и не раздает их вершинам, поэтому для треугольников
+           быстрее, а его результат побитово совпадает с rotation_engine.rotate_triangles, на
+           котором основаны trajectory_cli и кэш траекторий. PolygonBuffer.from_triangles позволяет
+           обработать треугольники тем же конвейером вне цикла анимации.
+
+           Если задан viewport или min_pixel_change, на холст отправляются только видимые изменения
+           (см. модуль visibility).
+
+    """
+
+    def __init__(self, canvas, draw_shape, remove_shape, target_fps=50, scheduler=None, spatial_index=None,
+                 dtype=np.float64, max_orbit_frames=18000, orbit_budget=64 * 1024 * 1024, viewport=None,
+                 min_pixel_change=0.0):
+        self.canvas = canvas
+        self.draw_shape = draw_shape
+        self.remove_shape = remove_shape
+        self.scheduler = scheduler if scheduler is not None else FrameScheduler(target_fps)
+        self.spatial_index = spatial_index if spatial_index is not None else UniformGrid()
+        self.shapes = Scene(dtype=dtype)
+        self.keys = []
+        self.slots = {}
+        self.base_angles = np.zeros(self.shapes.capacity)
+        self.resumed_at = np.full(self.shapes.capacity, np.nan)
+        self.incremental = np.zeros(self.shapes.capacity, dtype=bool)
+        self.current = np.zeros((self.shapes.capacity, 6))
+        self.submitted = np.zeros((self.shapes.capacity, 6))
+        self.visibility = VisibilityFilter(viewport, min_pixel_change)
+        self.drawn_shapes = 0
+        self.skipped_shapes = 0
+        self.last_drawn = 0
+        self.last_skipped = 0
+        self.after_id = None
+        self.index_keys = []
+        self.index_dirty = True
+        self.frame_hooks = []
+        self.start_hooks = []
+        self.replays = {}
+        self.orbit_store = OrbitStore(max_orbit_frames, orbit_budget)
+        self.polygons = PolygonStore()
+
+    def __len__(self):
+        return len(self.keys) + len(self.polygons)
+
+    def __contains__(self, key):
+        return key in self.slots or key in self.polygons
+
+    def start(self, key, triangle, center, angular_speed, incremental=False):
+        """
+            Регистрирует вращение фигуры или заменяет уже зарегистрированное.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры.
+                triangle (tuple): Исходные координаты вершин треугольника.
+                center (tuple): Координаты центра вращения.
+                angular_speed (float): Угловая скорость в градусах в секунду.
+                incremental (bool): Строить кадр поворотом предыдущего кадра, а не исходных вершин.
+
+            Описание:
+                Фигура сразу рисуется в исходном положении. Если таймер цикла еще не запущен,
+                он запускается; повторный запуск с тем же ключом лишь заменяет запись реестра
+                и не создает новой цепочки canvas.after.
+
+        """
+        if self.start_hooks:
+            records = np.concatenate((np.ravel(triangle), np.ravel(center), np.ravel(angular_speed)))
+            for hook in self.start_hooks:
+                hook([key], records.astype(float).reshape(1, 9))
+        self.replays.pop(key, None)
+        self.polygons.drop(key)
+        index = self.slots.get(key)
+        if index is None:
+            index = self.shapes.append(triangle, center, angular_speed)
+            self.keys.append(key)
+            self.slots[key] = index
+            self._reserve()
+        else:
+            shape = self.shapes[index]
+            shape.vertices = triangle
+            shape.center = center
+            shape.speed = angular_speed
+        self.orbit_store.drop(key)
+        self._reset(slice(index, index + 1), incremental)
+        if not incremental:
+            self._plan_orbits(np.array([index]))
+        self.draw_shape(key, self.current[index].tolist())
+        self.index_dirty = True
+        self.orbit_store.dirty = True
+        self._wake()
+
+    def start_scene(self, keys, scene, incremental=False, draw=True):
+        """
+            Регистрирует вращение всех треугольников сцены одной операцией.
+
+            Ключевые атрибуты:
+                keys (sequence): Ключи фигур, по одному на треугольник сцены.
+                scene (Scene): Треугольники, центры и скорости.
+                incremental (bool): Строить кадр поворотом предыдущего кадра, а не исходных вершин.
+                draw (bool): Сразу нарисовать фигуры в исходном положении; False - нарисовать их
+                    только на следующем кадре цикла, чтобы не перерисовывать дважды.
+
+            Описание:
+                Буфер сцены копируется в реестр целиком, без создания объекта на треугольник.
+                Фигуры, уже зарегистрированные под теми же ключами, заменяются.
+
+        """
+        keys = list(keys)
+        if len(keys) != len(scene):
+            raise ValueError("Количество ключей не совпадает с количеством треугольников сцены")
+        if self.start_hooks:
+            records = scene.to_records()
+            for hook in self.start_hooks:
+                hook(keys, records)
+        replaced = [self.slots[key] for key in keys if key in self.slots]
+        for key in keys:
+            self.replays.pop(key, None)
+            self.orbit_store.drop(key)
+            self.polygons.drop(key)
+        if replaced:
+            self._discard(replaced)
+        indices = self.shapes.extend(scene)
+        self.keys.extend(keys)
+        self.slots.update(zip(keys, indices))
+        self._reserve()
+        self._reset(slice(indices.start, indices.stop), incremental)
+        if not incremental:
+            self._plan_orbits(np.arange(indices.start, indices.stop))
+        if draw:
+            for key, coords in zip(keys, self.current[indices.start:indices.stop].tolist()):
+                self.draw_shape(key, coords)
+        else:
+            self.submitted[indices.start:indices.stop] = np.nan
+        self.index_dirty = True
+        self.orbit_store.dirty = True
+        self._wake()
+
+    def start_polygon(self, key, vertices, center, angular_speed):
+        """
+            Регистрирует вращение многоугольника с произвольным числом вершин.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры.
+                vertices (sequence): Вершины (x1, y1, x2, y2, ...) или массив формы (k, 2).
+                center (tuple): Координаты центра вращения.
+                angular_speed (float): Угловая скорость в градусах в секунду.
+
+            Описание:
+                Треугольник, зарегистрированный под тем же ключом, заменяется многоугольником,
+                а элемент холста переиспользуется функцией draw_shape.
+
+        """
+        vertices = self.polygons.start(key, vertices, center, angular_speed, self.scheduler.clock())
+        if key in self.slots:
+            self._discard([self.slots[key]])
+            self.replays.pop(key, None)
+            self.orbit_store.drop(key)
+            self.index_dirty = True
+            self.orbit_store.dirty = True
+        self.draw_shape(key, vertices.reshape(-1).tolist())
+        self._wake()
+
+    def stop(self, key):
+        """
+            Удаляет вращение из реестра и фигуру с холста.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры.
+
+        """
+        self.stop_many((key,))
+
+    def stop_many(self, keys):
+        """
+            Удаляет несколько вращений за один проход по реестру.
+
+            Ключевые атрибуты:
+                keys (iterable): Ключи фигур; незарегистрированные ключи пропускаются.
+
+        """
+        keys = list(keys)
+        for key in keys:
+            if self.polygons.drop(key):
+                self.remove_shape(key)
+        removed = [key for key in keys if key in self.slots]
+        if removed:
+            self._discard([self.slots[key] for key in removed])
+            for key in removed:
+                self.replays.pop(key, None)
+                self.orbit_store.drop(key)
+                self.remove_shape(key)
+            self.index_dirty = True
+            self.orbit_store.dirty = True
+        if not self._has_running():
+            self._cancel()
+
+    def stop_all(self):
+        """
+            Останавливает все вращения.
+
+        """
+        self.stop_many(list(self.keys) + list(self.polygons))
+
+    def pause(self, key):
+        """
+            Приостанавливает вращение, сохраняя текущий угол.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры.
+
+        """
+        if key in self.polygons:
+            self.polygons.pause(key, self.scheduler.clock())
+            if not self._has_running():
+                self._cancel()
+            return
+        index = self.slots.get(key)
+        if index is None or np.isnan(self.resumed_at[index]):
+            return
+        now = self.scheduler.clock()
+        self.base_angles[index] += self.shapes.speeds[index] * (now - self.resumed_at[index])
+        self.resumed_at[index] = np.nan
+        if not self._has_running():
+            self._cancel()
+
+    def resume(self, key):
+        """
+            Продолжает приостановленное вращение.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры.
+
+        """
+        if key in self.polygons:
+            if self.polygons.resume(key, self.scheduler.clock()):
+                self._wake()
+            return
+        index = self.slots.get(key)
+        if index is None or not np.isnan(self.resumed_at[index]):
+            return
+        self.resumed_at[index] = self.scheduler.clock()
+        self._wake()
+
+    def update_many(self, keys, centers=None, speeds=None):
+        """
+            Меняет центры и угловые скорости вращения фигур без скачка их положения.
+
+            Ключевые атрибуты:
+                keys (sequence): Ключи фигур; незарегистрированные ключи пропускаются.
+                centers (sequence): Новые центры по одному на ключ; None или элемент None - не менять центр.
+                speeds (sequence): Новые угловые скорости; None или элемент None - не менять скорость.
+
+            Возвращаемое значение:
+                list: Ключи фигур, которые были изменены.
+
+            Описание:
+                Исходные вершины фигур заменяются их положением в текущий момент, а накопленный угол
+                обнуляется, поэтому новое вращение продолжается с того места, где фигура находится.
+                Все треугольники поворачиваются одним вызовом rotate_vertices, таблицы циклов
+                пересчитываются один раз для всех измененных фигур.
+
+        """
+        centers = [None] * len(keys) if centers is None else list(centers)
+        speeds = [None] * len(keys) if speeds is None else list(speeds)
+        now = self.scheduler.clock()
+        updated = []
+        rows = []
+        for key, center, speed in zip(keys, centers, speeds):
+            if key in self.polygons:
+                self.polygons.rebase(key, now, center, speed)
+                updated.append(key)
+            elif key in self.slots:
+                rows.append((self.slots[key], center, speed))
+                updated.append(key)
+        if rows:
+            self._rebase(rows, now)
+        return updated
+
+    def _rebase(self, rows, now):
+        shapes = self.shapes
+        indices = np.array([index for index, _, _ in rows])
+        running = ~np.isnan(self.resumed_at[indices])
+        elapsed = np.where(running, now - self.resumed_at[indices], 0.0)
+        angles = np.mod(self.base_angles[indices] + shapes.speeds[indices] * elapsed, 360.0)
+        x, y = rotate_vertices(shapes.x[:, indices], shapes.y[:, indices], shapes.center_x[indices],
+                               shapes.center_y[indices], angles)
+        shapes.x[:, indices] = x
+        shapes.y[:, indices] = y
+        for index, center, speed in rows:
+            if center is not None:
+                shapes.data[6:8, index] = center
+            if speed is not None:
+                shapes.data[8, index] = speed
+            key = self.keys[index]
+            self.replays.pop(key, None)
+            self.orbit_store.drop(key)
+        self.base_angles[indices] = 0.0
+        self.resumed_at[indices] = np.where(running, now, np.nan)
+        self.current[indices, 0::2] = x.T
+        self.current[indices, 1::2] = y.T
+        planned = indices[running & ~self.incremental[indices]]
+        if len(planned):
+            self._plan_orbits(np.unique(planned))
+        self.index_dirty = True
+        self.orbit_store.dirty = True
+
+    def shape(self, key):
+        """
+            Возвращает представление Triangle исходной фигуры по ключу.
+
+            Возвращаемое значение:
+                Triangle: Представление столбца реестра или None, если ключ не зарегистрирован.
+
+        """
+        index = self.slots.get(key)
+        return self.shapes[index] if index is not None else None
+
+    def replay(self, key, frames, dt):
+        """
+            Подменяет расчет вершин фигуры чтением заранее рассчитанных кадров.
+
+            Ключевые атрибуты:
+                key (str): Ключ зарегистрированной фигуры.
+                frames (array_like): Кадры формы (K, 6), кадр k - положение в момент k * dt,
+                    например отображенная в память траектория из TrajectoryCache.
+                dt (float): Шаг по времени между кадрами в секундах.
+
+            Описание:
+                На каждом кадре вместо поворота берется ближайший по времени кадр траектории,
+                поэтому синусы и косинусы для фигуры не вычисляются, а страницы отображенного
+                файла подгружаются по мере обращения. После последнего кадра траектории фигура
+                снова рассчитывается поворотом. Повторный start или stop отменяет воспроизведение.
+
+        """
+        if key in self.slots:
+            self.replays[key] = (frames, dt)
+
+    def frame(self):
+        """
+            Рисует один кадр для всех активных вращений и планирует следующий.
+
+            Описание:
+                Углы всех активных вращений вычисляются над массивами реестра, и новые вершины
+                получаются одним вызовом rotate_vertices прямо из буфера Scene. Фигуры с готовой
+                траекторией (replay) или таблицей цикла (orbits) берут вершины из нее по номеру
+                кадра, а приостановленные не пересчитываются. Все многоугольники поворачиваются
+                одним вызовом PolygonBuffer.transform. Фигуры без видимых изменений не
+                отправляются на холст (см. viewport и min_pixel_change).
+                После отрисовки таймер перезапускается, только если есть активные вращения.
+                Если заданы frame_hooks, отдельно измеряется время расчета и отрисовки кадра.
+
+        """
+        self.after_id = None
+        self.scheduler.tick()
+        now = self.scheduler.last_time
+        hooks = self.frame_hooks
+        if hooks:
+            compute_start = perf_counter()
+        count = len(self.keys)
+        running_mask = ~np.isnan(self.resumed_at[:count])
+        compute_mask = self._replay_frames(running_mask, now) if self.replays else running_mask
+        if self.orbit_store.tables:
+            compute_mask = self.orbit_store.apply(self.keys, compute_mask, now, self.current, self.shapes.speeds,
+                                                  self.base_angles, self.resumed_at, self.scheduler.frame_interval)
+        self._compute(self._selection(compute_mask), now)
+        running = self._selection(running_mask)
+        indices = range(count)[running] if isinstance(running, slice) else running.tolist()
+        shape_count = len(indices)
+        if indices:
+            self.index_dirty = True
+        visibility = self.visibility if self.visibility.enabled else None
+        if visibility is not None and indices:
+            running = np.arange(count)[running] if isinstance(running, slice) else running
+            running = running[visibility.triangle_changes(self.current[running], self.submitted[running])]
+            self.submitted[running] = self.current[running]
+            indices = running.tolist()
+        polygons, polygon_count = self.polygons.frame(now, visibility) if len(self.polygons) else ((), 0)
+        shape_count += polygon_count
+        if hooks:
+            draw_start = perf_counter()
+        keys = self.keys
+        for index, coords in zip(indices, self.current[running].tolist()):
+            self.draw_shape(keys[index], coords)
+        for key, coords in polygons:
+            self.draw_shape(key, coords)
+        self.last_drawn = len(indices) + len(polygons)
+        self.last_skipped = shape_count - self.last_drawn
+        self.drawn_shapes += self.last_drawn
+        self.skipped_shapes += self.last_skipped
+        if hooks:
+            draw_end = perf_counter()
+            for hook in hooks:
+                hook(draw_start - compute_start, draw_end - draw_start, self.scheduler.lateness, shape_count)
+        self._schedule()
+
+    def _selection(self, mask):
+        indices = np.flatnonzero(mask)
+        return slice(0, len(mask)) if len(indices) == len(mask) else indices
+
+    def _compute(self, running, now):
+        shapes = self.shapes
+        speeds = shapes.speeds[running]
+        if not len(speeds):
+            return
+        angles = np.mod(self.base_angles[running] + speeds * (now - self.resumed_at[running]), 360.0)
+        x, y = rotate_vertices(shapes.x[:, running], shapes.y[:, running], shapes.center_x[running],
+                               shapes.center_y[running], angles)
+        self.current[running, 0::2] = x.T
+        self.current[running, 1::2] = y.T
+        incremental = self.incremental[running]
+        if incremental.any():
+            indices = np.arange(len(shapes))[running][incremental]
+            shapes.x[:, indices] = x[:, incremental]
+            shapes.y[:, indices] = y[:, incremental]
+            self.base_angles[indices] = 0.0
+            self.resumed_at[indices] = now
+
+    def _replay_frames(self, running_mask, now):
+        compute_mask = running_mask.copy()
+        for key, (frames, dt) in self.replays.items():
+            index = self.slots[key]
+            if not running_mask[index]:
+                continue
+            speed = float(self.shapes.speeds[index])
+            elapsed = now - self.resumed_at[index] + (self.base_angles[index] / speed if speed else 0.0)
+            frame_number = int(round(elapsed / dt))
+            if frame_number < len(frames):
+                self.current[index] = frames[frame_number]
+                compute_mask[index] = False
+        return compute_mask
+
+    def pick(self, x, y):
+        """
+            Возвращает ключ верхней фигуры под точкой (x, y).
+
+            Ключевые атрибуты:
+                x, y (float): Координаты точки на холсте.
+
+            Возвращаемое значение:
+                Ключ фигуры или None, если точка не попала ни в одну фигуру.
+
+            Описание:
+                Пространственный индекс перестраивается по положениям последнего кадра только
+                тогда, когда после предыдущего запроса кадр или реестр изменились. Точная проверка
+                векторным произведением выполняется лишь для фигур из ячейки точки.
+
+        """
+        if self.index_dirty:
+            self.index_keys = list(self.keys)
+            self.spatial_index.build(self.current[:len(self.keys)])
+            self.index_dirty = False
+        index = self.spatial_index.query(x, y)
+        return self.index_keys[index] if index >= 0 else None
+
+    def _plan_orbits(self, indices):
+        self.orbit_store.plan(self.keys, indices, self.current, self.shapes.centers, self.shapes.speeds,
+                              self.scheduler.frame_interval)
+
+    def _has_running(self):
+        if self.polygons.has_running():
+            return True
+        return not np.isnan(self.resumed_at[:len(self.keys)]).all()
+
+    def _reserve(self):
+        capacity = self.shapes.capacity
+        if len(self.base_angles) < capacity:
+            size = len(self.base_angles)
+            self.base_angles = np.concatenate((self.base_angles, np.zeros(capacity - size)))
+            self.resumed_at = np.concatenate((self.resumed_at, np.full(capacity - size, np.nan)))
+            self.incremental = np.concatenate((self.incremental, np.zeros(capacity - size, dtype=bool)))
+            self.current = np.concatenate((self.current, np.zeros((capacity - size, 6))))
+            self.submitted = np.concatenate((self.submitted, np.zeros((capacity - size, 6))))
+
+    def _reset(self, indices, incremental):
+        self.base_angles[indices] = 0.0
+        self.resumed_at[indices] = self.scheduler.clock()
+        self.incremental[indices] = incremental
+        self.current[indices, 0::2] = self.shapes.data[0:3, indices].T
+        self.current[indices, 1::2] = self.shapes.data[3:6, indices].T
+        self.submitted[indices] = self.current[indices]
+
+    def _discard(self, indices):
+        count = len(self.keys)
+        keep = self.shapes.remove(indices)
+        kept = len(self.shapes)
+        for array in (self.base_angles, self.resumed_at, self.incremental, self.current, self.submitted):
+            array[:kept] = array[:count][keep]
+        self.keys = [key for key, kept_key in zip(self.keys, keep.tolist()) if kept_key]
+        self.slots = {key: index for index, key in enumerate(self.keys)}
+
+    def _wake(self):
+        if self.after_id is None:
+            self.scheduler.start()
+        self._schedule()
+
+    def _schedule(self):
+        if self.after_id is None and self._has_running():
+            self.after_id = self.canvas.after(self.scheduler.delay_ms(), self.frame)
+
+    def _cancel(self):
+        if self.after_id is not None:
+            self.canvas.after_cancel(self.after_id)
+            self.after_id = None
@@ -0,0 +1,271 @@
+import numpy as np
+
+"""
+    Описание:
+        Обнаружение пересечений вращающихся треугольников в два этапа.
+
+        Широкая фаза: каждый треугольник при вращении вокруг своего центра не выходит из круга
+        с центром вращения и радиусом, равным расстоянию до самой дальней вершины. Круги
+        раскладываются по равномерной сетке, и кандидатами становятся только пары, круги которых
+        пересекаются. Пока центры вращения и исходные вершины не меняются, круги постоянны, поэтому
+        пары-кандидаты рассчитываются один раз, а не на каждом кадре.
+
+        Узкая фаза: для пар-кандидатов выполняется точная векторная проверка теоремой о
+        разделяющей оси по шести нормалям сторон обоих треугольников. Касание считается
+        пересечением, как и у ControllerModule.point_in_triangle_cross_product.
+
+"""
+
+EMPTY_PAIRS = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+
+def rotation_radii(triangles, centers):
+    """
+        Возвращает радиусы кругов, которые треугольники заметают при вращении вокруг центров.
+
+        Ключевые аргументы:
+            triangles (array_like): Координаты вершин треугольников формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+
+        Возвращаемое значение:
+            numpy.ndarray: Расстояния от центров до самых дальних вершин формы (N,).
+
+    """
+    triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+    centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+    dx = triangles[:, 0::2] - centers[:, 0:1]
+    dy = triangles[:, 1::2] - centers[:, 1:2]
+    squared = dx * dx + dy * dy
+    return np.sqrt(np.maximum(np.maximum(squared[:, 0], squared[:, 1]), squared[:, 2]))
+
+
+def circle_pairs(centers, radii, cell_size=None):
+    """
+        Находит все пары пересекающихся кругов через равномерную сетку.
+
+        Ключевые аргументы:
+            centers (array_like): Центры кругов формы (N, 2).
+            radii (array_like): Радиусы кругов формы (N,).
+            cell_size (float): Размер ячейки; по умолчанию - удвоенный медианный радиус.
+
+        Возвращаемое значение:
+            tuple: Массивы индексов (first, second), first < second, упорядоченные по first и second.
+
+        Описание:
+            Каждый круг заносится во все ячейки, которые покрывает его ограничивающий квадрат,
+            пары строятся внутри ячеек векторно, а повторы одной пары в нескольких ячейках
+            отбрасываются: пара остается только в ячейке левого верхнего угла пересечения
+            ограничивающих квадратов. Стоимость пропорциональна количеству фигур и пар в
+            общих ячейках, а не N^2.
+
+    """
+    centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+    radii = np.asarray(radii, dtype=float).reshape(-1)
+    if len(radii) < 2:
+        return EMPTY_PAIRS
+    if cell_size is None:
+        cell_size = max(2.0 * float(np.median(radii)), float(radii.max()) / 4.0)
+    cell_size = max(float(cell_size), 1e-9)
+    x0 = centers[:, 0] - radii
+    y0 = centers[:, 1] - radii
+    origin_x = x0.min()
+    origin_y = y0.min()
+    cx0 = np.floor((x0 - origin_x) / cell_size).astype(np.int64)
+    cy0 = np.floor((y0 - origin_y) / cell_size).astype(np.int64)
+    cx1 = np.floor((centers[:, 0] + radii - origin_x) / cell_size).astype(np.int64)
+    cy1 = np.floor((centers[:, 1] + radii - origin_y) / cell_size).astype(np.int64)
+    columns = int(cx1.max()) + 1
+    widths = cx1 - cx0 + 1
+    counts = widths * (cy1 - cy0 + 1)
+    owners = np.repeat(np.arange(len(radii)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    keys = (cy0[owners] + local // widths[owners]) * columns + cx0[owners] + local % widths[owners]
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    items = owners[order]
+    group_starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(keys)])
+    group_ends = np.repeat(group_starts + group_sizes, group_sizes)
+    positions = np.arange(len(keys))
+    pair_counts = group_ends - positions - 1
+    first = np.repeat(positions, pair_counts)
+    second = np.arange(pair_counts.sum()) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts) + first + 1
+    cells = keys[first]
+    first = items[first]
+    second = items[second]
+    reference = (np.maximum(cy0[first], cy0[second]) * columns + np.maximum(cx0[first], cx0[second]))
+    dx = centers[first, 0] - centers[second, 0]
+    dy = centers[first, 1] - centers[second, 1]
+    reach = radii[first] + radii[second]
+    keep = (reference == cells) & (dx * dx + dy * dy <= reach * reach)
+    first, second = np.minimum(first[keep], second[keep]), np.maximum(first[keep], second[keep])
+    order = np.lexsort((second, first))
+    return first[order], second[order]
+
+
+def _projection_range(vertices, normal_x, normal_y):
+    first = vertices[0] * normal_x + vertices[1] * normal_y
+    second = vertices[2] * normal_x + vertices[3] * normal_y
+    third = vertices[4] * normal_x + vertices[5] * normal_y
+    return np.minimum(np.minimum(first, second), third), np.maximum(np.maximum(first, second), third)
+
+
+def triangles_intersect(first, second, chunk_size=65536):
+    """
+        Проверяет попарное пересечение треугольников теоремой о разделяющей оси.
+
+        Ключевые аргументы:
+            first, second (array_like): Координаты вершин треугольников пар формы (M, 6).
+            chunk_size (int): Количество пар, обрабатываемых за один шаг.
+
+        Возвращаемое значение:
+            numpy.ndarray: Булева маска формы (M,), True - треугольники пересекаются или касаются.
+
+        Описание:
+            Выпуклые треугольники не пересекаются тогда и только тогда, когда проекции их вершин
+            хотя бы на одну нормаль стороны не перекрываются. Проверяются шесть нормалей; пары
+            обрабатываются столбцами координат, чтобы все операции шли по непрерывным массивам.
+
+    """
+    first = np.asarray(first, dtype=float).reshape(-1, 6)
+    second = np.asarray(second, dtype=float).reshape(-1, 6)
+    result = np.empty(len(first), dtype=bool)
+    for start in range(0, len(first), chunk_size):
+        a = np.ascontiguousarray(first[start:start + chunk_size].T)
+        b = np.ascontiguousarray(second[start:start + chunk_size].T)
+        separated = np.zeros(a.shape[1], dtype=bool)
+        for xs, ys in ((a[0::2], a[1::2]), (b[0::2], b[1::2])):
+            for edge in range(3):
+                normal_x = ys[(edge + 1) % 3] - ys[edge]
+                normal_y = xs[edge] - xs[(edge + 1) % 3]
+                a_min, a_max = _projection_range(a, normal_x, normal_y)
+                b_min, b_max = _projection_range(b, normal_x, normal_y)
+                separated |= (a_max < b_min) | (b_max < a_min)
+        result[start:start + chunk_size] = ~separated
+    return result
+
+
+def colliding_pairs(triangles, centers, cell_size=None):
+    """
+        Находит все пары пересекающихся треугольников.
+
+        Ключевые аргументы:
+            triangles (array_like): Текущие координаты вершин треугольников формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+            cell_size (float): Размер ячейки сетки широкой фазы.
+
+        Возвращаемое значение:
+            tuple: Массивы индексов (first, second), first < second.
+
+    """
+    triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+    first, second = circle_pairs(centers, rotation_radii(triangles, centers), cell_size)
+    hits = triangles_intersect(triangles[first], triangles[second])
+    return first[hits], second[hits]
+
+
+class CollisionDetector:
+    """
+       Класс покадрового обнаружения пересечений фигур цикла анимации.
+
+       Ключевые атрибуты:
+           cell_size (float): Размер ячейки сетки широкой фазы или None для автоматического выбора.
+           candidates (tuple): Пары-кандидаты (first, second) широкой фазы.
+           pairs (tuple): Пары пересекающихся фигур (first, second) последнего кадра.
+           keys (list): Ключи фигур последнего кадра, индексы pairs указывают на них.
+           rebuilds (int): Сколько раз пересчитывалась широкая фаза.
+           collision_hooks (list): Функции hook(key_pairs), вызываемые после кадра, в котором
+               найдены пересечения.
+
+       Методы:
+
+           detect(self, triangles, centers):
+               Находит пары пересекающихся треугольников, переиспользуя широкую фазу.
+
+           attach(self, animation_loop):
+               Подключает обнаружение пересечений к циклу анимации через frame_hooks.
+
+           key_pairs(self):
+               Возвращает пары ключей пересекающихся фигур последнего кадра.
+
+    """
+
+    def __init__(self, cell_size=None, tolerance=1e-9):
+        self.cell_size = cell_size
+        self.tolerance = tolerance
+        self.candidates = EMPTY_PAIRS
+        self.pairs = EMPTY_PAIRS
+        self.keys = []
+        self.rebuilds = 0
+        self.collision_hooks = []
+        self.animation_loop = None
+        self.centers = np.empty((0, 2))
+        self.radii = np.empty(0)
+
+    def detect(self, triangles, centers):
+        """
+            Находит пары пересекающихся треугольников, переиспользуя широкую фазу.
+
+            Ключевые атрибуты:
+                triangles (array_like): Текущие координаты вершин треугольников формы (N, 6).
+                centers (array_like): Центры вращения формы (N, 2).
+
+            Возвращаемое значение:
+                tuple: Массивы индексов (first, second), first < second.
+
+            Описание:
+                Сохраненные пары-кандидаты остаются верными, пока центры не изменились и ни один
+                треугольник не вышел за свой круг, поэтому широкая фаза пересчитывается только при
+                смене состава фигур, центров или вершин. Иначе на кадре выполняется лишь узкая фаза.
+
+        """
+        triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        radii = rotation_radii(triangles, centers)
+        if len(centers) != len(self.centers) or not np.array_equal(centers, self.centers) or (radii > self.radii).any():
+            self.centers = centers.copy()
+            self.radii = radii * (1.0 + self.tolerance) + self.tolerance
+            self.candidates = circle_pairs(self.centers, self.radii, self.cell_size)
+            self.rebuilds += 1
+        first, second = self.candidates
+        hits = triangles_intersect(triangles[first], triangles[second])
+        self.pairs = (first[hits], second[hits])
+        return self.pairs
+
+    def attach(self, animation_loop):
+        """
+            Подключает обнаружение пересечений к циклу анимации через frame_hooks.
+
+        """
+        self.animation_loop = animation_loop
+        animation_loop.frame_hooks.append(self.on_frame)
+
+    def detach(self):
+        """
+            Отключает обнаружение пересечений от цикла анимации.
+
+        """
+        if self.animation_loop is not None and self.on_frame in self.animation_loop.frame_hooks:
+            self.animation_loop.frame_hooks.remove(self.on_frame)
+        self.animation_loop = None
+
+    def on_frame(self, compute_time, draw_time, lateness, shape_count):
+        loop = self.animation_loop
+        self.keys = loop.keys
+        count = len(loop.keys)
+        self.detect(loop.current[:count], loop.shapes.centers)
+        if self.collision_hooks and len(self.pairs[0]):
+            key_pairs = self.key_pairs()
+            for hook in self.collision_hooks:
+                hook(key_pairs)
+
+    def key_pairs(self):
+        """
+            Возвращает пары ключей пересекающихся фигур последнего кадра.
+
+            Возвращаемое значение:
+                list: Кортежи (key_a, key_b).
+
+        """
+        keys = self.keys
+        return [(keys[first], keys[second]) for first, second in zip(*(array.tolist() for array in self.pairs))]
@@ -0,0 +1,154 @@
+import json
+import socket
+
+"""
+    Описание:
+        Клиент сервера управления вращениями control_server для других процессов. Использует
+        только стандартную библиотеку и блокирующий сокет, поэтому не требует asyncio, NumPy
+        или Tk. Метод request_many отправляет пакет команд одной записью в сокет, не дожидаясь
+        ответов на каждую (конвейерная обработка).
+
+"""
+
+
+class ControlClient:
+    """
+       Класс клиента сервера управления вращениями.
+
+       Ключевые атрибуты:
+           address (tuple или str): (host, port) для TCP или путь к Unix-сокету.
+           socket (socket.socket): Соединение с сервером.
+
+       Методы:
+
+           request(self, command, **fields):
+               Отправляет команду и возвращает ответ сервера.
+
+           request_many(self, requests):
+               Отправляет пакет команд одной записью и возвращает ответы в том же порядке.
+
+           start(self, jobs):
+               Запускает вращения треугольников.
+
+           update(self, key, center=None, speed=None):
+               Меняет центр и/или угловую скорость вращения фигуры.
+
+           stop(self, keys):
+               Останавливает вращения.
+
+           query(self, keys=None):
+               Возвращает текущие координаты вершин треугольников.
+
+           close(self):
+               Закрывает соединение.
+
+    """
+
+    def __init__(self, address, timeout=10.0):
+        self.address = address
+        if isinstance(address, str):
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(address)
+        else:
+            self.socket = socket.create_connection(address, timeout)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.socket.makefile('rb')
+        self.next_id = 0
+
+    def request(self, command, **fields):
+        """
+            Отправляет команду и возвращает ответ сервера.
+
+            Возвращаемое значение:
+                dict: Ответ сервера; если сервер отклонил команду, выбрасывается ValueError.
+
+        """
+        return self.request_many([dict(fields, command=command)])[0]
+
+    def request_many(self, requests):
+        """
+            Отправляет пакет команд одной записью и возвращает ответы в том же порядке.
+
+            Ключевые аргументы:
+                requests (list): Команды в виде словарей с полем command.
+
+            Возвращаемое значение:
+                list: Ответы сервера.
+
+            Описание:
+                Если сервер отклонил хотя бы одну команду, после чтения всех ответов выбрасывается
+                ValueError; если сервер закрыл соединение - ConnectionError.
+
+        """
+        lines = []
+        for request in requests:
+            self.next_id += 1
+            lines.append(json.dumps(dict(request, id=self.next_id)))
+        self.socket.sendall(('\n'.join(lines) + '\n').encode())
+        replies = []
+        for _ in requests:
+            line = self.reader.readline()
+            if not line:
+                raise ConnectionError("Сервер управления закрыл соединение")
+            replies.append(json.loads(line))
+        for reply in replies:
+            if not reply.get('ok'):
+                raise ValueError(reply.get('error', 'Команда отклонена сервером'))
+        return replies
+
+    def start(self, jobs):
+        """
+            Запускает вращения треугольников.
+
+            Ключевые аргументы:
+                jobs (iterable): Кортежи (key, triangle, center, speed).
+
+        """
+        jobs = [{'key': key, 'triangle': list(triangle), 'center': list(center), 'speed': speed}
+                for key, triangle, center, speed in jobs]
+        return self.request('start', jobs=jobs)
+
+    def update(self, key, center=None, speed=None):
+        """
+            Меняет центр и/или угловую скорость вращения фигуры.
+
+        """
+        item = {'key': key}
+        if center is not None:
+            item['center'] = list(center)
+        if speed is not None:
+            item['speed'] = speed
+        return self.request('update', updates=[item])
+
+    def stop(self, keys):
+        """
+            Останавливает вращения.
+
+        """
+        return self.request('stop', keys=list(keys))
+
+    def query(self, keys=None):
+        """
+            Возвращает текущие координаты вершин треугольников.
+
+            Возвращаемое значение:
+                dict: Списки (x1, y1, x2, y2, x3, y3) по ключу; None для незарегистрированного ключа.
+
+        """
+        fields = {} if keys is None else {'keys': list(keys)}
+        return self.request('query', **fields)['positions']
+
+    def close(self):
+        """
+            Закрывает соединение.
+
+        """
+        self.reader.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,427 @@
+import asyncio
+import json
+import os
+import threading
+from collections import deque
+from tkinter import READABLE
+
+try:
+    from scene import Scene
+except ImportError:
+    from src.scene import Scene
+
+"""
+    Описание:
+        Локальный сервер управления вращениями для других процессов. Сервер asyncio работает в
+        отдельном потоке и принимает через Unix-сокет или TCP на localhost команды в формате
+        JSON lines: по одному объекту JSON в строке, ответ - тоже одна строка JSON.
+
+        Команды:
+            {"command": "start", "jobs": [{"key": "a", "triangle": [x1, y1, x2, y2, x3, y3],
+                                           "center": [x, y], "speed": s}, ...]}
+            {"command": "update", "updates": [{"key": "a", "center": [x, y], "speed": s}, ...]}
+            {"command": "stop", "keys": ["a", ...]}
+            {"command": "query", "keys": ["a", ...]}  - без keys возвращаются все треугольники
+            {"command": "ping"}
+        Необязательное поле "id" возвращается в ответе без изменений. Ответы на команды одного
+        соединения приходят в порядке команд.
+
+        Поток asyncio никогда не обращается к Tk: команды складываются в очередь, а о том, что
+        очередь перестала быть пустой, поток asyncio сообщает байтом в канал os.pipe. Поток Tk
+        следит за каналом через tk.createfilehandler и, проснувшись, сам ставит таймер
+        canvas.after, который разбирает очередь через кадр после прихода первой команды, поэтому
+        простаивающий сервер не будит поток Tk. Там, где createfilehandler недоступен (Windows),
+        поток Tk опрашивает очередь таймером раз в кадр.
+
+        Все команды, пришедшие за кадр, объединяются: запуски превращаются в один вызов
+        AnimationLoop.start_scene, изменения скоростей и центров - в один вызов update_many (для
+        каждой фигуры остается последнее изменение), а новые фигуры рисуются следующим кадром
+        цикла анимации, поэтому поток команд любой плотности стоит одной перерисовки за кадр.
+
+"""
+
+MAX_LINE = 64 * 1024 * 1024
+
+
+def parse_address(address):
+    """
+        Разбирает адрес сервера управления из строки.
+
+        Ключевые аргументы:
+            address (str): 'host:port' или 'port' для TCP, иначе путь к Unix-сокету.
+
+        Возвращаемое значение:
+            tuple или str: (host, port) для TCP или путь к Unix-сокету.
+
+    """
+    host, separator, port = address.rpartition(':')
+    if port.isdigit() and os.sep not in host:
+        return (host or '127.0.0.1', int(port))
+    return address
+
+
+def _floats(values, count, name):
+    values = [float(value) for value in values]
+    if len(values) != count:
+        raise ValueError(f"Поле {name} должно содержать {count} чисел")
+    return values
+
+
+def _optional_center(item):
+    center = item.get('center')
+    return None if center is None else _floats(center, 2, 'center')
+
+
+def _optional_speed(item):
+    speed = item.get('speed')
+    return None if speed is None else float(speed)
+
+
+def positions(animation_loop, keys=None):
+    """
+        Возвращает координаты вершин треугольников, отрисованные на последнем кадре.
+
+        Ключевые аргументы:
+            animation_loop (AnimationLoop): Цикл анимации.
+            keys (sequence): Ключи фигур или None для всех треугольников цикла.
+
+        Возвращаемое значение:
+            dict: Списки (x1, y1, x2, y2, x3, y3) по ключу; для незарегистрированного ключа - None.
+
+    """
+    keys = list(animation_loop.keys) if keys is None else [str(key) for key in keys]
+    slots = animation_loop.slots
+    found = [key for key in keys if key in slots]
+    rows = animation_loop.current[[slots[key] for key in found]].tolist()
+    result = dict.fromkeys(keys)
+    result.update(zip(found, rows))
+    return result
+
+
+def apply_commands(animation_loop, requests):
+    """
+        Применяет к циклу анимации команды, накопленные за один кадр.
+
+        Ключевые аргументы:
+            animation_loop (AnimationLoop): Цикл анимации.
+            requests (list): Разобранные команды (словари) в порядке поступления.
+
+        Возвращаемое значение:
+            list: Ответы (словари) в том же порядке.
+
+        Описание:
+            Команды разбираются и проверяются по порядку, но изменения копятся: остановки,
+            запуски и изменения применяются в конце тремя пакетными вызовами, и только после
+            того, как разобраны все команды и построена сцена запусков. Запуск ключа отменяет накопленные для
+            него изменения, остановка - накопленные запуск и изменения, а изменение ключа, запуск
+            которого еще не применен, вносится прямо в задание запуска. Запросы положений
+            отвечают состоянием после применения всех команд кадра. Ошибочная команда не меняет
+            состояние и получает ответ {"ok": false, "error": ...}.
+
+    """
+    starts = {}
+    stops = []
+    updates = {}
+    queries = []
+    replies = [None] * len(requests)
+    for position, request in enumerate(requests):
+        try:
+            command = request.get('command')
+            if command == 'start':
+                jobs = [(str(job['key']), _floats(job['triangle'], 6, 'triangle'), _floats(job['center'], 2, 'center'),
+                         float(job['speed'])) for job in request['jobs']]
+                for key, triangle, center, speed in jobs:
+                    starts.pop(key, None)
+                    updates.pop(key, None)
+                    starts[key] = (triangle, center, speed)
+                replies[position] = {'started': len(jobs)}
+            elif command == 'update':
+                items = [(str(item['key']), _optional_center(item), _optional_speed(item)) for item in request['updates']]
+                for key, center, speed in items:
+                    job = starts.get(key)
+                    if job is not None:
+                        starts[key] = (job[0], job[1] if center is None else center, job[2] if speed is None else speed)
+                        continue
+                    previous_center, previous_speed = updates.get(key, (None, None))
+                    updates[key] = (previous_center if center is None else center,
+                                    previous_speed if speed is None else speed)
+                replies[position] = {'updated': len(items)}
+            elif command == 'stop':
+                keys = [str(key) for key in request['keys']]
+                for key in keys:
+                    starts.pop(key, None)
+                    updates.pop(key, None)
+                stops.extend(keys)
+                replies[position] = {'stopped': len(keys)}
+            elif command == 'query':
+                keys = request.get('keys')
+                queries.append((position, None if keys is None else [str(key) for key in keys]))
+            elif command == 'ping':
+                replies[position] = {}
+            else:
+                raise ValueError(f"Неизвестная команда: {command}")
+        except (KeyError, TypeError, ValueError) as e:
+            replies[position] = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    if starts:
+        jobs = list(starts.values())
+        scene = Scene([job[0] for job in jobs], [job[1] for job in jobs], [job[2] for job in jobs])
+    if stops:
+        animation_loop.stop_many(stops)
+    if starts:
+        animation_loop.start_scene(list(starts), scene, draw=False)
+    if updates:
+        changes = list(updates.values())
+        animation_loop.update_many(list(updates), [change[0] for change in changes], [change[1] for change in changes])
+    for position, keys in queries:
+        replies[position] = {'positions': positions(animation_loop, keys)}
+    for request, reply in zip(requests, replies):
+        reply.setdefault('ok', True)
+        if 'id' in request:
+            reply['id'] = request['id']
+    return replies
+
+
+class ControlServer:
+    """
+       Класс локального сервера управления вращениями на asyncio.
+
+       Ключевые атрибуты:
+           drawing_module (DrawingModule): Модуль рисования, циклом анимации которого управляет сервер.
+           address (tuple или str): (host, port) для TCP или путь к Unix-сокету. После запуска для
+               порта 0 содержит выбранный системой порт.
+           poll_interval_ms (int): Задержка разбора очереди команд в потоке Tk, по умолчанию - один кадр.
+           pending (collections.deque): Очередь пар (команда, future ответа) от потока asyncio к потоку Tk.
+           after_id: Идентификатор таймера разбора очереди или None, пока очередь пуста; меняется
+               только в потоке Tk.
+           signalled (bool): Поток asyncio уже сообщил в канал о новых командах, и поток Tk их еще
+               не разобрал; меняется под блокировкой lock.
+           commands (int): Количество примененных команд.
+           batches (int): Количество кадров, в которых применялись команды.
+
+       Методы:
+
+           start(self):
+               Запускает сервер в отдельном потоке и подписывает поток Tk на сигналы о командах.
+
+           poll(self):
+               Разбирает очередь команд и ставит таймер Tk снова, только если пришли новые команды.
+
+           process_commands(self):
+               Применяет все накопленные команды одним пакетом.
+
+           stop(self):
+               Останавливает сервер и закрывает соединения.
+
+    """
+
+    def __init__(self, drawing_module, address=('127.0.0.1', 0), poll_interval_ms=None):
+        self.drawing_module = drawing_module
+        self.canvas = drawing_module.canvas
+        self.address = address
+        self.poll_interval_ms = poll_interval_ms or max(1, round(1000 / drawing_module.target_fps))
+        self.pending = deque()
+        self.commands = 0
+        self.batches = 0
+        self.loop = None
+        self.thread = None
+        self.after_id = None
+        self.signalled = False
+        self.lock = threading.Lock()
+        self.wake_fds = None
+        self.error = None
+        self.writers = set()
+
+    def start(self):
+        """
+            Запускает сервер в отдельном потоке и подписывает поток Tk на сигналы о командах.
+
+            Возвращаемое значение:
+                tuple или str: Адрес, на котором сервер принимает соединения.
+
+            Описание:
+                Вызывается в потоке Tk.
+
+        """
+        createfilehandler = getattr(self.canvas.tk, 'createfilehandler', None)
+        if createfilehandler is not None:
+            self.wake_fds = os.pipe()
+            for fd in self.wake_fds:
+                os.set_blocking(fd, False)
+            createfilehandler(self.wake_fds[0], READABLE, self._on_signal)
+        else:
+            self.after_id = self.canvas.after(self.poll_interval_ms, self.poll)
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(ready,), name='control-server', daemon=True)
+        self.thread.start()
+        ready.wait()
+        if self.error is not None:
+            self.thread.join()
+            self.thread = None
+            self.stop()
+            raise self.error
+        return self.address
+
+    def poll(self):
+        """
+            Разбирает очередь команд в потоке Tk.
+
+            Описание:
+                Флаг signalled сбрасывается до разбора очереди, поэтому команда, пришедшая во
+                время разбора, снова сигнализирует в канал и не теряется. Без канала таймер
+                перезапускается на каждом кадре.
+
+        """
+        self.after_id = None
+        with self.lock:
+            self.signalled = False
+        self.process_commands()
+        if self.wake_fds is None:
+            self.after_id = self.canvas.after(self.poll_interval_ms, self.poll)
+
+    def process_commands(self):
+        """
+            Применяет все накопленные команды одним пакетом.
+
+            Возвращаемое значение:
+                int: Количество примененных команд.
+
+            Описание:
+                Вызывается в потоке Tk. Ответы передаются в поток asyncio одним вызовом
+                call_soon_threadsafe на весь пакет.
+
+        """
+        batch = []
+        pending = self.pending
+        while pending:
+            batch.append(pending.popleft())
+        if not batch:
+            return 0
+        requests = [request for request, _ in batch]
+        try:
+            replies = apply_commands(self.drawing_module.animation_loop, requests)
+        except Exception as e:
+            replies = [{'ok': False, 'error': f"{type(e).__name__}: {e}"} for _ in batch]
+        self.loop.call_soon_threadsafe(self._resolve, [future for _, future in batch], replies)
+        self.commands += len(batch)
+        self.batches += 1
+        return len(batch)
+
+    def stop(self):
+        """
+            Останавливает сервер и закрывает соединения.
+
+        """
+        if self.thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.thread = None
+        if self.wake_fds is not None:
+            self.canvas.tk.deletefilehandler(self.wake_fds[0])
+            for fd in self.wake_fds:
+                os.close(fd)
+            self.wake_fds = None
+        if self.after_id is not None:
+            self.canvas.after_cancel(self.after_id)
+            self.after_id = None
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.remove(self.address)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def _resolve(futures, replies):
+        for future, reply in zip(futures, replies):
+            if not future.done():
+                future.set_result(reply)
+
+    def _run(self, ready):
+        loop = self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            if isinstance(self.address, str):
+                server = loop.run_until_complete(asyncio.start_unix_server(self._serve, path=self.address, limit=MAX_LINE))
+            else:
+                server = loop.run_until_complete(asyncio.start_server(self._serve, *self.address, limit=MAX_LINE))
+                self.address = tuple(server.sockets[0].getsockname()[:2])
+        except OSError as e:
+            self.error = e
+            loop.close()
+            ready.set()
+            return
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            server.close()
+            for writer in list(self.writers):
+                writer.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+
+    async def _serve(self, reader, writer):
+        self.writers.add(writer)
+        replies = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send(writer, replies))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                future = self.loop.create_future()
+                replies.put_nowait(future)
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("команда должна быть объектом JSON")
+                except ValueError as e:
+                    future.set_result({'ok': False, 'error': f"Некорректная команда: {e}"})
+                    continue
+                self._enqueue(request, future)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            replies.put_nowait(None)
+            await sender
+            self.writers.discard(writer)
+            writer.close()
+
+    def _enqueue(self, request, future):
+        with self.lock:
+            self.pending.append((request, future))
+            signal = self.wake_fds is not None and not self.signalled
+            self.signalled = True
+        if signal:
+            try:
+                os.write(self.wake_fds[1], b'\0')
+            except BlockingIOError:
+                pass
+
+    def _on_signal(self, fd, mask):
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        if self.after_id is None:
+            self.after_id = self.canvas.after(self.poll_interval_ms, self.poll)
+
+    @staticmethod
+    async def _send(writer, replies):
+        while True:
+            future = await replies.get()
+            if future is None:
+                return
+            writer.write(json.dumps(await future).encode() + b'\n')
+            if replies.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    return
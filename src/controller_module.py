@@ -20,6 +20,36 @@ class ControllerModule:
            start_rotation(self):
                Начинает вращение треугольника.
 
+           stop_rotation(self):
+               Останавливает вращение треугольника.
+
+           open_scene(self):
+               Загружает сцену из файла, выбранного пользователем, и запускает ее вращение.
+
+           load_scene(self, path):
+               Загружает сцену из файла и передает ее модулю рисования.
+
+           open_bulk_input(self):
+               Открывает окно пакетного ввода треугольников списком.
+
+           paste_triangles(self, event=None):
+               Запускает вращение треугольников, записи которых скопированы в буфер обмена.
+
+           load_bulk_text(self, text):
+               Разбирает блок записей треугольников и запускает их вращение.
+
+           toggle_overlay(self, event=None):
+               Показывает или скрывает наложение производительности (клавиша F3).
+
+           dump_frame_stats(self, event=None):
+               Сохраняет статистику кадров в файл frame_stats.csv (клавиша F4).
+
+           toggle_recording(self, event=None):
+               Начинает или завершает запись сеанса в файл session.trsl (клавиша F5).
+
+           replay_session(self, event=None):
+               Воспроизводит записанный сеанс из session.trsl в 4 раза быстрее (клавиша F6).
+
     """
 
     def __init__(self, input_module, drawing_module, tkinter_module):
@@ -28,6 +58,15 @@ class ControllerModule:
         self.input_module.error_label = self.input_module.error_label
         self.input_module.get_input_values=self.input_module.get_input_values
         self.tkinter_module = tkinter_module
+        tkinter_module.create_button("Остановить вращение", self.stop_rotation, row=11)
+        tkinter_module.add_menu_command("Сцена", "Открыть...", self.open_scene)
+        tkinter_module.add_menu_command("Сцена", "Ввести списком...", self.open_bulk_input)
+        tkinter_module.add_menu_command("Сцена", "Вставить из буфера обмена", self.paste_triangles)
+        tkinter_module.bind_key('<Control-Shift-V>', self.paste_triangles)
+        tkinter_module.bind_key('<F3>', self.toggle_overlay)
+        tkinter_module.bind_key('<F4>', self.dump_frame_stats)
+        tkinter_module.bind_key('<F5>', self.toggle_recording)
+        tkinter_module.bind_key('<F6>', self.replay_session)
         self.tkinter_module.create_button = tkinter_module.create_button("Начать вращение",self.start_rotation)
 
     def point_in_triangle_cross_product(self, x1, y1, x2, y2, x3, y3, x, y):
@@ -90,3 +129,143 @@ class ControllerModule:
         self.input_module.error_label.config(text="")
         triangle = (x1, y1, x2, y2, x3, y3)
         self.drawing_module.rotate_triangle(triangle, (center_x, center_y), speed)
+
+    def stop_rotation(self):
+        """
+         Останавливает вращение треугольника.
+
+         Описание:
+            Данный метод вызывается при нажатии кнопки "Остановить вращение". Он удаляет треугольник
+            из реестра единого цикла анимации, поэтому ожидающий таймер отменяется.
+
+        """
+        self.drawing_module.stop_rotation()
+
+    def open_scene(self):
+        """
+         Загружает сцену из файла, выбранного пользователем, и запускает ее вращение.
+
+         Описание:
+            Вызывается из меню "Сцена -> Открыть...". Пользователь выбирает файл сцены в формате
+            CSV, JSON lines или двоичном формате .trsc (см. модуль scene).
+
+        """
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(title="Открыть сцену", filetypes=[
+            ("Сцена", "*.csv *.txt *.jsonl *.trsc"), ("Все файлы", "*.*")])
+        if path:
+            self.load_scene(path)
+
+    def load_scene(self, path):
+        """
+         Загружает сцену из файла и передает ее модулю рисования.
+
+         Ключевые аргументы:
+            path (str): Путь к файлу сцены.
+
+         Описание:
+            Файл читается потоково блоками, которые сразу передаются в DrawingModule.load_scene.
+            При ошибке чтения текст ошибки выводится в error_label.
+
+        """
+        try:
+            from scene import iter_scene_chunks
+        except ImportError:
+            from src.scene import iter_scene_chunks
+        try:
+            self.drawing_module.load_scene(iter_scene_chunks(path))
+        except (OSError, ValueError) as e:
+            self.input_module.error_label.config(text=f"Ошибка загрузки сцены: {e}")
+            return
+        self.input_module.error_label.config(text="")
+
+    def open_bulk_input(self):
+        """
+         Открывает окно пакетного ввода треугольников списком.
+
+         Описание:
+            Вызывается из меню "Сцена -> Ввести списком...". В окно можно ввести или вставить
+            строки по 9 чисел x1, y1, x2, y2, x3, y3, center_x, center_y, speed; окно закрывается,
+            если все строки корректны.
+
+        """
+        self.tkinter_module.open_text_dialog("Ввод треугольников списком", "Начать вращение", self.load_bulk_text)
+
+    def paste_triangles(self, event=None):
+        """
+         Запускает вращение треугольников, записи которых скопированы в буфер обмена.
+
+         Описание:
+            Вызывается из меню "Сцена -> Вставить из буфера обмена" и по Ctrl+Shift+V.
+
+        """
+        self.load_bulk_text(self.tkinter_module.get_clipboard())
+
+    def load_bulk_text(self, text):
+        """
+         Разбирает блок записей треугольников и запускает их вращение.
+
+         Ключевые аргументы:
+            text (str): Строки по 9 чисел в формате записи сцены.
+
+         Возвращаемое значение:
+            bool: True, если все строки корректны и треугольники переданы модулю рисования.
+
+         Описание:
+            Если хотя бы одна строка некорректна, сцена не меняется, а номера всех некорректных
+            строк выводятся в error_label одним сообщением.
+
+        """
+        try:
+            from scene import Scene
+        except ImportError:
+            from src.scene import Scene
+        records, errors = self.input_module.parse_bulk_input(text)
+        if not errors and not len(records):
+            errors = [(1, "нет записей треугольников")]
+        self.input_module.report_bulk_errors(errors)
+        if errors:
+            return False
+        self.drawing_module.load_scene(Scene.from_records(records))
+        return True
+
+    def toggle_overlay(self, event=None):
+        """
+         Показывает или скрывает наложение производительности (клавиша F3).
+
+        """
+        self.drawing_module.toggle_overlay()
+
+    def dump_frame_stats(self, event=None):
+        """
+         Сохраняет статистику кадров в файл frame_stats.csv (клавиша F4).
+
+        """
+        try:
+            self.drawing_module.dump_frame_stats("frame_stats.csv")
+        except OSError as e:
+            self.input_module.error_label.config(text=f"Ошибка сохранения статистики: {e}")
+
+    def toggle_recording(self, event=None):
+        """
+         Начинает или завершает запись сеанса в файл session.trsl (клавиша F5).
+
+        """
+        try:
+            if self.drawing_module.recorder is None:
+                self.drawing_module.start_recording("session.trsl")
+            else:
+                self.drawing_module.stop_recording()
+        except OSError as e:
+            self.input_module.error_label.config(text=f"Ошибка записи сеанса: {e}")
+
+    def replay_session(self, event=None):
+        """
+         Воспроизводит записанный сеанс из session.trsl в 4 раза быстрее (клавиша F6).
+
+        """
+        self.drawing_module.stop_recording()
+        try:
+            self.drawing_module.replay_session("session.trsl", speed=4.0)
+        except (OSError, ValueError) as e:
+            self.input_module.error_label.config(text=f"Ошибка воспроизведения сеанса: {e}")
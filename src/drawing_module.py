@@ -1,22 +1,122 @@
-import math
+VIEWPORT = (0, 0, 750, 600)
+
+
 class DrawingModule:
     """
        Класс для рисования и вращения треугольника на холсте.
 
        Ключевые атрибуты:
            canvas (tk.Canvas): Виджет холста, на котором будет производиться рисование и вращение треугольника.
-           triangle (tuple): Кортеж, содержащий координаты вершин текущего треугольника.
+           triangle (tuple): Кортеж, содержащий исходные координаты вершин текущего треугольника.
+           closed_form (bool): Режим расчета кадров: True - каждый кадр вычисляется поворотом исходных
+               вершин на угол, пройденный за реальное время, False - поворотом координат предыдущего кадра.
+           items (dict): Идентификаторы элементов холста, созданных для каждой фигуры, по ее ключу.
+           scene_keys (list): Ключи фигур загруженной сцены.
+           frame_stats (FrameStats): Кольцевой буфер статистики кадров или None, пока он не включен.
+           overlay (PerformanceOverlay): Наложение производительности или None.
+           dtype: Тип хранения вершин в цикле анимации, например numpy.float32 для очень больших сцен;
+               None - float64 по умолчанию. Задается значением, чтобы не импортировать NumPy при запуске.
+           cache_trajectories (bool): Сохранять траекторию треугольника в дисковый кэш и при повторном запуске
+               с теми же параметрами воспроизводить ее без расчета.
+           cached_frames (int): Количество кадров траектории в кэше; после них кадры снова рассчитываются.
+           trajectory_cache (TrajectoryCache): Дисковый кэш траекторий, создается при первом обращении.
+           viewport (tuple): Видимая область холста (x_min, y_min, x_max, y_max); фигуры целиком за ее
+               пределами не перерисовываются. None отключает отсечение.
+           min_pixel_change (float): Наименьшее смещение вершины в пикселях, при котором фигура
+               перерисовывается на холсте.
+           recorder (SessionRecorder): Запись сеанса в журнал или None, пока запись не включена.
+           session_player (SessionPlayer): Воспроизведение журнала сеанса или None.
+           collision_detector (CollisionDetector): Покадровое обнаружение пересечений или None, пока оно не включено.
+           animation_loop (AnimationLoop): Единый цикл анимации, владеющий всеми вращениями на холсте.
+               Создается при первом обращении, чтобы NumPy не загружался при запуске программы.
 
        Методы:
 
            rotate_triangle(self, triangle, center, angular_speed):
                Вращает треугольник вокруг центра вращения с указанной угловой скоростью.
 
+           rotate_polygon(self, vertices, center, angular_speed, key='polygon'):
+               Вращает многоугольник с произвольным числом вершин вокруг центра вращения.
+
+           stop_rotation(self):
+               Останавливает вращение треугольника и убирает его с холста.
+
+           load_scene(self, scenes):
+               Заменяет треугольники сцены на холсте и запускает их вращение.
+
+           enable_instrumentation(self):
+               Подключает к циклу анимации сбор статистики кадров и наложение производительности.
+
+           toggle_overlay(self):
+               Показывает или скрывает наложение с FPS и временем кадра.
+
+           dump_frame_stats(self, path):
+               Сохраняет собранную статистику кадров в файл.
+
+           enable_collision_detection(self):
+               Подключает к циклу анимации покадровое обнаружение пересечений треугольников.
+
+           start_recording(self, path):
+               Начинает запись запусков вращений и положений фигур в журнал сеанса.
+
+           stop_recording(self):
+               Завершает запись журнала сеанса.
+
+           replay_session(self, path, speed=1.0, frame=0):
+               Воспроизводит журнал сеанса на холсте.
+
+           draw_shape(self, key, coords):
+               Создает многоугольник на холсте при первом вызове и обновляет его вершины при последующих.
+
+           remove_shape(self, key):
+               Удаляет многоугольник фигуры с холста.
+
      """
 
-    def __init__(self, canvas):
+    def __init__(self, canvas, closed_form=True, target_fps=50, dtype=None, cache_trajectories=False,
+                 cached_frames=3000, viewport=VIEWPORT, min_pixel_change=0.5):
         self.canvas = canvas
         self.triangle = None
+        self.closed_form = closed_form
+        self.items = {}
+        self.scene_keys = []
+        self.frame_stats = None
+        self.overlay = None
+        self.target_fps = target_fps
+        self.dtype = dtype
+        self.cache_trajectories = cache_trajectories
+        self.cached_frames = cached_frames
+        self.viewport = viewport
+        self.min_pixel_change = min_pixel_change
+        self.recorder = None
+        self.session_player = None
+        self.collision_detector = None
+        self._animation_loop = None
+        self._trajectory_cache = None
+
+    @property
+    def animation_loop(self):
+        if self._animation_loop is None:
+            try:
+                from animation_loop import AnimationLoop
+            except ImportError:
+                from src.animation_loop import AnimationLoop
+            options = {'viewport': self.viewport, 'min_pixel_change': self.min_pixel_change}
+            if self.dtype is not None:
+                options['dtype'] = self.dtype
+            self._animation_loop = AnimationLoop(self.canvas, self.draw_shape, self.remove_shape, self.target_fps,
+                                                 **options)
+        return self._animation_loop
+
+    @property
+    def trajectory_cache(self):
+        if self._trajectory_cache is None:
+            try:
+                from trajectory_cache import TrajectoryCache
+            except ImportError:
+                from src.trajectory_cache import TrajectoryCache
+            self._trajectory_cache = TrajectoryCache()
+        return self._trajectory_cache
 
     def rotate_triangle(self, triangle, center, angular_speed):
         """
@@ -28,24 +128,210 @@ class DrawingModule:
                 angular_speed (float): Угловая скорость вращения в градусах в секунду.
 
             Описание:
-                Этот метод вращает треугольник, заданный координатами его вершин, вокруг указанного
-                центра вращения с заданной угловой скоростью. При каждой итерации метода, треугольник
-                поворачивается на угол, равный `angular_speed`, вокруг точки `center`. Затем, новые
-                координаты вершин треугольника используются для отображения его нового положения на
-                холсте. Метод выполняет рекурсивные вызовы с задержкой 20 миллисекунд для плавного
-                вращения треугольника.
-
-        """
-        x1, y1, x2, y2, x3, y3 = triangle
-        center_x, center_y = center
-        angle = angular_speed
-        radian_angle = math.radians(angle)
-        rotated_x1 = center_x + (x1 - center_x) * math.cos(radian_angle) - (y1 - center_y) * math.sin(radian_angle)
-        rotated_y1 = center_y + (x1 - center_x) * math.sin(radian_angle) + (y1 - center_y) * math.cos(radian_angle)
-        rotated_x2 = center_x + (x2 - center_x) * math.cos(radian_angle) - (y2 - center_y) * math.sin(radian_angle)
-        rotated_y2 = center_y + (x2 - center_x) * math.sin(radian_angle) + (y2 - center_y) * math.cos(radian_angle)
-        rotated_x3 = center_x + (x3 - center_x) * math.cos(radian_angle) - (y3 - center_y) * math.sin(radian_angle)
-        rotated_y3 = center_y + (x3 - center_x) * math.sin(radian_angle) + (y3 - center_y) * math.cos(radian_angle)
-        self.canvas.delete('triangle')
-        self.canvas.create_polygon(rotated_x1, rotated_y1, rotated_x2, rotated_y2, rotated_x3, rotated_y3, tags='triangle', fill='pink')
-        self.canvas.after(20, self.rotate_triangle, (rotated_x1, rotated_y1, rotated_x2, rotated_y2, rotated_x3, rotated_y3), (center_x, center_y), angular_speed)
+                Этот метод регистрирует треугольник под ключом 'triangle' в едином цикле анимации.
+                Повторный вызов заменяет запись реестра, а не запускает еще одну цепочку
+                canvas.after, поэтому на холсте всегда ожидает только один таймер. Цикл измеряет
+                реальное время и на каждом кадре поворачивает исходные вершины на угол
+                angular_speed * elapsed вокруг точки `center` (в режиме closed_form) либо
+                поворачивает предыдущий кадр на angular_speed * dt.
+
+                Если включен cache_trajectories, первые cached_frames кадров с шагом 1 / target_fps
+                берутся из дискового кэша (при промахе они рассчитываются и сохраняются один раз),
+                и цикл воспроизводит их без расчета синусов и косинусов. Если кэш недоступен
+                (каталог не создается, диск заполнен, файл поврежден), треугольник вращается
+                без него.
+
+        """
+        self.triangle = tuple(triangle)
+        self.animation_loop.start('triangle', self.triangle, center, angular_speed, incremental=not self.closed_form)
+        if self.cache_trajectories and self.closed_form:
+            dt = 1.0 / self.target_fps
+            try:
+                frames = self.trajectory_cache.load([self.triangle], [center], [angular_speed], dt, self.cached_frames)
+            except (OSError, ValueError):
+                return
+            self.animation_loop.replay('triangle', frames[:, 0], dt)
+
+    def rotate_polygon(self, vertices, center, angular_speed, key='polygon'):
+        """
+            Вращает многоугольник с произвольным числом вершин вокруг центра вращения.
+
+            Ключевые атрибуты:
+                vertices (sequence): Координаты вершин (x1, y1, x2, y2, ...).
+                center (tuple): Кортеж с координатами центра вращения (center_x, center_y).
+                angular_speed (float): Угловая скорость вращения в градусах в секунду.
+                key (str): Ключ фигуры в цикле анимации.
+
+            Описание:
+                Многоугольник регистрируется в едином цикле анимации, где все многоугольники
+                поворачиваются одним пакетным аффинным преобразованием на кадр.
+
+        """
+        self.animation_loop.start_polygon(key, vertices, center, angular_speed)
+
+    def stop_rotation(self):
+        """
+            Останавливает вращение треугольника и убирает его с холста.
+
+        """
+        if self._animation_loop is not None:
+            self._animation_loop.stop('triangle')
+
+    def load_scene(self, scenes):
+        """
+            Заменяет треугольники сцены на холсте и запускает их вращение.
+
+            Ключевые атрибуты:
+                scenes: Сцена Scene или итерируемый набор сцен, например блоки scene.iter_scene_chunks.
+
+            Описание:
+                Фигуры предыдущей сцены удаляются, а каждый треугольник новой сцены регистрируется
+                в едином цикле анимации под ключом 'scene<номер>' со своим центром и скоростью.
+                Блоки сцены обрабатываются по мере чтения файла, и каждый блок копируется в реестр
+                цикла целиком, без объекта Python на треугольник.
+
+        """
+        self.animation_loop.stop_many(self.scene_keys)
+        self.scene_keys = []
+        if hasattr(scenes, 'triangles'):
+            scenes = (scenes,)
+        for scene in scenes:
+            keys = [f'scene{index}' for index in range(len(self.scene_keys), len(self.scene_keys) + len(scene))]
+            self.animation_loop.start_scene(keys, scene)
+            self.scene_keys.extend(keys)
+
+    def enable_instrumentation(self):
+        """
+            Подключает к циклу анимации сбор статистики кадров и наложение производительности.
+
+            Описание:
+                До первого вызова цикл анимации не измеряет время этапов кадра, поэтому без
+                инструментирования накладные расходы отсутствуют.
+
+        """
+        if self.frame_stats is not None:
+            return
+        try:
+            from frame_stats import FrameStats, PerformanceOverlay
+        except ImportError:
+            from src.frame_stats import FrameStats, PerformanceOverlay
+        self.frame_stats = FrameStats()
+        self.overlay = PerformanceOverlay(self.canvas, self.frame_stats)
+        self.animation_loop.frame_hooks.extend((self.frame_stats.record, self.overlay.on_frame))
+
+    def toggle_overlay(self):
+        """
+            Показывает или скрывает наложение с FPS и временем кадра.
+
+        """
+        self.enable_instrumentation()
+        self.overlay.toggle()
+
+    def dump_frame_stats(self, path):
+        """
+            Сохраняет собранную статистику кадров в файл.
+
+            Ключевые атрибуты:
+                path (str): Путь к файлу CSV или .npy.
+
+        """
+        self.enable_instrumentation()
+        self.frame_stats.dump(path)
+
+    def enable_collision_detection(self):
+        """
+            Подключает к циклу анимации покадровое обнаружение пересечений треугольников.
+
+            Возвращаемое значение:
+                CollisionDetector: Детектор; пары пересекающихся фигур последнего кадра возвращает
+                    его метод key_pairs, а функции из collision_hooks вызываются на кадрах с пересечениями.
+
+        """
+        if self.collision_detector is None:
+            try:
+                from collision import CollisionDetector
+            except ImportError:
+                from src.collision import CollisionDetector
+            self.collision_detector = CollisionDetector()
+            self.collision_detector.attach(self.animation_loop)
+        return self.collision_detector
+
+    def start_recording(self, path):
+        """
+            Начинает запись запусков вращений и положений фигур в журнал сеанса.
+
+            Ключевые атрибуты:
+                path (str): Путь к файлу журнала; существующий файл перезаписывается.
+
+        """
+        try:
+            from session_log import SessionRecorder
+        except ImportError:
+            from src.session_log import SessionRecorder
+        self.stop_recording()
+        self.recorder = SessionRecorder(path)
+        self.recorder.attach(self.animation_loop)
+
+    def stop_recording(self):
+        """
+            Завершает запись журнала сеанса.
+
+        """
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def replay_session(self, path, speed=1.0, frame=0):
+        """
+            Воспроизводит журнал сеанса на холсте.
+
+            Ключевые атрибуты:
+                path (str): Путь к файлу журнала.
+                speed (float): Множитель скорости воспроизведения; больше 1 - быстрее записи.
+                frame (int): Номер кадра, с которого начинается воспроизведение.
+
+            Описание:
+                Фигуры журнала рисуются под ключами 'replay<номер>' отдельным таймером, не
+                затрагивая вращения цикла анимации.
+
+        """
+        try:
+            from session_log import SessionLog, SessionPlayer
+        except ImportError:
+            from src.session_log import SessionLog, SessionPlayer
+        if self.session_player is not None:
+            self.session_player.stop()
+        self.session_player = SessionPlayer(self.canvas, self.draw_shape, self.remove_shape, SessionLog(path), speed)
+        self.session_player.start(frame)
+
+    def draw_shape(self, key, coords):
+        """
+            Создает многоугольник на холсте при первом вызове и обновляет его вершины при последующих.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры, он же тег элемента холста.
+                coords (sequence): Координаты вершин многоугольника (x1, y1, x2, y2, ...).
+
+            Описание:
+                Элемент холста создается один раз, после чего его вершины меняются на месте через
+                canvas.coords по сохраненному идентификатору. Так на каждом кадре не выделяется
+                новый элемент Tk и не выполняется поиск по тегу.
+
+        """
+        item = self.items.get(key)
+        if item is None:
+            self.items[key] = self.canvas.create_polygon(*coords, tags=key, fill='pink')
+        else:
+            self.canvas.coords(item, *coords)
+
+    def remove_shape(self, key):
+        """
+            Удаляет многоугольник фигуры с холста.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры.
+
+        """
+        item = self.items.pop(key, None)
+        if item is not None:
+            self.canvas.delete(item)
@@ -0,0 +1,127 @@
+import math
+import statistics
+import time
+from collections import deque
+
+
+class FrameScheduler:
+    """
+       Класс для планирования кадров анимации по реальному времени.
+
+       Ключевые атрибуты:
+           target_fps (float): Целевая частота кадров.
+           frame_interval (float): Длительность одного кадра в секундах.
+           clock (function): Источник времени в секундах, по умолчанию time.perf_counter.
+           start_time (float): Время начала анимации.
+           frame_count (int): Количество отрисованных кадров.
+           dropped_frames (int): Количество пропущенных кадров.
+           intervals (deque): Последние измеренные интервалы между кадрами в секундах.
+           deadline (float): Запланированное время следующего кадра или None.
+           lateness (float): Опоздание последнего кадра относительно запланированного времени в секундах.
+
+       Методы:
+
+           start(self):
+               Запоминает время начала анимации и сбрасывает статистику.
+
+           elapsed(self):
+               Возвращает время в секундах, прошедшее с начала анимации.
+
+           tick(self):
+               Отмечает начало нового кадра и возвращает время, прошедшее с предыдущего кадра.
+
+           delay_ms(self):
+               Возвращает задержку в миллисекундах до следующего кадра по сетке целевой частоты.
+
+           achieved_fps(self):
+               Возвращает фактическую частоту кадров.
+
+           jitter(self):
+               Возвращает разброс (стандартное отклонение) длительности кадров в секундах.
+
+    """
+
+    def __init__(self, target_fps=50, clock=time.perf_counter, history=120):
+        self.target_fps = target_fps
+        self.frame_interval = 1.0 / target_fps
+        self.clock = clock
+        self.intervals = deque(maxlen=history)
+        self.start()
+
+    def start(self):
+        """
+            Запоминает время начала анимации и сбрасывает статистику.
+
+        """
+        self.start_time = self.clock()
+        self.last_time = self.start_time
+        self.last_slot = 0
+        self.frame_count = 0
+        self.dropped_frames = 0
+        self.deadline = None
+        self.lateness = 0.0
+        self.intervals.clear()
+
+    def elapsed(self):
+        """
+            Возвращает время в секундах, прошедшее с начала анимации.
+
+        """
+        return self.clock() - self.start_time
+
+    def tick(self):
+        """
+            Отмечает начало нового кадра и возвращает время, прошедшее с предыдущего кадра.
+
+            Возвращаемое значение:
+                float: Время dt в секундах с предыдущего кадра.
+
+            Описание:
+                Кадры привязаны к сетке start_time + n * frame_interval. Если таймер сработал
+                с опозданием больше чем на кадр, пропущенные слоты сетки не догоняются, а
+                учитываются в dropped_frames: анимация сразу рисует текущее положение.
+
+        """
+        now = self.clock()
+        self.lateness = now - self.deadline if self.deadline is not None else 0.0
+        dt = now - self.last_time
+        self.last_time = now
+        if self.frame_count:
+            self.intervals.append(dt)
+        self.frame_count += 1
+        slot = math.floor((now - self.start_time) / self.frame_interval)
+        self.dropped_frames += max(0, slot - self.last_slot - 1)
+        self.last_slot = max(slot, self.last_slot)
+        return dt
+
+    def delay_ms(self):
+        """
+            Возвращает задержку в миллисекундах до следующего кадра по сетке целевой частоты.
+
+            Возвращаемое значение:
+                int: Задержка для canvas.after, не меньше 1 мс.
+
+        """
+        self.deadline = self.start_time + (self.last_slot + 1) * self.frame_interval
+        return max(1, round((self.deadline - self.clock()) * 1000))
+
+    def achieved_fps(self):
+        """
+            Возвращает фактическую частоту кадров по последним измеренным интервалам.
+
+            Возвращаемое значение:
+                float: Частота кадров или 0.0, если интервалов еще нет.
+
+        """
+        total = sum(self.intervals)
+        return len(self.intervals) / total if total > 0 else 0.0
+
+    def jitter(self):
+        """
+            Возвращает разброс (стандартное отклонение) длительности кадров в секундах.
+
+            Возвращаемое значение:
+                float: Стандартное отклонение интервалов между кадрами или 0.0.
+
+        """
+        return statistics.pstdev(self.intervals) if len(self.intervals) > 1 else 0.0
@@ -0,0 +1,191 @@
+from time import perf_counter
+
+import numpy as np
+
+"""
+    Описание:
+        Инструментирование кадров анимации. FrameStats подключается к циклу анимации как
+        функция из AnimationLoop.frame_hooks и записывает время расчета, время обновления
+        холста, опоздание планировщика и количество фигур каждого кадра в кольцевой буфер
+        фиксированного размера. PerformanceOverlay показывает FPS и перцентили времени кадра
+        прямо на холсте.
+
+"""
+
+FRAME_RECORD = np.dtype([('timestamp', 'f8'), ('compute_time', 'f8'), ('draw_time', 'f8'),
+                         ('lateness', 'f8'), ('shape_count', 'i8')])
+
+
+class FrameStats:
+    """
+       Класс кольцевого буфера статистики кадров.
+
+       Ключевые атрибуты:
+           capacity (int): Максимальное количество хранимых кадров.
+           records (numpy.ndarray): Структурированный массив записей FRAME_RECORD.
+           count (int): Общее количество записанных кадров.
+           clock (function): Источник времени для отметок кадров.
+
+       Методы:
+
+           record(self, compute_time, draw_time, lateness, shape_count):
+               Записывает статистику одного кадра, вытесняя самую старую запись.
+
+           snapshot(self):
+               Возвращает записи буфера в хронологическом порядке.
+
+           summary(self):
+               Возвращает FPS и перцентили времени кадра по записям буфера.
+
+           dump(self, path):
+               Сохраняет записи буфера в файл CSV или .npy.
+
+           clear(self):
+               Очищает буфер.
+
+    """
+
+    def __init__(self, capacity=1024, clock=perf_counter):
+        self.capacity = capacity
+        self.records = np.zeros(capacity, dtype=FRAME_RECORD)
+        self.count = 0
+        self.clock = clock
+
+    def record(self, compute_time, draw_time, lateness, shape_count):
+        """
+            Записывает статистику одного кадра, вытесняя самую старую запись.
+
+            Ключевые атрибуты:
+                compute_time (float): Время расчета вершин в секундах.
+                draw_time (float): Время обновления холста в секундах.
+                lateness (float): Опоздание кадра относительно планировщика в секундах.
+                shape_count (int): Количество фигур в кадре.
+
+        """
+        self.records[self.count % self.capacity] = (self.clock(), compute_time, draw_time, lateness, shape_count)
+        self.count += 1
+
+    def snapshot(self):
+        """
+            Возвращает записи буфера в хронологическом порядке.
+
+            Возвращаемое значение:
+                numpy.ndarray: Копия записей FRAME_RECORD.
+
+        """
+        if self.count <= self.capacity:
+            return self.records[:self.count].copy()
+        start = self.count % self.capacity
+        return np.concatenate((self.records[start:], self.records[:start]))
+
+    def summary(self):
+        """
+            Возвращает FPS и перцентили времени кадра по записям буфера.
+
+            Возвращаемое значение:
+                dict: Ключи fps, p50 и p99 (время кадра в секундах, расчет плюс отрисовка).
+
+        """
+        records = self.snapshot()
+        if len(records) == 0:
+            return {'fps': 0.0, 'p50': 0.0, 'p99': 0.0}
+        frame_times = records['compute_time'] + records['draw_time']
+        duration = records['timestamp'][-1] - records['timestamp'][0]
+        p50, p99 = np.percentile(frame_times, (50, 99))
+        return {'fps': (len(records) - 1) / duration if duration > 0 else 0.0, 'p50': float(p50), 'p99': float(p99)}
+
+    def dump(self, path):
+        """
+            Сохраняет записи буфера в файл CSV или .npy.
+
+            Ключевые атрибуты:
+                path (str): Путь к файлу; для расширения .npy сохраняется структурированный массив,
+                    иначе - CSV с заголовком.
+
+        """
+        records = self.snapshot()
+        if path.lower().endswith('.npy'):
+            np.save(path, records)
+            return
+        np.savetxt(path, records, delimiter=',', header=','.join(FRAME_RECORD.names), comments='',
+                   fmt=['%.6f', '%.9f', '%.9f', '%.9f', '%d'])
+
+    def clear(self):
+        """
+            Очищает буфер.
+
+        """
+        self.count = 0
+
+
+class PerformanceOverlay:
+    """
+       Класс наложения с показателями производительности на холсте.
+
+       Ключевые атрибуты:
+           canvas (tk.Canvas): Холст, на котором выводится текст.
+           stats (FrameStats): Источник статистики кадров.
+           refresh_interval (float): Минимальный интервал обновления текста в секундах.
+           visible (bool): Показывается ли наложение.
+           item: Идентификатор текстового элемента холста или None.
+
+       Методы:
+
+           toggle(self):
+               Показывает или скрывает наложение.
+
+           on_frame(self, compute_time, draw_time, lateness, shape_count):
+               Обновляет текст наложения не чаще refresh_interval.
+
+    """
+
+    def __init__(self, canvas, stats, refresh_interval=0.5, clock=perf_counter):
+        self.canvas = canvas
+        self.stats = stats
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self.visible = False
+        self.item = None
+        self.last_refresh = None
+
+    def toggle(self):
+        """
+            Показывает или скрывает наложение.
+
+        """
+        self.visible = not self.visible
+        if self.visible:
+            self.last_refresh = self.clock()
+            self.refresh()
+        elif self.item is not None:
+            self.canvas.delete(self.item)
+            self.item = None
+
+    def on_frame(self, compute_time, draw_time, lateness, shape_count):
+        """
+            Обновляет текст наложения не чаще refresh_interval.
+
+            Описание:
+                Функция подключается к AnimationLoop.frame_hooks. Пока наложение скрыто, она
+                ничего не делает, а текст на холсте меняется не на каждом кадре, а раз в
+                refresh_interval, чтобы само наложение не нагружало Tk.
+
+        """
+        if not self.visible:
+            return
+        now = self.clock()
+        if self.last_refresh is None or now - self.last_refresh >= self.refresh_interval:
+            self.last_refresh = now
+            self.refresh()
+
+    def refresh(self):
+        """
+            Перерисовывает текст наложения по текущей статистике.
+
+        """
+        summary = self.stats.summary()
+        text = f"FPS: {summary['fps']:.1f}  p50: {summary['p50'] * 1000:.2f} мс  p99: {summary['p99'] * 1000:.2f} мс"
+        if self.item is None:
+            self.item = self.canvas.create_text(10, 10, anchor='nw', text=text, fill='black')
+        else:
+            self.canvas.itemconfigure(self.item, text=text)
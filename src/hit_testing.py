@@ -0,0 +1,123 @@
+import numpy as np
+
+"""
+    Описание:
+        Векторизованная проверка принадлежности точек треугольникам. Функции повторяют
+        семантику ControllerModule.point_in_triangle_cross_product (точки на сторонах
+        считаются принадлежащими треугольнику), но проверяют M точек против N треугольников
+        за один проход с broadcasting NumPy.
+
+"""
+
+
+def point_in_triangle(x1, y1, x2, y2, x3, y3, x, y):
+    """
+        Проверяет принадлежность одной точки одному треугольнику без NumPy.
+
+        Ключевые аргументы:
+            x1, y1, x2, y2, x3, y3: Координаты вершин треугольника.
+            x, y: Координаты точки.
+
+        Возвращаемое значение:
+            bool: True, если точка лежит в треугольнике или на его стороне.
+
+        Описание:
+            Скалярный вариант для проверки нескольких кандидатов, где накладные расходы
+            на создание массивов NumPy больше самой проверки.
+
+    """
+    cross_product1 = (x - x1) * (y2 - y1) - (y - y1) * (x2 - x1)
+    cross_product2 = (x - x2) * (y3 - y2) - (y - y2) * (x3 - x2)
+    cross_product3 = (x - x3) * (y1 - y3) - (y - y3) * (x1 - x3)
+    return ((cross_product1 >= 0 and cross_product2 >= 0 and cross_product3 >= 0) or
+            (cross_product1 <= 0 and cross_product2 <= 0 and cross_product3 <= 0))
+
+
+def points_in_triangles(points, triangles, chunk_size=4096):
+    """
+        Проверяет принадлежность каждой точки каждому треугольнику.
+
+        Ключевые аргументы:
+            points (array_like): Координаты точек формы (M, 2).
+            triangles (array_like): Координаты вершин треугольников формы (N, 6).
+            chunk_size (int): Количество точек, обрабатываемых за один шаг, ограничивает
+                размер промежуточных массивов.
+
+        Возвращаемое значение:
+            numpy.ndarray: Булева маска формы (M, N), True - точка лежит в треугольнике
+            или на его стороне.
+
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+    x1, y1, x2, y2, x3, y3 = triangles.T
+    mask = np.empty((len(points), len(triangles)), dtype=bool)
+    for start in range(0, len(points), chunk_size):
+        mask[start:start + chunk_size] = _contains(points[start:start + chunk_size, 0:1],
+                                                   points[start:start + chunk_size, 1:2], x1, y1, x2, y2, x3, y3)
+    return mask
+
+
+def points_in_own_triangles(points, triangles):
+    """
+        Проверяет принадлежность каждой точки треугольнику с тем же индексом.
+
+        Ключевые аргументы:
+            points (array_like): Координаты точек формы (N, 2).
+            triangles (array_like): Координаты вершин треугольников формы (N, 6).
+
+        Возвращаемое значение:
+            numpy.ndarray: Булева маска формы (N,), True - i-я точка лежит в i-м треугольнике
+            или на его стороне.
+
+    """
+    x, y = np.asarray(points, dtype=float).reshape(-1, 2).T
+    return _contains(x, y, *np.asarray(triangles, dtype=float).reshape(-1, 6).T)
+
+
+def _contains(x, y, x1, y1, x2, y2, x3, y3):
+    cross_product1 = (x - x1) * (y2 - y1) - (y - y1) * (x2 - x1)
+    cross_product2 = (x - x2) * (y3 - y2) - (y - y2) * (x3 - x2)
+    cross_product3 = (x - x3) * (y1 - y3) - (y - y3) * (x1 - x3)
+    return (((cross_product1 >= 0) & (cross_product2 >= 0) & (cross_product3 >= 0)) |
+            ((cross_product1 <= 0) & (cross_product2 <= 0) & (cross_product3 <= 0)))
+
+
+def hit_indices(points, triangles, chunk_size=4096):
+    """
+        Возвращает пары индексов (точка, треугольник) для всех попаданий.
+
+        Ключевые аргументы:
+            points (array_like): Координаты точек формы (M, 2).
+            triangles (array_like): Координаты вершин треугольников формы (N, 6).
+            chunk_size (int): Количество точек, обрабатываемых за один шаг.
+
+        Возвращаемое значение:
+            tuple: Два массива индексов (point_indices, triangle_indices) одинаковой длины.
+
+    """
+    return np.nonzero(points_in_triangles(points, triangles, chunk_size))
+
+
+def pick_triangles(points, triangles, chunk_size=4096):
+    """
+        Находит для каждой точки верхний треугольник, в который она попадает.
+
+        Ключевые аргументы:
+            points (array_like): Координаты точек формы (M, 2).
+            triangles (array_like): Координаты вершин треугольников формы (N, 6).
+            chunk_size (int): Количество точек, обрабатываемых за один шаг.
+
+        Возвращаемое значение:
+            numpy.ndarray: Индексы треугольников формы (M,), -1 - точка не попала ни в один.
+
+        Описание:
+            Верхним считается треугольник с наибольшим индексом, так как на холсте он
+            рисуется последним.
+
+    """
+    mask = points_in_triangles(points, triangles, chunk_size)
+    if mask.shape[1] == 0:
+        return np.full(mask.shape[0], -1)
+    last = mask.shape[1] - 1 - np.argmax(mask[:, ::-1], axis=1)
+    return np.where(mask.any(axis=1), last, -1)
@@ -1,24 +1,62 @@
+import re
 import tkinter as tk
 
+NUMBER = r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+NUMBER_PATTERN = re.compile(NUMBER)
+SPACE = r'[^\S\n]'
+RECORD = rf'{SPACE}*{NUMBER}(?:(?:{SPACE}*[,;]{SPACE}*|{SPACE}+){NUMBER}){{8}}{SPACE}*[,;]?{SPACE}*'
+NON_RECORD_LINE = re.compile(rf'^(?!{RECORD}$).*(?:\n|\Z)', re.M)
+SEPARATORS = str.maketrans(',;', '  ')
+MAX_REPORTED_LINES = 10
+
+"""
+    Описание:
+        Числа в полях ввода и в пакетном вводе проверяются одним заранее скомпилированным
+        регулярным выражением: целые и десятичные числа со знаком и экспонентой (1, -2.5, .5, 1e3).
+
+        Пакетный ввод - блок текста (например, вставленный из буфера обмена), в каждой строке
+        которого 9 чисел записи сцены: x1, y1, x2, y2, x3, y3, center_x, center_y, speed через
+        запятую, точку с запятой или пробелы, как в файлах сцен .csv. Пустые строки и строки,
+        начинающиеся с #, пропускаются.
+
+"""
+
 class InputModule:
     """
         Класс для ввода и валидации данных пользователем.
 
         Ключевые атрибуты:
             error_label (tk.Label): Виджет метки для отображения ошибок пользователю.
+            debounce_ms (int): Задержка проверки полей после последнего нажатия клавиши, мс.
+            pending_entries (dict): Поля ввода, изменившиеся с последней отложенной проверки.
 
         Методы:
 
             validate_input(self, event):
                 Валидирует введенные пользователем данные и отображает сообщения об ошибках.
 
+            schedule_validation(self, event):
+                Откладывает проверку поля до паузы в наборе текста.
+
+            validate_pending(self):
+                Проверяет все поля, изменившиеся за время ожидания.
+
+            parse_bulk_input(self, text):
+                Разбирает блок записей сцены и собирает ошибки всех некорректных строк.
+
+            report_bulk_errors(self, errors):
+                Отображает номера некорректных строк пакетного ввода.
+
             get_input_values(self, x1, y1, x2, y2, x3, y3, speed_entry, center_x_entry, center_y_entry):
                 Получает и преобразует введенные данные в числовые значения и возвращает их.
 
      """
 
-    def __init__(self,  error_label):
+    def __init__(self,  error_label, debounce_ms=150):
         self.error_label = error_label
+        self.debounce_ms = debounce_ms
+        self.pending_entries = {}
+        self.after_id = None
 
     def validate_input(self, event):
         """
@@ -33,15 +71,113 @@ class InputModule:
                виджете error_label. В противном случае сообщение об ошибке очищается.
 
         """
-        entry = event.widget
-        input_text = entry.get()
-        if not input_text:
+        self._show_validation([event.widget.get()])
+
+    def schedule_validation(self, event):
+        """
+            Откладывает проверку поля до паузы в наборе текста.
+
+            Ключевые атрибуты:
+                event (tk.Event): Событие отпускания клавиши в поле ввода.
+
+            Описание:
+                Обработчик <KeyRelease> только запоминает поле и перезапускает таймер error_label.after,
+                поэтому при быстром наборе проверка и обновление метки выполняются один раз после
+                паузы в debounce_ms, а не на каждое нажатие, и не отнимают время у кадров анимации.
+
+        """
+        self.pending_entries[event.widget] = None
+        if self.after_id is not None:
+            self.error_label.after_cancel(self.after_id)
+        self.after_id = self.error_label.after(self.debounce_ms, self.validate_pending)
+
+    def validate_pending(self):
+        """
+            Проверяет все поля, изменившиеся за время ожидания.
+
+        """
+        self.after_id = None
+        entries = list(self.pending_entries)
+        self.pending_entries.clear()
+        self._show_validation([entry.get() for entry in entries])
+
+    def _show_validation(self, texts):
+        if all(not text or NUMBER_PATTERN.fullmatch(text) for text in texts):
             self.error_label.config(text="")
-            return
-        if not (input_text.startswith('-') and input_text[1:].isdigit()) and not input_text.isdigit():
-            self.error_label.config(text="Введите числовое значение!")
         else:
+            self.error_label.config(text="Введите числовое значение!")
+
+    def parse_bulk_input(self, text):
+        """
+            Разбирает блок записей сцены и собирает ошибки всех некорректных строк.
+
+            Ключевые атрибуты:
+                text (str): Строки по 9 чисел x1, y1, x2, y2, x3, y3, center_x, center_y, speed.
+
+            Возвращаемое значение:
+                tuple: (records, errors) - массив записей корректных строк формы (N, 9) и список
+                пар (номер строки, текст ошибки) для всех некорректных строк.
+
+            Описание:
+                Весь текст проходится одним скомпилированным выражением NON_RECORD_LINE, которое
+                находит только строки, не являющиеся записью (пустые, комментарии и ошибочные),
+                поэтому работа на Python пропорциональна их числу, а не числу строк. Числа всех
+                остальных строк преобразуются одним вызовом numpy.array, а принадлежность центров
+                вращения треугольникам проверяется векторно функцией
+                hit_testing.points_in_own_triangles. NumPy импортируется при первом пакетном
+                вводе, чтобы не замедлять запуск программы.
+
+        """
+        import numpy as np
+        try:
+            from hit_testing import points_in_own_triangles
+        except ImportError:
+            from src.hit_testing import points_in_own_triangles
+        text = '\n'.join(text.splitlines())
+        errors = []
+        skipped = []
+        kept = []
+        kept_from = 0
+        number = 1
+        counted_to = 0
+        for match in NON_RECORD_LINE.finditer(text):
+            number += text.count('\n', counted_to, match.start())
+            counted_to = match.start()
+            kept.append(text[kept_from:match.start()])
+            kept_from = match.end()
+            skipped.append(number)
+            line = match.group().strip()
+            if line and not line.startswith('#'):
+                errors.append((number, "ожидается 9 чисел"))
+        kept.append(text[kept_from:])
+        records = np.array(''.join(kept).translate(SEPARATORS).split(), dtype=float).reshape(-1, 9)
+        accepted = np.ones(text.count('\n') + 1, dtype=bool)
+        accepted[np.array(skipped, dtype=int) - 1] = False
+        inside = points_in_own_triangles(records[:, 6:8], records[:, 0:6])
+        errors.extend((int(number), "точка вращения вне треугольника")
+                      for number in np.flatnonzero(accepted)[~inside] + 1)
+        errors.sort()
+        return records[inside], errors
+
+    def report_bulk_errors(self, errors):
+        """
+            Отображает номера некорректных строк пакетного ввода.
+
+            Ключевые атрибуты:
+                errors (list): Пары (номер строки, текст ошибки) из parse_bulk_input.
+
+            Описание:
+                Все ошибки сообщаются сразу; в метке перечисляются первые MAX_REPORTED_LINES
+                строк и количество остальных.
+
+        """
+        if not errors:
             self.error_label.config(text="")
+            return
+        lines = [f"строка {number}: {message}" for number, message in errors[:MAX_REPORTED_LINES]]
+        if len(errors) > MAX_REPORTED_LINES:
+            lines.append(f"и еще {len(errors) - MAX_REPORTED_LINES} строк")
+        self.error_label.config(text="Ошибки ввода:\n" + "\n".join(lines))
 
     def get_input_values(self, x1,y1,x2,y2,x3,y3,speed_entry,center_x_entry,center_y_entry):
         """
@@ -62,13 +198,4 @@ class InputModule:
                 и возвращает их в виде кортежа.
 
         """
-        x1 = float(x1)
-        y1 = float(y1)
-        x2 = float(x2)
-        y2 = float(y2)
-        x3 = float(x3)
-        y3 = float(y3)
-        angular_speed = float(speed_entry)
-        center_x = float(center_x_entry)
-        center_y = float(center_y_entry)
-        return x1, y1, x2, y2, x3, y3, angular_speed, center_x, center_y
+        return tuple(map(float, (x1, y1, x2, y2, x3, y3, speed_entry, center_x_entry, center_y_entry)))
@@ -1,3 +1,5 @@
+import os
+
 from tkinter_module import TkinterModule
 from input_module import InputModule
 from drawing_module import DrawingModule
@@ -11,12 +13,24 @@ from controller_module import ControllerModule
          ввода данных, DrawingModule для отрисовки на холсте и ControllerModule для 
          управления всеми этими модулями.
 
+         Если задана переменная окружения ROTATION_CONTROL_ADDRESS ('host:port' или путь к
+         Unix-сокету), запускается сервер управления control_server, через который вращениями
+         можно управлять из других процессов.
+
+         Дисковый кэш траекторий включается, только если задана переменная окружения
+         ROTATION_TRAJECTORY_CACHE с каталогом кэша: периодические вращения и без него
+         воспроизводятся из таблиц одного оборота.
+
 """
 
 tkinter_module = TkinterModule()
 input_module = InputModule(tkinter_module.error_label)
-tkinter_module.bind_entry(input_module.validate_input)
-drawing_module = DrawingModule(tkinter_module.canvas)
+tkinter_module.bind_entry(input_module.schedule_validation)
+drawing_module = DrawingModule(tkinter_module.canvas, cache_trajectories=bool(os.environ.get("ROTATION_TRAJECTORY_CACHE")))
 controller = ControllerModule(input_module, drawing_module, tkinter_module)
+control_address = os.environ.get("ROTATION_CONTROL_ADDRESS")
+if control_address:
+    from control_server import ControlServer, parse_address
+    ControlServer(drawing_module, parse_address(control_address)).start()
 tkinter_module.run()
 
@@ -0,0 +1,223 @@
+import argparse
+import os
+import struct
+import zlib
+
+import numpy as np
+
+try:
+    from rotation_engine import batch_trajectories
+except ImportError:
+    from src.rotation_engine import batch_trajectories
+
+"""
+    Описание:
+        Офлайн-рендеринг вращения треугольников без окна tkinter и без X-сервера.
+        Кадры рассчитываются тем же вычислительным ядром rotation_engine, что и анимация
+        DrawingModule, растеризуются в буфер изображения NumPy и потоково записываются
+        в анимированный GIF или в пронумерованную последовательность PNG. В памяти
+        одновременно находится только один кадр и небольшой блок траекторий.
+
+"""
+
+CANVAS_WIDTH = 750
+CANVAS_HEIGHT = 600
+BACKGROUND_COLOR = (217, 217, 217)
+TRIANGLE_COLOR = (255, 192, 203)
+PALETTE = (BACKGROUND_COLOR, TRIANGLE_COLOR)
+
+
+def rasterize_triangles(frame, triangles, color_index=1):
+    """
+        Закрашивает треугольники в буфере кадра.
+
+        Ключевые аргументы:
+            frame (numpy.ndarray): Буфер кадра формы (height, width) с индексами палитры uint8.
+            triangles (array_like): Координаты вершин треугольников формы (N, 6).
+            color_index (int): Индекс цвета палитры для заливки.
+
+        Описание:
+            Для каждого треугольника перебираются только пиксели его ограничивающего
+            прямоугольника. Центр пикселя считается принадлежащим треугольнику, если все три
+            векторных произведения имеют одинаковый знак с учетом нуля, как в
+            ControllerModule.point_in_triangle_cross_product.
+
+    """
+    height, width = frame.shape
+    for x1, y1, x2, y2, x3, y3 in np.asarray(triangles, dtype=float).reshape(-1, 6):
+        left = max(int(np.floor(min(x1, x2, x3))), 0)
+        right = min(int(np.ceil(max(x1, x2, x3))), width)
+        top = max(int(np.floor(min(y1, y2, y3))), 0)
+        bottom = min(int(np.ceil(max(y1, y2, y3))), height)
+        if left >= right or top >= bottom:
+            continue
+        x = np.arange(left, right) + 0.5
+        y = (np.arange(top, bottom) + 0.5)[:, np.newaxis]
+        cross_product1 = (x - x1) * (y2 - y1) - (y - y1) * (x2 - x1)
+        cross_product2 = (x - x2) * (y3 - y2) - (y - y2) * (x3 - x2)
+        cross_product3 = (x - x3) * (y1 - y3) - (y - y3) * (x1 - x3)
+        inside = (((cross_product1 >= 0) & (cross_product2 >= 0) & (cross_product3 >= 0)) |
+                  ((cross_product1 <= 0) & (cross_product2 <= 0) & (cross_product3 <= 0)))
+        frame[top:bottom, left:right][inside] = color_index
+
+
+def render_frames(triangles, centers, speeds, frame_count, fps=50, width=CANVAS_WIDTH,
+                  height=CANVAS_HEIGHT, chunk_size=256):
+    """
+        Генерирует растровые кадры вращения треугольников.
+
+        Ключевые аргументы:
+            triangles (array_like): Исходные координаты вершин формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+            speeds (array_like): Угловые скорости в градусах в секунду формы (N,).
+            frame_count (int): Количество кадров.
+            fps (float): Частота кадров, кадр k соответствует моменту k / fps.
+            width, height (int): Размер кадра в пикселях.
+            chunk_size (int): Количество кадров, траектории которых рассчитываются за один вызов.
+
+        Возвращаемое значение:
+            generator: Буфер кадра numpy.ndarray формы (height, width) с индексами палитры.
+
+        Описание:
+            Генератор каждый раз возвращает один и тот же буфер, перерисованный для
+            следующего кадра, поэтому потребление памяти не зависит от frame_count.
+            Если кадр нужно сохранить, его следует скопировать.
+
+    """
+    frame = np.zeros((height, width), dtype=np.uint8)
+    for start in range(0, frame_count, chunk_size):
+        times = np.arange(start, min(start + chunk_size, frame_count)) / fps
+        for rotated in batch_trajectories(triangles, centers, speeds, times):
+            frame.fill(0)
+            rasterize_triangles(frame, rotated)
+            yield frame
+
+
+def _png_chunk(chunk_type, data):
+    chunk = chunk_type + data
+    return struct.pack('>I', len(data)) + chunk + struct.pack('>I', zlib.crc32(chunk) & 0xffffffff)
+
+
+def write_png(path, frame, palette=PALETTE):
+    """
+        Записывает кадр с индексами палитры в файл PNG.
+
+        Ключевые аргументы:
+            path (str): Путь к файлу.
+            frame (numpy.ndarray): Кадр формы (height, width) с индексами палитры uint8.
+            palette (sequence): Цвета палитры в виде кортежей (r, g, b).
+
+        Описание:
+            Используется только стандартная библиотека (zlib), изображение сохраняется в
+            8-битном палитровом формате PNG.
+
+    """
+    height, width = frame.shape
+    rows = np.empty((height, width + 1), dtype=np.uint8)
+    rows[:, 0] = 0
+    rows[:, 1:] = frame
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)))
+        f.write(_png_chunk(b'PLTE', bytes(component for color in palette for component in color)))
+        f.write(_png_chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        f.write(_png_chunk(b'IEND', b''))
+
+
+def export_png_sequence(frames, directory, prefix='frame', palette=PALETTE):
+    """
+        Записывает кадры в пронумерованную последовательность файлов PNG.
+
+        Ключевые аргументы:
+            frames (iterable): Кадры с индексами палитры, например результат render_frames.
+            directory (str): Каталог для файлов, создается при необходимости.
+            prefix (str): Префикс имени файла.
+            palette (sequence): Цвета палитры.
+
+        Возвращаемое значение:
+            int: Количество записанных кадров.
+
+    """
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for count, frame in enumerate(frames, start=1):
+        write_png(os.path.join(directory, f'{prefix}_{count - 1:05d}.png'), frame, palette)
+    return count
+
+
+def export_gif(frames, path, fps=50, palette=PALETTE):
+    """
+        Потоково записывает кадры в анимированный GIF.
+
+        Ключевые аргументы:
+            frames (iterable): Кадры с индексами палитры, например результат render_frames.
+            path (str): Путь к файлу GIF.
+            fps (float): Частота кадров анимации.
+            palette (sequence): Цвета палитры.
+
+        Возвращаемое значение:
+            int: Количество записанных кадров.
+
+        Описание:
+            Для LZW-сжатия кадров используется библиотека Pillow, которая импортируется
+            только при вызове функции. Заголовок файла записывается по первому кадру, а
+            каждый следующий кадр кодируется и сразу дописывается в файл, поэтому весь
+            ролик в памяти не хранится (Image.save с save_all собирает все кадры перед
+            записью). Для пустой последовательности кадров выбрасывается ValueError, и файл
+            не создается.
+
+    """
+    try:
+        from PIL import GifImagePlugin, Image
+    except ImportError as e:
+        raise RuntimeError("Для экспорта в GIF необходима библиотека Pillow") from e
+    palette_bytes = bytes(component for color in palette for component in color)
+    duration = round(1000 / fps)
+    frames = iter(frames)
+    frame = next(frames, None)
+    if frame is None:
+        raise ValueError("Нет кадров для записи в GIF")
+    count = 0
+    with open(path, 'wb') as f:
+        while frame is not None:
+            height, width = frame.shape
+            image = Image.frombytes('P', (width, height), np.ascontiguousarray(frame).tobytes())
+            image.putpalette(palette_bytes)
+            if count == 0:
+                header, _ = GifImagePlugin.getheader(image, info={'optimize': False, 'loop': 0})
+                f.writelines(header)
+            f.writelines(GifImagePlugin.getdata(image, duration=duration))
+            count += 1
+            frame = next(frames, None)
+        f.write(b';')
+    return count
+
+
+def main():
+    """
+        Точка входа командной строки для рендеринга эталонных анимаций.
+
+        Пример:
+            python src/offline_renderer.py --triangle 0 0 200 0 100 100 --center 100 50
+                --speed 90 --frames 200 --output rotation.gif
+
+    """
+    parser = argparse.ArgumentParser(description="Офлайн-рендеринг вращения треугольника в GIF или PNG")
+    parser.add_argument('--triangle', type=float, nargs=6, required=True, metavar=('X1', 'Y1', 'X2', 'Y2', 'X3', 'Y3'))
+    parser.add_argument('--center', type=float, nargs=2, required=True, metavar=('X', 'Y'))
+    parser.add_argument('--speed', type=float, required=True, help="угловая скорость, град/с")
+    parser.add_argument('--frames', type=int, default=250)
+    parser.add_argument('--fps', type=float, default=50)
+    parser.add_argument('--width', type=int, default=CANVAS_WIDTH)
+    parser.add_argument('--height', type=int, default=CANVAS_HEIGHT)
+    parser.add_argument('--output', required=True, help="файл .gif или каталог для последовательности PNG")
+    args = parser.parse_args()
+    frames = render_frames([args.triangle], [args.center], [args.speed], args.frames, args.fps, args.width, args.height)
+    if args.output.lower().endswith('.gif'):
+        export_gif(frames, args.output, args.fps)
+    else:
+        export_png_sequence(frames, args.output)
+
+
+if __name__ == '__main__':
+    main()
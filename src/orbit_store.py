@@ -0,0 +1,161 @@
+import numpy as np
+
+try:
+    from rotation_engine import orbit_period, orbit_tables
+except ImportError:
+    from src.rotation_engine import orbit_period, orbit_tables
+
+"""
+    Описание:
+        Таблицы одного цикла периодических вращений для цикла анимации.
+
+        Вращение с постоянной скоростью периодично на сетке кадров, если угол за кадр
+        speed * dt укладывается в 360 градусов целое число раз за P <= max_frames кадров. Для
+        таких фигур при запуске рассчитывается таблица ровно одного цикла, и далее кадр берется
+        из нее по номеру без синусов и косинусов. Фигуры с иррациональным или слишком длинным
+        периодом рассчитываются поворотом, как и группы фигур одного запуска с общим периодом,
+        таблицы которых целиком не помещаются в budget: частично заполненные таблицы вынудили бы
+        рассчитывать оставшиеся фигуры выборкой вместо среза и не дали бы выигрыша.
+
+        На кадре таблицы применяются к покрытым ими фигурам, если те составляют не меньше
+        ORBIT_MIN_SHARE рассчитываемых фигур, а остальные фигуры рассчитываются поворотом; при
+        меньшей доле выборка остальных фигур стоит дороже, чем экономят таблицы. Положение из
+        таблицы соответствует ближайшему кадру сетки rint(elapsed / dt), поэтому угол может
+        отличаться от точного расчета не больше чем на половину угла за кадр.
+
+"""
+
+ORBIT_MIN_SHARE = 0.5
+
+
+class OrbitStore:
+    """
+       Класс хранилища таблиц циклов периодических вращений.
+
+       Ключевые атрибуты:
+           max_frames (int): Наибольший период в кадрах, для которого строится таблица цикла.
+           budget (int): Наибольший общий размер таблиц в байтах; 0 отключает таблицы.
+           tables (dict): Таблицы одного цикла формы (period, 6) по ключу фигуры.
+           size (int): Общий размер таблиц в байтах.
+           dirty (bool): Реестр фигур изменился, и упакованные таблицы нужно перестроить.
+
+       Методы:
+
+           plan(self, keys, indices, triangles, centers, speeds, dt):
+               Рассчитывает таблицы для фигур с периодическим вращением.
+
+           drop(self, key):
+               Удаляет таблицу фигуры.
+
+           apply(self, keys, compute_mask, now, current, speeds, base_angles, resumed_at, dt):
+               Записывает положения фигур из таблиц и возвращает маску фигур, которые нужно рассчитать.
+
+       Описание:
+           Таблицы фигур с общим периодом упаковываются по кадрам (кадр, фигура), поэтому фигуры,
+           запущенные вместе, читают на каждом кадре непрерывный участок памяти.
+
+    """
+
+    def __init__(self, max_frames=18000, budget=64 * 1024 * 1024):
+        self.max_frames = max_frames
+        self.budget = budget
+        self.tables = {}
+        self.size = 0
+        self.dirty = True
+
+    def __contains__(self, key):
+        return key in self.tables
+
+    def plan(self, keys, indices, triangles, centers, speeds, dt):
+        """
+            Рассчитывает таблицы для фигур с периодическим вращением.
+
+            Ключевые аргументы:
+                keys (list): Ключи всех фигур реестра в порядке их строк.
+                indices (numpy.ndarray): Номера строк фигур, для которых строятся таблицы.
+                triangles (numpy.ndarray): Исходные положения вершин всех фигур формы (N, 6).
+                centers (numpy.ndarray): Центры вращения всех фигур формы (N, 2).
+                speeds (numpy.ndarray): Угловые скорости всех фигур формы (N,).
+                dt (float): Интервал между кадрами в секундах.
+
+        """
+        if self.budget <= 0:
+            return
+        speeds = speeds[indices].astype(float)
+        steps, inverse = np.unique(speeds * dt, return_inverse=True)
+        step_periods = np.array([orbit_period(step, self.max_frames) or 0 for step in steps.tolist()],
+                                dtype=np.int64)
+        periods = step_periods[inverse.reshape(-1)]
+        for period in np.unique(periods[periods > 0]).tolist():
+            members = periods == period
+            group = indices[members]
+            if self.size + period * len(group) * 6 * 8 > self.budget:
+                continue
+            tables = orbit_tables(triangles[group], centers[group], speeds[members], dt, period)
+            for column, index in enumerate(group.tolist()):
+                table = np.ascontiguousarray(tables[:, column])
+                self.tables[keys[index]] = table
+                self.size += table.nbytes
+        self.dirty = True
+
+    def drop(self, key):
+        """
+            Удаляет таблицу фигуры.
+
+        """
+        table = self.tables.pop(key, None)
+        if table is not None:
+            self.size -= table.nbytes
+            self.dirty = True
+
+    def apply(self, keys, compute_mask, now, current, speeds, base_angles, resumed_at, dt):
+        """
+            Записывает положения фигур из таблиц и возвращает маску фигур, которые нужно рассчитать.
+
+            Ключевые аргументы:
+                keys (list): Ключи фигур реестра в порядке их строк.
+                compute_mask (numpy.ndarray): Маска фигур, положения которых нужно получить на кадре.
+                now (float): Время кадра.
+                current (numpy.ndarray): Координаты вершин формы (N, 6), куда записываются положения.
+                speeds, base_angles, resumed_at (numpy.ndarray): Состояние вращений фигур реестра.
+                dt (float): Интервал между кадрами в секундах.
+
+            Возвращаемое значение:
+                numpy.ndarray: Маска фигур, положения которых нужно рассчитать поворотом.
+
+        """
+        if self.dirty:
+            self._build(keys, dt)
+        replayed = compute_mask & (self.periods > 0)
+        indices = np.flatnonzero(replayed)
+        if not len(indices) or len(indices) < ORBIT_MIN_SHARE * np.count_nonzero(compute_mask):
+            return compute_mask
+        speeds = speeds[indices].astype(float)
+        paused_time = np.divide(base_angles[indices], speeds, out=np.zeros(len(indices)), where=speeds != 0)
+        elapsed = now - resumed_at[indices] + paused_time
+        numbers = np.rint(elapsed / self.dt).astype(np.int64) % self.periods[indices]
+        current[indices] = self.frames[self.offsets[indices] + numbers * self.strides[indices]]
+        return compute_mask & ~replayed
+
+    def _build(self, keys, dt):
+        count = len(keys)
+        self.periods = np.zeros(count, dtype=np.int64)
+        self.offsets = np.zeros(count, dtype=np.int64)
+        self.strides = np.zeros(count, dtype=np.int64)
+        groups = {}
+        for index, key in enumerate(keys):
+            table = self.tables.get(key)
+            if table is not None:
+                groups.setdefault(len(table), []).append(index)
+        blocks = []
+        offset = 0
+        for period, members in groups.items():
+            indices = np.array(members)
+            self.periods[indices] = period
+            self.offsets[indices] = offset + np.arange(len(members))
+            self.strides[indices] = len(members)
+            blocks.append(np.stack([self.tables[keys[index]] for index in members], axis=1).reshape(-1, 6))
+            offset += period * len(members)
+        self.frames = np.concatenate(blocks) if blocks else np.empty((0, 6))
+        self.dt = dt
+        self.dirty = False
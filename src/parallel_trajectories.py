@@ -0,0 +1,272 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from rotation_engine import batch_trajectories
+except ImportError:
+    from src.rotation_engine import batch_trajectories
+
+"""
+    Описание:
+        Параллельный расчет траекторий больших сцен в пуле процессов. Набор треугольников
+        делится на части, каждая часть обрабатывается отдельным процессом, а результат
+        записывается прямо в общий буфер multiprocessing.shared_memory, поэтому повернутые
+        кадры не сериализуются через pickle. Исходные данные сцены также передаются через
+        общую память: задаче нужно передать только имена буферов и диапазоны индексов.
+
+        Каждая часть рассчитывается той же функцией rotation_engine.batch_trajectories, что и
+        однопроцессный путь trajectory_cli (и цикл анимации DrawingModule), а все операции
+        поэлементные, поэтому результат побитово совпадает с однопроцессным.
+
+"""
+
+BLOCK_ELEMENTS = 1 << 18
+
+
+class SharedArray:
+    """
+       Класс массива NumPy в общей памяти multiprocessing.shared_memory.
+
+       Ключевые атрибуты:
+           shape (tuple): Форма массива.
+           dtype (numpy.dtype): Тип элементов.
+           memory (SharedMemory): Блок общей памяти.
+           array (numpy.ndarray): Массив поверх блока общей памяти.
+           owner (bool): True, если блок создан этим объектом и должен быть удален при закрытии.
+
+       Методы:
+
+           create(cls, shape, dtype=np.float64):
+               Создает новый блок общей памяти под массив.
+
+           attach(cls, name, shape, dtype=np.float64):
+               Подключается к существующему блоку общей памяти по имени.
+
+           close(self):
+               Освобождает отображение блока, а владелец также удаляет сам блок.
+
+    """
+
+    def __init__(self, memory, shape, dtype, owner):
+        self.memory = memory
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = owner
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=memory.buf)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    @classmethod
+    def create(cls, shape, dtype=np.float64):
+        """
+            Создает новый блок общей памяти под массив.
+
+        """
+        size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        return cls(shared_memory.SharedMemory(create=True, size=size), shape, dtype, owner=True)
+
+    @classmethod
+    def attach(cls, name, shape, dtype=np.float64):
+        """
+            Подключается к существующему блоку общей памяти по имени.
+
+            Описание:
+                Подключившийся процесс не регистрирует блок в resource_tracker (там, где это
+                поддерживается), так как удалять блок должен только его владелец.
+
+        """
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            memory = shared_memory.SharedMemory(name=name)
+        return cls(memory, shape, dtype, owner=False)
+
+    def close(self):
+        """
+            Освобождает отображение блока, а владелец также удаляет сам блок.
+
+        """
+        self.array = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _compute_block(task):
+    """
+        Рассчитывает в процессе пула кадры одной части треугольников.
+
+        Ключевые аргументы:
+            task (tuple): Имя и форма буфера записей сцены, имя и форма выходного буфера, диапазон
+                треугольников, диапазон номеров кадров, шаг по времени и позиция первого кадра в буфере.
+
+        Описание:
+            Функция подключается к буферам по именам и отключается от них по завершении задачи,
+            поэтому процессы пула не удерживают отображения буферов, освобожденных владельцем.
+            Моменты времени кадров рассчитываются в задаче по диапазону номеров, а не передаются
+            массивом. Результат записывается в свою область выходного буфера блоками кадров не
+            больше BLOCK_ELEMENTS чисел, чтобы промежуточные массивы помещались в кэш.
+            Возвращается только количество рассчитанных треугольников, а не сами координаты.
+
+    """
+    records_name, records_shape, output_name, output_shape, first, last, start, stop, dt, frame_offset = task
+    with SharedArray.attach(records_name, records_shape) as records, \
+            SharedArray.attach(output_name, output_shape) as output:
+        _write_block(records.array[first:last], output.array[:, first:last], start, stop, dt, frame_offset)
+    return last - first
+
+
+def _write_block(records, output, start, stop, dt, frame_offset):
+    step = max(1, BLOCK_ELEMENTS // (6 * max(1, len(records))))
+    for block_start in range(start, stop, step):
+        block_stop = min(block_start + step, stop)
+        position = frame_offset + block_start - start
+        output[position:position + block_stop - block_start] = batch_trajectories(
+            records[:, 0:6], records[:, 6:8], records[:, 8], np.arange(block_start, block_stop) * dt)
+
+
+class TrajectoryPool:
+    """
+       Класс пула процессов для параллельного расчета траекторий одной сцены.
+
+       Ключевые атрибуты:
+           shape_count (int): Количество треугольников сцены.
+           processes (int): Количество процессов пула.
+           records (SharedArray): Записи сцены формы (N, 9) в общей памяти.
+           executor (ProcessPoolExecutor): Пул процессов.
+
+       Методы:
+
+           compute(self, output, start, stop, dt, frame_offset=0):
+               Рассчитывает кадры [start, stop) в выходной буфер общей памяти.
+
+           precompute(self, frame_count, dt):
+               Рассчитывает все кадры в новый буфер общей памяти.
+
+           iter_chunks(self, frame_count, dt, chunk_size=4096):
+               Генерирует траектории блоками кадров через один переиспользуемый буфер.
+
+           close(self):
+               Останавливает пул и освобождает общую память.
+
+    """
+
+    def __init__(self, triangles, centers, speeds, processes=None, parts_per_process=4):
+        triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+        self.shape_count = len(triangles)
+        self.processes = processes or os.cpu_count() or 1
+        records = np.empty((self.shape_count, 9))
+        records[:, 0:6] = triangles
+        records[:, 6:8] = np.asarray(centers, dtype=float).reshape(-1, 2)
+        records[:, 8] = np.asarray(speeds, dtype=float).reshape(-1)
+        self.executor = ProcessPoolExecutor(self.processes)
+        try:
+            self.records = SharedArray.create(records.shape)
+        except BaseException:
+            self.executor.shutdown()
+            raise
+        self.records.array[:] = records
+        parts = min(self.shape_count, self.processes * parts_per_process) or 1
+        bounds = np.linspace(0, self.shape_count, parts + 1).astype(int).tolist()
+        self.parts = [(first, last) for first, last in zip(bounds, bounds[1:]) if last > first]
+
+    def compute(self, output, start, stop, dt, frame_offset=0):
+        """
+            Рассчитывает кадры [start, stop) в выходной буфер общей памяти.
+
+            Ключевые аргументы:
+                output (SharedArray): Буфер формы (K, N, 6).
+                start, stop (int): Диапазон номеров кадров.
+                dt (float): Шаг по времени между кадрами в секундах.
+                frame_offset (int): Позиция кадра start в буфере output.
+
+            Описание:
+                Моменты времени вычисляются так же, как в trajectory_cli.iter_trajectory_chunks
+                (номер кадра, умноженный на dt), а треугольники делятся на части по нескольку на
+                процесс, чтобы процессы загружались равномерно.
+
+        """
+        tasks = [(self.records.name, self.records.shape, output.name, output.shape, first, last, start, stop, dt,
+                  frame_offset) for first, last in self.parts]
+        for _ in self.executor.map(_compute_block, tasks):
+            pass
+
+    def precompute(self, frame_count, dt):
+        """
+            Рассчитывает все кадры в новый буфер общей памяти.
+
+            Возвращаемое значение:
+                SharedArray: Буфер формы (frame_count, N, 6); вызывающий закрывает его методом close.
+
+        """
+        output = SharedArray.create((frame_count, self.shape_count, 6))
+        try:
+            self.compute(output, 0, frame_count, dt)
+        except BaseException:
+            output.close()
+            raise
+        return output
+
+    def iter_chunks(self, frame_count, dt, chunk_size=4096):
+        """
+            Генерирует траектории блоками кадров через один переиспользуемый буфер.
+
+            Возвращаемое значение:
+                generator: Массивы формы (K, N, 6), K <= chunk_size.
+
+            Описание:
+                Каждый блок - представление общего буфера, которое перезаписывается следующим
+                блоком, поэтому его нужно обработать или скопировать до следующей итерации.
+
+        """
+        with SharedArray.create((min(chunk_size, frame_count), self.shape_count, 6)) as output:
+            for start in range(0, frame_count, chunk_size):
+                stop = min(start + chunk_size, frame_count)
+                self.compute(output, start, stop, dt)
+                yield output.array[:stop - start]
+
+    def close(self):
+        """
+            Останавливает пул и освобождает общую память.
+
+        """
+        self.executor.shutdown()
+        self.records.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def precompute_trajectories(triangles, centers, speeds, frame_count, dt, processes=None):
+    """
+        Рассчитывает траектории сцены в пуле процессов и возвращает обычный массив.
+
+        Ключевые аргументы:
+            triangles (array_like): Исходные координаты вершин формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+            speeds (array_like): Угловые скорости в градусах в секунду формы (N,).
+            frame_count (int): Количество кадров.
+            dt (float): Шаг по времени между кадрами в секундах.
+            processes (int): Количество процессов, по умолчанию по числу ядер.
+
+        Возвращаемое значение:
+            numpy.ndarray: Массив формы (frame_count, N, 6), побитово равный однопроцессному расчету.
+
+    """
+    with TrajectoryPool(triangles, centers, speeds, processes) as pool:
+        with pool.precompute(frame_count, dt) as output:
+            return output.array.copy()
@@ -0,0 +1,255 @@
+import numpy as np
+
+try:
+    from affine import PolygonBuffer, rotation
+except ImportError:
+    from src.affine import PolygonBuffer, rotation
+
+"""
+    Описание:
+        Вращения многоугольников с произвольным числом вершин для цикла анимации.
+
+        Многоугольники хранятся в упакованном буфере affine.PolygonBuffer, который собирается
+        заново только после изменения набора или состояния вращений, и на каждом кадре
+        поворачиваются одним пакетным умножением на матрицы affine.rotation.
+
+"""
+
+
+class PolygonRotation:
+    """
+       Состояние вращения одного многоугольника.
+
+       Ключевые атрибуты:
+           vertices (numpy.ndarray): Исходные вершины формы (k, 2).
+           center_x, center_y (float): Центр вращения.
+           speed (float): Угловая скорость в градусах в секунду.
+           base_angle (float): Угол, накопленный до последнего запуска или паузы.
+           resumed_at (float): Время последнего запуска; NaN, если вращение на паузе.
+           submitted (numpy.ndarray): Вершины формы (k, 2), последними отправленные на холст.
+
+       Методы:
+
+           angle(self, now):
+               Возвращает угол поворота в момент now.
+
+    """
+
+    __slots__ = ('vertices', 'center_x', 'center_y', 'speed', 'base_angle', 'resumed_at', 'submitted')
+
+    def __init__(self, vertices, center, speed, resumed_at):
+        self.vertices = vertices
+        self.center_x = float(center[0])
+        self.center_y = float(center[1])
+        self.speed = float(speed)
+        self.base_angle = 0.0
+        self.resumed_at = resumed_at
+        self.submitted = vertices.copy()
+
+    @property
+    def running(self):
+        return not np.isnan(self.resumed_at)
+
+    def angle(self, now):
+        """
+            Возвращает угол поворота в градусах в момент now.
+
+        """
+        return self.base_angle + (self.speed * (now - self.resumed_at) if self.running else 0.0)
+
+
+class PolygonStore:
+    """
+       Класс реестра вращений многоугольников.
+
+       Ключевые атрибуты:
+           records (dict): Вращения PolygonRotation по ключу фигуры.
+           dirty (bool): Набор или состояние вращений изменились, и буфер нужно собрать заново.
+           keys (list): Ключи многоугольников в порядке буфера.
+           current (affine.PolygonBuffer): Положения многоугольников на последнем кадре в порядке keys.
+
+       Методы:
+
+           start(self, key, vertices, center, speed, now):
+               Регистрирует вращение многоугольника или заменяет уже зарегистрированное.
+
+           drop(self, key):
+               Удаляет вращение многоугольника.
+
+           pause(self, key, now):
+               Приостанавливает вращение, сохраняя текущий угол.
+
+           resume(self, key, now):
+               Продолжает приостановленное вращение.
+
+           rebase(self, key, now, center=None, speed=None):
+               Меняет центр и/или скорость вращения без скачка положения многоугольника.
+
+           has_running(self):
+               Проверяет, есть ли вращающиеся многоугольники.
+
+           frame(self, now, visibility=None):
+               Поворачивает все многоугольники на момент now.
+
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.dirty = True
+        self.keys = None
+        self.current = None
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return key in self.records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, key):
+        return self.records[key]
+
+    def start(self, key, vertices, center, speed, now):
+        """
+            Регистрирует вращение многоугольника или заменяет уже зарегистрированное.
+
+            Ключевые аргументы:
+                key (str): Ключ фигуры.
+                vertices (sequence): Вершины (x1, y1, x2, y2, ...) или массив формы (k, 2).
+                center (tuple): Координаты центра вращения.
+                speed (float): Угловая скорость в градусах в секунду.
+                now (float): Время запуска.
+
+            Возвращаемое значение:
+                numpy.ndarray: Исходные вершины формы (k, 2).
+
+            Описание:
+                Для многоугольника без вершин выбрасывается ValueError.
+
+        """
+        vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        if not len(vertices):
+            raise ValueError("Многоугольник должен содержать хотя бы одну вершину")
+        self.records[key] = PolygonRotation(vertices, center, speed, now)
+        self.dirty = True
+        return vertices
+
+    def drop(self, key):
+        """
+            Удаляет вращение многоугольника.
+
+            Возвращаемое значение:
+                bool: True, если многоугольник был зарегистрирован.
+
+        """
+        if self.records.pop(key, None) is None:
+            return False
+        self.dirty = True
+        return True
+
+    def pause(self, key, now):
+        """
+            Приостанавливает вращение, сохраняя текущий угол.
+
+        """
+        record = self.records[key]
+        if record.running:
+            record.base_angle = record.angle(now)
+            record.resumed_at = np.nan
+            self.dirty = True
+
+    def resume(self, key, now):
+        """
+            Продолжает приостановленное вращение.
+
+            Возвращаемое значение:
+                bool: True, если вращение было на паузе.
+
+        """
+        record = self.records[key]
+        if record.running:
+            return False
+        record.resumed_at = now
+        self.dirty = True
+        return True
+
+    def rebase(self, key, now, center=None, speed=None):
+        """
+            Меняет центр и/или скорость вращения без скачка положения многоугольника.
+
+            Описание:
+                Исходные вершины заменяются положением в момент now, а накопленный угол обнуляется.
+
+        """
+        record = self.records[key]
+        matrix = rotation(record.angle(now) % 360.0, record.center_x, record.center_y)
+        record.vertices = PolygonBuffer(record.vertices, (0, len(record.vertices))).transform(matrix).vertices
+        if center is not None:
+            record.center_x, record.center_y = float(center[0]), float(center[1])
+        if speed is not None:
+            record.speed = float(speed)
+        record.base_angle = 0.0
+        if record.running:
+            record.resumed_at = now
+        self.dirty = True
+
+    def has_running(self):
+        """
+            Проверяет, есть ли вращающиеся многоугольники.
+
+        """
+        return any(record.running for record in self.records.values())
+
+    def frame(self, now, visibility=None):
+        """
+            Поворачивает все многоугольники на момент now.
+
+            Ключевые аргументы:
+                now (float): Время кадра.
+                visibility (VisibilityFilter): Отбор видимых изменений или None, чтобы отправить на
+                    холст все вращающиеся многоугольники.
+
+            Возвращаемое значение:
+                tuple: (drawn, running_count) - список пар (ключ, плоские координаты) для отрисовки и
+                количество вращающихся многоугольников.
+
+            Описание:
+                Положения всех многоугольников, включая приостановленные, сохраняются в current.
+
+        """
+        if self.dirty:
+            self._build()
+        center_x, center_y, speeds, base_angles, resumed_at = self.state.T
+        running = ~np.isnan(resumed_at)
+        running_count = int(np.count_nonzero(running))
+        angles = np.mod(base_angles + speeds * np.where(running, now - resumed_at, 0.0), 360.0)
+        buffer = self.current = self.buffer.transform(rotation(angles, center_x, center_y))
+        if not running_count:
+            return [], 0
+        if visibility is not None:
+            running &= visibility.polygon_changes(buffer.vertices, self.submitted, buffer.offsets[:-1])
+            moved = running[buffer.owners]
+            self.submitted[moved] = buffer.vertices[moved]
+        drawn = [(key, flat) for key, flat, moving in zip(self.keys, buffer.coords(), running.tolist()) if moving]
+        return drawn, running_count
+
+    def _build(self):
+        self._sync()
+        self.keys = list(self.records)
+        records = list(self.records.values())
+        self.buffer = PolygonBuffer.from_polygons(record.vertices for record in records)
+        self.state = np.array([(record.center_x, record.center_y, record.speed, record.base_angle,
+                                record.resumed_at) for record in records], dtype=float).reshape(-1, 5)
+        self.submitted = np.concatenate([record.submitted for record in records]) if records else np.empty((0, 2))
+        self.dirty = False
+
+    def _sync(self):
+        if self.keys is None:
+            return
+        offsets = self.buffer.offsets.tolist()
+        for index, key in enumerate(self.keys):
+            record = self.records.get(key)
+            if record is not None and len(record.submitted) == offsets[index + 1] - offsets[index]:
+                record.submitted = self.submitted[offsets[index]:offsets[index + 1]].copy()
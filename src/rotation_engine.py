@@ -0,0 +1,165 @@
+from fractions import Fraction
+
+import numpy as np
+
+"""
+    Описание:
+        Вычислительное ядро вращения треугольников без зависимости от tkinter.
+        Все функции работают с массивами NumPy и позволяют за один вызов повернуть
+        N треугольников, каждый со своим центром вращения и угловой скоростью,
+        на K моментов времени.
+
+"""
+
+
+def rotate_triangles(triangles, centers, angles):
+    """
+        Поворачивает треугольники вокруг их центров вращения на заданные углы.
+
+        Ключевые аргументы:
+            triangles (array_like): Координаты вершин формы (..., 6) в порядке (x1, y1, x2, y2, x3, y3).
+            centers (array_like): Центры вращения формы (..., 2).
+            angles (array_like): Углы поворота в градусах формы (...).
+
+        Возвращаемое значение:
+            numpy.ndarray: Повернутые координаты вершин формы (..., 6).
+
+        Описание:
+            Аргументы приводятся друг к другу по правилам broadcasting, поэтому один и тот же
+            треугольник можно повернуть на массив углов, а массив треугольников - на один угол.
+            Синус и косинус вычисляются один раз на угол, а не на каждую вершину.
+
+    """
+    triangles = np.asarray(triangles, dtype=float)
+    centers = np.asarray(centers, dtype=float)
+    radians = np.radians(np.asarray(angles, dtype=float))
+    cos = np.cos(radians)[..., np.newaxis]
+    sin = np.sin(radians)[..., np.newaxis]
+    center_x = centers[..., 0:1]
+    center_y = centers[..., 1:2]
+    dx = triangles[..., 0::2] - center_x
+    dy = triangles[..., 1::2] - center_y
+    rotated = np.empty(np.broadcast_shapes(dx.shape, cos.shape, center_x.shape)[:-1] + (6,))
+    rotated[..., 0::2] = center_x + dx * cos - dy * sin
+    rotated[..., 1::2] = center_y + dx * sin + dy * cos
+    return rotated
+
+
+def rotate_vertices(x, y, center_x, center_y, angles):
+    """
+        Поворачивает вершины, хранящиеся структурой массивов, вокруг центров вращения.
+
+        Ключевые аргументы:
+            x, y (array_like): Координаты вершин формы (3, N), строка - номер вершины.
+            center_x, center_y (array_like): Координаты центров вращения формы (N,).
+            angles (array_like): Углы поворота в градусах формы (N,).
+
+        Возвращаемое значение:
+            tuple: Повернутые координаты (x, y), каждая формы (3, N) и типа float64.
+
+        Описание:
+            Вариант rotate_triangles для буфера Scene: строки x и y непрерывны в памяти, поэтому
+            перекладывать вершины в формат (N, 6) перед поворотом не нужно. Порядок операций
+            совпадает с rotate_triangles, и результаты обеих функций совпадают побитово.
+
+    """
+    radians = np.radians(np.asarray(angles, dtype=float))
+    cos = np.cos(radians)
+    sin = np.sin(radians)
+    dx = x - center_x
+    dy = y - center_y
+    return center_x + dx * cos - dy * sin, center_y + dx * sin + dy * cos
+
+
+def rotation_angles(speeds, times):
+    """
+        Вычисляет углы поворота для каждой формы в каждый момент времени.
+
+        Ключевые аргументы:
+            speeds (array_like): Угловые скорости N форм в градусах в секунду, форма (N,).
+            times (array_like): Моменты времени K кадров в секундах, форма (K,).
+
+        Возвращаемое значение:
+            numpy.ndarray: Углы в градусах формы (K, N), приведенные к диапазону [0, 360).
+
+    """
+    speeds = np.asarray(speeds, dtype=float)
+    times = np.asarray(times, dtype=float)
+    return np.mod(np.multiply.outer(times, speeds), 360.0)
+
+
+def batch_trajectories(triangles, centers, speeds, times):
+    """
+        Рассчитывает траектории N треугольников на K моментов времени одним вызовом.
+
+        Ключевые аргументы:
+            triangles (array_like): Исходные координаты вершин формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+            speeds (array_like): Угловые скорости в градусах в секунду формы (N,).
+            times (array_like): Моменты времени в секундах формы (K,).
+
+        Возвращаемое значение:
+            numpy.ndarray: Непрерывный (C-contiguous) массив формы (K, N, 6).
+
+        Описание:
+            Каждый кадр вычисляется из исходных вершин поворотом на полный угол speed * t,
+            поэтому ошибка округления не накапливается от кадра к кадру.
+
+    """
+    triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+    centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+    angles = rotation_angles(np.asarray(speeds, dtype=float).reshape(-1), times)
+    return np.ascontiguousarray(rotate_triangles(triangles, centers, angles))
+
+
+def orbit_period(angle_step, max_period=3600, tolerance=1e-9):
+    """
+        Находит период вращения в кадрах при постоянном угле поворота за кадр.
+
+        Ключевые аргументы:
+            angle_step (float): Угол поворота за один кадр в градусах (speed * dt).
+            max_period (int): Наибольший допустимый период в кадрах.
+            tolerance (float): Допустимое отклонение в градусах полного угла за период от
+                кратного 360, то есть ошибка, накапливаемая за каждый повтор цикла.
+
+        Возвращаемое значение:
+            int: Наименьшее число кадров P <= max_period, для которого P * angle_step кратно 360,
+            или None, если такого периода нет (иррациональный или слишком длинный период).
+
+        Описание:
+            Доля полного оборота angle_step / 360 приближается рациональной дробью p / q со
+            знаменателем не больше max_period; знаменатель q - кандидат периода, и он
+            принимается, только если q * angle_step отличается от 360 * p не больше tolerance.
+
+    """
+    step = float(np.mod(angle_step, 360.0))
+    if step == 0.0:
+        return 1
+    fraction = Fraction(step / 360.0).limit_denominator(max_period)
+    if fraction.numerator == 0:
+        return None
+    if abs(step * fraction.denominator - 360.0 * fraction.numerator) > tolerance:
+        return None
+    return fraction.denominator
+
+
+def orbit_tables(triangles, centers, speeds, dt, period):
+    """
+        Рассчитывает один цикл положений треугольников с общим периодом.
+
+        Ключевые аргументы:
+            triangles (array_like): Исходные координаты вершин формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+            speeds (array_like): Угловые скорости в градусах в секунду формы (N,).
+            dt (float): Шаг по времени между кадрами в секундах.
+            period (int): Период в кадрах, общий для всех треугольников.
+
+        Возвращаемое значение:
+            numpy.ndarray: Таблица формы (period, N, 6), кадр k - положение в момент k * dt.
+
+        Описание:
+            Таблица рассчитывается тем же batch_trajectories, что и пакетный расчет траекторий,
+            поэтому кадры таблицы побитово совпадают с кадрами trajectory_cli.
+
+    """
+    return batch_trajectories(triangles, centers, speeds, np.arange(period) * dt)
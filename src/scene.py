@@ -0,0 +1,515 @@
+import json
+import os
+import struct
+from itertools import islice
+
+import numpy as np
+
+try:
+    from hit_testing import point_in_triangle
+except ImportError:
+    from src.hit_testing import point_in_triangle
+
+"""
+    Описание:
+        Формат файлов сцены из многих треугольников и потоковые загрузчики к нему.
+        Каждая запись сцены - это 9 чисел: вершины треугольника (x1, y1, x2, y2, x3, y3),
+        центр вращения (center_x, center_y) и угловая скорость speed в градусах в секунду.
+
+        Поддерживаются форматы:
+            .csv, .txt - текст, 9 чисел через запятую в строке; строки с # и заголовок пропускаются;
+            .jsonl - JSON lines, {"triangle": [...], "center": [x, y], "speed": s} в строке;
+            .trsc - двоичный формат: заголовок SCENE_HEADER (магическая строка, версия, размер
+                    числа 4 или 8 байт, количество записей) и далее упакованные записи по 9 чисел
+                    float32 или float64 little-endian.
+
+"""
+
+RECORD_FIELDS = 9
+SCENE_MAGIC = b'TRSC'
+SCENE_VERSION = 1
+SCENE_HEADER = struct.Struct('<4sHHQ')
+BINARY_DTYPES = {4: np.dtype('<f4'), 8: np.dtype('<f8')}
+MIN_CAPACITY = 16
+
+
+class Scene:
+    """
+       Класс сцены из N треугольников, хранящейся в одном непрерывном массиве NumPy.
+
+       Ключевые атрибуты:
+           data (numpy.ndarray): Буфер формы (9, capacity) в виде структуры массивов: строки x1, x2, x3,
+               y1, y2, y3, center_x, center_y и speed, столбец - один треугольник.
+           size (int): Количество треугольников сцены.
+           dtype (numpy.dtype): Тип хранения, float64 или float32 для очень больших сцен.
+           x, y (numpy.ndarray): Представления координат вершин формы (3, N).
+           center_x, center_y (numpy.ndarray): Представления координат центров вращения формы (N,).
+           speeds (numpy.ndarray): Представление угловых скоростей в градусах в секунду формы (N,).
+           triangles (numpy.ndarray): Копия координат вершин формы (N, 6) в порядке (x1, y1, x2, y2, x3, y3).
+           centers (numpy.ndarray): Представление центров вращения формы (N, 2).
+
+       Методы:
+
+           append(self, triangle, center, speed):
+               Добавляет треугольник в конец сцены и возвращает его индекс.
+
+           extend(self, scene):
+               Добавляет в конец все треугольники другой сцены.
+
+           remove(self, indices):
+               Удаляет треугольники, сохраняя порядок остальных.
+
+           clear(self):
+               Удаляет все треугольники, сохраняя выделенный буфер.
+
+           from_records(cls, records, dtype=np.float64):
+               Создает сцену из массива записей формы (N, 9).
+
+           to_records(self):
+               Возвращает записи сцены массивом формы (N, 9).
+
+           concatenate(cls, scenes, dtype=np.float64):
+               Объединяет несколько сцен в одну.
+
+       Описание:
+           Сцена из N треугольников - это один буфер, а не N объектов Python. Доступ к отдельному
+           треугольнику дает индексирование scene[i], возвращающее представление Triangle.
+           Представления x, y, speeds и другие ссылаются на буфер и становятся недействительными
+           после его перевыделения при росте сцены.
+
+    """
+
+    def __init__(self, triangles=(), centers=(), speeds=(), dtype=np.float64):
+        triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        speeds = np.asarray(speeds, dtype=float).reshape(-1)
+        if not len(triangles) == len(centers) == len(speeds):
+            raise ValueError("Количество треугольников, центров и скоростей сцены не совпадает")
+        self.dtype = np.dtype(dtype)
+        self.data = np.empty((RECORD_FIELDS, max(len(triangles), MIN_CAPACITY)), dtype=self.dtype)
+        self.size = 0
+        self._write(triangles, centers, speeds)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Индекс треугольника вне сцены")
+        return Triangle(self, index)
+
+    def __iter__(self):
+        return (Triangle(self, index) for index in range(self.size))
+
+    @property
+    def capacity(self):
+        return self.data.shape[1]
+
+    @property
+    def x(self):
+        return self.data[0:3, :self.size]
+
+    @property
+    def y(self):
+        return self.data[3:6, :self.size]
+
+    @property
+    def center_x(self):
+        return self.data[6, :self.size]
+
+    @property
+    def center_y(self):
+        return self.data[7, :self.size]
+
+    @property
+    def speeds(self):
+        return self.data[8, :self.size]
+
+    @property
+    def centers(self):
+        return self.data[6:8, :self.size].T
+
+    @property
+    def triangles(self):
+        triangles = np.empty((self.size, 6), dtype=self.dtype)
+        triangles[:, 0::2] = self.x.T
+        triangles[:, 1::2] = self.y.T
+        return triangles
+
+    def append(self, triangle, center, speed):
+        """
+            Добавляет треугольник в конец сцены и возвращает его индекс.
+
+            Ключевые аргументы:
+                triangle (array_like): Координаты вершин (x1, y1, x2, y2, x3, y3).
+                center (array_like): Координаты центра вращения (center_x, center_y).
+                speed (float): Угловая скорость в градусах в секунду.
+
+            Возвращаемое значение:
+                int: Индекс добавленного треугольника.
+
+        """
+        index = self.size
+        self._write(np.asarray(triangle, dtype=float).reshape(1, 6), np.asarray(center, dtype=float).reshape(1, 2),
+                    np.asarray(speed, dtype=float).reshape(1))
+        return index
+
+    def extend(self, scene):
+        """
+            Добавляет в конец все треугольники другой сцены.
+
+            Возвращаемое значение:
+                range: Индексы добавленных треугольников.
+
+        """
+        start = self.size
+        self._reserve(start + len(scene))
+        self.data[:, start:start + len(scene)] = scene.data[:, :len(scene)]
+        self.size += len(scene)
+        return range(start, self.size)
+
+    def remove(self, indices):
+        """
+            Удаляет треугольники, сохраняя порядок остальных.
+
+            Ключевые аргументы:
+                indices: Индекс или последовательность индексов удаляемых треугольников.
+
+            Возвращаемое значение:
+                numpy.ndarray: Булева маска формы (N,) оставшихся треугольников в прежней нумерации.
+
+        """
+        keep = np.ones(self.size, dtype=bool)
+        keep[indices] = False
+        kept = int(np.count_nonzero(keep))
+        self.data[:, :kept] = self.data[:, :self.size][:, keep]
+        self.size = kept
+        return keep
+
+    def clear(self):
+        """
+            Удаляет все треугольники, сохраняя выделенный буфер.
+
+        """
+        self.size = 0
+
+    @classmethod
+    def from_records(cls, records, dtype=np.float64):
+        """
+            Создает сцену из массива записей формы (N, 9).
+
+            Описание:
+                Одномерный массив разбивается на записи по 9 чисел; двумерный массив другой
+                ширины или одномерный с длиной, не кратной 9, вызывает ValueError.
+
+        """
+        records = np.asarray(records, dtype=float)
+        width = records.shape[1] if records.ndim == 2 else records.size
+        if records.ndim not in (1, 2) or width % RECORD_FIELDS or (records.ndim == 2 and width != RECORD_FIELDS):
+            raise ValueError(f"Записи сцены должны содержать по {RECORD_FIELDS} чисел, получен массив формы {records.shape}")
+        records = records.reshape(-1, RECORD_FIELDS)
+        return cls(records[:, 0:6], records[:, 6:8], records[:, 8], dtype)
+
+    def to_records(self):
+        """
+            Возвращает записи сцены массивом формы (N, 9).
+
+        """
+        records = np.empty((self.size, RECORD_FIELDS), dtype=self.dtype)
+        records[:, 0:6:2] = self.x.T
+        records[:, 1:6:2] = self.y.T
+        records[:, 6:9] = self.data[6:9, :self.size].T
+        return records
+
+    @classmethod
+    def concatenate(cls, scenes, dtype=np.float64):
+        """
+            Объединяет несколько сцен в одну.
+
+        """
+        result = cls(dtype=dtype)
+        for scene in scenes:
+            result.extend(scene)
+        return result
+
+    def _reserve(self, count):
+        if count > self.capacity:
+            data = np.empty((RECORD_FIELDS, max(count, 2 * self.capacity)), dtype=self.dtype)
+            data[:, :self.size] = self.data[:, :self.size]
+            self.data = data
+
+    def _write(self, triangles, centers, speeds):
+        start = self.size
+        end = start + len(triangles)
+        self._reserve(end)
+        self.data[0:3, start:end] = triangles[:, 0::2].T
+        self.data[3:6, start:end] = triangles[:, 1::2].T
+        self.data[6:8, start:end] = centers.T
+        self.data[8, start:end] = speeds
+        self.size = end
+
+
+class Triangle:
+    """
+       Представление одного треугольника сцены без собственной копии данных.
+
+       Ключевые атрибуты:
+           scene (Scene): Сцена, в буфере которой хранится треугольник.
+           index (int): Номер столбца треугольника в буфере сцены.
+           vertices (tuple): Координаты вершин (x1, y1, x2, y2, x3, y3).
+           center (tuple): Координаты центра вращения (center_x, center_y).
+           speed (float): Угловая скорость в градусах в секунду.
+
+       Методы:
+
+           contains(self, x, y):
+               Проверяет, лежит ли точка в треугольнике или на его стороне.
+
+       Описание:
+           Объект хранит только ссылку на сцену и индекс (__slots__), а чтение и запись атрибутов
+           обращаются к общему буферу сцены.
+
+    """
+
+    __slots__ = ('scene', 'index')
+
+    def __init__(self, scene, index):
+        self.scene = scene
+        self.index = index
+
+    def __repr__(self):
+        return f'Triangle(vertices={self.vertices}, center={self.center}, speed={self.speed})'
+
+    @property
+    def vertices(self):
+        x1, x2, x3, y1, y2, y3 = self.scene.data[0:6, self.index].tolist()
+        return (x1, y1, x2, y2, x3, y3)
+
+    @vertices.setter
+    def vertices(self, triangle):
+        triangle = np.asarray(triangle, dtype=float).reshape(6)
+        self.scene.data[0:3, self.index] = triangle[0::2]
+        self.scene.data[3:6, self.index] = triangle[1::2]
+
+    @property
+    def center(self):
+        return tuple(self.scene.data[6:8, self.index].tolist())
+
+    @center.setter
+    def center(self, center):
+        self.scene.data[6:8, self.index] = center
+
+    @property
+    def speed(self):
+        return float(self.scene.data[8, self.index])
+
+    @speed.setter
+    def speed(self, speed):
+        self.scene.data[8, self.index] = speed
+
+    def contains(self, x, y):
+        """
+            Проверяет, лежит ли точка в треугольнике или на его стороне.
+
+            Ключевые аргументы:
+                x, y (float): Координаты точки.
+
+            Возвращаемое значение:
+                bool: True, если точка принадлежит треугольнику.
+
+        """
+        return point_in_triangle(*self.vertices, x, y)
+
+
+def scene_format(path):
+    """
+        Определяет формат файла сцены по расширению.
+
+        Возвращаемое значение:
+            str: 'csv', 'jsonl' или 'binary'.
+
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.csv', '.txt'):
+        return 'csv'
+    if extension == '.jsonl':
+        return 'jsonl'
+    if extension == '.trsc':
+        return 'binary'
+    raise ValueError(f"Неизвестный формат файла сцены: {path}")
+
+
+def _is_record(line):
+    try:
+        return np.loadtxt([line], delimiter=',', ndmin=2).shape[1] == RECORD_FIELDS
+    except ValueError:
+        return False
+
+
+def iter_csv_chunks(path, chunk_size=65536, dtype=np.float64):
+    """
+        Потоково читает текстовую сцену CSV блоками по chunk_size строк.
+
+        Возвращаемое значение:
+            generator: Сцены Scene, по одной на блок.
+
+        Описание:
+            Каждый блок строк разбирается одним вызовом numpy.loadtxt. Заголовок (первая
+            строка, начинающаяся не с числа) и строки-комментарии пропускаются. Если в строке
+            не 9 чисел, выбрасывается ValueError с номером первой такой строки.
+
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = ((number, line) for number, line in enumerate(f, 1)
+                 if line.strip() and not line.lstrip().startswith('#'))
+        first = next(lines, None)
+        if first is None:
+            return
+        try:
+            float(first[1].split(',')[0])
+        except ValueError:
+            first = None
+        pending = [first] if first is not None else []
+        while True:
+            chunk = pending + list(islice(lines, chunk_size - len(pending)))
+            pending = []
+            if not chunk:
+                return
+            try:
+                records = np.loadtxt([line for _, line in chunk], delimiter=',', ndmin=2)
+            except ValueError:
+                records = None
+            if records is None or records.shape[1] != RECORD_FIELDS:
+                number = next((number for number, line in chunk if not _is_record(line)), chunk[0][0])
+                raise ValueError(f"{path}:{number}: запись сцены должна содержать {RECORD_FIELDS} чисел через запятую")
+            yield Scene.from_records(records, dtype)
+
+
+def iter_jsonl_chunks(path, chunk_size=65536, dtype=np.float64):
+    """
+        Потоково читает сцену JSON lines блоками по chunk_size записей.
+
+        Возвращаемое значение:
+            generator: Сцены Scene, по одной на блок.
+
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        records = np.empty((chunk_size, RECORD_FIELDS))
+        count = 0
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                records[count, 0:6] = item['triangle']
+                records[count, 6:8] = item['center']
+                records[count, 8] = item['speed']
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"{path}:{line_number}: некорректная запись сцены: {e}") from e
+            count += 1
+            if count == chunk_size:
+                yield Scene.from_records(records, dtype)
+                count = 0
+        if count:
+            yield Scene.from_records(records[:count], dtype)
+
+
+def open_binary_scene(path):
+    """
+        Отображает двоичный файл сцены в память без чтения данных.
+
+        Возвращаемое значение:
+            numpy.memmap: Записи сцены формы (N, 9) в исходном типе float32 или float64.
+
+    """
+    with open(path, 'rb') as f:
+        header = f.read(SCENE_HEADER.size)
+    if len(header) < SCENE_HEADER.size:
+        raise ValueError(f"{path}: файл сцены слишком короткий")
+    magic, version, item_size, count = SCENE_HEADER.unpack(header)
+    if magic != SCENE_MAGIC or version != SCENE_VERSION or item_size not in BINARY_DTYPES:
+        raise ValueError(f"{path}: неподдерживаемый заголовок файла сцены")
+    if count == 0:
+        return np.empty((0, RECORD_FIELDS), dtype=BINARY_DTYPES[item_size])
+    return np.memmap(path, dtype=BINARY_DTYPES[item_size], mode='r', offset=SCENE_HEADER.size,
+                     shape=(count, RECORD_FIELDS))
+
+
+def iter_binary_chunks(path, chunk_size=65536, dtype=np.float64):
+    """
+        Потоково читает двоичную сцену блоками по chunk_size записей.
+
+        Возвращаемое значение:
+            generator: Сцены Scene, по одной на блок.
+
+        Описание:
+            Файл отображается в память, и каждый блок копируется из отображения срезом
+            массива, поэтому в память подгружаются только страницы текущего блока, а
+            отдельные кортежи Python для вершин не создаются.
+
+    """
+    records = open_binary_scene(path)
+    for start in range(0, len(records), chunk_size):
+        yield Scene.from_records(records[start:start + chunk_size], dtype)
+
+
+def iter_scene_chunks(path, chunk_size=65536, dtype=np.float64):
+    """
+        Потоково читает файл сцены любого поддерживаемого формата.
+
+        Ключевые аргументы:
+            path (str): Путь к файлу сцены.
+            chunk_size (int): Количество треугольников в одном блоке.
+            dtype: Тип хранения сцен, numpy.float64 или numpy.float32.
+
+        Возвращаемое значение:
+            generator: Сцены Scene, по одной на блок.
+
+    """
+    readers = {'csv': iter_csv_chunks, 'jsonl': iter_jsonl_chunks, 'binary': iter_binary_chunks}
+    return readers[scene_format(path)](path, chunk_size, dtype)
+
+
+def load_scene(path, chunk_size=65536, dtype=np.float64):
+    """
+        Загружает файл сцены целиком.
+
+        Ключевые аргументы:
+            path (str): Путь к файлу сцены.
+            chunk_size (int): Количество треугольников в одном блоке при чтении.
+            dtype: Тип хранения сцены; numpy.float32 вдвое уменьшает память для очень больших сцен.
+
+        Возвращаемое значение:
+            Scene: Сцена из всех треугольников файла.
+
+    """
+    return Scene.concatenate(iter_scene_chunks(path, chunk_size, dtype), dtype)
+
+
+def save_scene(scene, path, item_size=8):
+    """
+        Сохраняет сцену в файл, формат определяется по расширению.
+
+        Ключевые аргументы:
+            scene (Scene): Сохраняемая сцена.
+            path (str): Путь к файлу.
+            item_size (int): Размер числа в двоичном формате: 4 (float32) или 8 (float64).
+
+    """
+    records = scene.to_records()
+    file_format = scene_format(path)
+    if file_format == 'binary':
+        if item_size not in BINARY_DTYPES:
+            raise ValueError("Размер числа двоичной сцены должен быть 4 или 8 байт")
+        with open(path, 'wb') as f:
+            f.write(SCENE_HEADER.pack(SCENE_MAGIC, SCENE_VERSION, item_size, len(records)))
+            f.write(records.astype(BINARY_DTYPES[item_size]).tobytes())
+    elif file_format == 'csv':
+        header = 'x1,y1,x2,y2,x3,y3,center_x,center_y,speed'
+        np.savetxt(path, records, delimiter=',', header=header, comments='', fmt='%.17g')
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            for triangle, center, speed in zip(scene.triangles.tolist(), scene.centers.tolist(), scene.speeds.tolist()):
+                f.write(json.dumps({'triangle': triangle, 'center': center, 'speed': speed}) + '\n')
@@ -0,0 +1,603 @@
+import numpy as np
+
+"""
+    Описание:
+        Запись и воспроизведение сеансов анимации для разбора ошибок отрисовки.
+
+        Журнал - файл только для дозаписи: заголовок SESSION_HEADER и далее записи фиксированного
+        размера 16 байт. Первые 4 байта записи - тег: вид записи в старшем байте и номер фигуры
+        сеанса в младших трех; остальные 12 байт интерпретируются по виду записи:
+            FRAME    - начало кадра: номер кадра (uint32) и время (float64); номер фигуры 1
+                       отмечает опорный кадр;
+            START    - одно из 9 входных значений start_rotation: номер значения (uint32) и
+                       значение (float64) в порядке x1, y1, x2, y2, x3, y3, center_x, center_y, speed;
+            NAME     - очередные 12 байт ключа фигуры в UTF-8;
+            STOP     - фигура удалена;
+            KEY      - абсолютные координаты x1, y1, x2 (int32), KEY_TAIL - y2, x3, y3;
+            DELTA    - смещения шести координат относительно предыдущего кадра (int16);
+            PART     - фигура является частью многоугольника: номер фигуры многоугольника,
+                       номер части и число его вершин (uint32).
+        Координаты хранятся в фиксированной точке с шагом 1 / scale пикселя. Фигура получает
+        записи KEY при первом появлении, при смещении, не помещающемся в int16, и на каждом
+        опорном кадре (раз в keyframe_interval кадров); в остальных кадрах - одну запись DELTA,
+        а неподвижная фигура - ни одной. Многоугольник из k вершин записывается как ceil(k / 3)
+        частей по три вершины (последняя дополняется повтором последней вершины), и каждая часть
+        кодируется как отдельная фигура.
+
+        Для воспроизведения журнал отображается в память, индекс кадров (номер записи FRAME
+        каждого кадра) строится одним векторным проходом по тегам, и переход к любому кадру
+        стоит O(1): декодируется не больше keyframe_interval кадров от ближайшего опорного.
+
+"""
+
+SESSION_MAGIC = b'TRSL'
+SESSION_VERSION = 1
+SESSION_HEADER = np.dtype([('magic', 'S4'), ('version', '<u2'), ('record_size', '<u2'), ('scale', '<u4'),
+                           ('keyframe_interval', '<u4')])
+RECORD = np.dtype([('tag', '<u4'), ('payload', 'V12')])
+SCALAR_RECORD = np.dtype([('tag', '<u4'), ('index', '<u4'), ('value', '<f8')])
+KEY_RECORD = np.dtype([('tag', '<u4'), ('values', '<i4', (3,))])
+DELTA_RECORD = np.dtype([('tag', '<u4'), ('values', '<i2', (6,))])
+NAME_RECORD = np.dtype([('tag', '<u4'), ('text', 'S12')])
+PART_RECORD = np.dtype([('tag', '<u4'), ('values', '<u4', (3,))])
+
+FRAME, START, NAME, STOP, KEY, KEY_TAIL, DELTA, PART = range(1, 9)
+SHAPE_BITS = 24
+SHAPE_MASK = (1 << SHAPE_BITS) - 1
+DELTA_LIMIT = np.iinfo(np.int16).max
+
+
+def _tags(kind, shapes):
+    return (np.uint32(kind) << np.uint32(SHAPE_BITS)) | np.asarray(shapes, dtype=np.uint32)
+
+
+class SessionRecorder:
+    """
+       Класс записи сеанса анимации в двоичный журнал.
+
+       Ключевые атрибуты:
+           path (str): Путь к файлу журнала.
+           scale (int): Количество единиц фиксированной точки на пиксель.
+           keyframe_interval (int): Интервал опорных кадров.
+           frame_count (int): Количество записанных кадров.
+           ids (dict): Номер фигуры сеанса по ее ключу.
+
+       Методы:
+
+           attach(self, animation_loop):
+               Подключает запись кадров и запусков вращений к циклу анимации.
+
+           record_start(self, key, triangle, center, angular_speed):
+               Записывает входные данные запуска вращения.
+
+           record_starts(self, keys, records):
+               Записывает входные данные запуска вращения нескольких фигур.
+
+           record_frame(self, time, keys, coords, polygon_keys=(), polygons=None):
+               Записывает положения всех фигур кадра.
+
+           flush(self):
+               Дописывает накопленные записи в файл одной операцией.
+
+           close(self):
+               Сбрасывает буфер, отключается от цикла анимации и закрывает файл.
+
+       Описание:
+           Записи копятся в буфере NumPy на buffer_records записей и пишутся в файл целиком при
+           его заполнении, а не на каждом кадре.
+
+    """
+
+    def __init__(self, path, scale=64, keyframe_interval=50, buffer_records=65536):
+        self.path = path
+        self.scale = scale
+        self.keyframe_interval = keyframe_interval
+        self.buffer = np.zeros(buffer_records, dtype=RECORD)
+        self.count = 0
+        self.frame_count = 0
+        self.ids = {}
+        self.positions = np.zeros((0, 6), dtype=np.int64)
+        self.alive = np.zeros(0, dtype=bool)
+        self.seen = np.zeros(0, dtype=bool)
+        self.slot_ids = np.zeros(0, dtype=np.int64)
+        self.slot_keys = None
+        self.slot_count = 0
+        self.part_keys = None
+        self.part_ids = np.zeros(0, dtype=np.int64)
+        self.part_vertices = np.zeros(0, dtype=np.int64)
+        self.animation_loop = None
+        self.file = open(path, 'wb')
+        header = np.zeros(1, dtype=SESSION_HEADER)
+        header[0] = (SESSION_MAGIC, SESSION_VERSION, RECORD.itemsize, scale, keyframe_interval)
+        self.file.write(header.tobytes())
+
+    def attach(self, animation_loop):
+        """
+            Подключает запись кадров и запусков вращений к циклу анимации.
+
+            Описание:
+                Кадры записываются через frame_hooks, а запуски - через start_hooks, поэтому в
+                журнал попадают все запуски цикла: одиночные треугольники, загруженные и
+                введенные списком сцены и команды сервера управления. Многоугольники
+                (start_polygon) попадают в кадры вместе с треугольниками, но их запуски не
+                записываются: запись START рассчитана на 9 значений треугольника.
+
+        """
+        self.animation_loop = animation_loop
+        animation_loop.frame_hooks.append(self.on_frame)
+        animation_loop.start_hooks.append(self.record_starts)
+
+    def on_frame(self, compute_time, draw_time, lateness, shape_count):
+        loop = self.animation_loop
+        polygons = loop.polygons
+        if len(polygons):
+            self.record_frame(loop.scheduler.last_time, loop.keys, loop.current[:len(loop.keys)], polygons.keys,
+                              polygons.current)
+        else:
+            self.record_frame(loop.scheduler.last_time, loop.keys, loop.current[:len(loop.keys)])
+
+    def record_start(self, key, triangle, center, angular_speed):
+        """
+            Записывает входные данные запуска вращения.
+
+            Ключевые атрибуты:
+                key (str): Ключ фигуры.
+                triangle (tuple): Координаты вершин (x1, y1, x2, y2, x3, y3).
+                center (tuple): Центр вращения.
+                angular_speed (float): Угловая скорость в градусах в секунду.
+
+            Описание:
+                Запуск относится к кадру, после которого он записан. Следующий кадр фигуры
+                записывается абсолютными координатами, поскольку ее положение сбрасывается.
+
+        """
+        self.record_starts([key], [tuple(triangle) + tuple(center) + (angular_speed,)])
+
+    def record_starts(self, keys, records):
+        """
+            Записывает входные данные запуска вращения нескольких фигур.
+
+            Ключевые атрибуты:
+                keys (sequence): Ключи фигур.
+                records (array_like): Записи (x1, y1, ..., y3, center_x, center_y, speed) формы (len(keys), 9).
+
+        """
+        shapes = np.array([self._id(key) for key in keys], dtype=np.int64)
+        starts = np.zeros((len(shapes), 9), dtype=SCALAR_RECORD)
+        starts['tag'] = _tags(START, shapes)[:, None]
+        starts['index'] = np.arange(9)
+        starts['value'] = np.asarray(records, dtype=float).reshape(-1, 9)
+        self._append(starts.reshape(-1).view(RECORD))
+        self.seen[shapes] = False
+
+    def record_frame(self, time, keys, coords, polygon_keys=(), polygons=None):
+        """
+            Записывает положения всех фигур кадра.
+
+            Ключевые атрибуты:
+                time (float): Время кадра в секундах.
+                keys (list): Ключи треугольников кадра.
+                coords (array_like): Координаты вершин треугольников формы (len(keys), 6).
+                polygon_keys (list): Ключи многоугольников кадра.
+                polygons (affine.PolygonBuffer): Вершины многоугольников в порядке polygon_keys.
+
+            Описание:
+                Фигуры, которые были в предыдущем кадре и отсутствуют в этом, получают запись STOP.
+                Разбиение многоугольников на части пересчитывается, только когда меняется список
+                polygon_keys, а вершины частей выбираются из буфера одной индексацией.
+
+        """
+        ids = self._slot_ids(keys)
+        coords = np.asarray(coords, dtype=float).reshape(-1, 6)
+        if polygons is not None and len(polygon_keys):
+            part_ids, part_vertices = self._part_ids(polygon_keys, polygons.offsets)
+            ids = np.concatenate((ids, part_ids))
+            coords = np.concatenate((coords, polygons.vertices[part_vertices].reshape(-1, 6)))
+        quantized = np.rint(coords * self.scale).astype(np.int64)
+        keyframe = self.frame_count % self.keyframe_interval == 0
+        marker = np.zeros(1, dtype=SCALAR_RECORD)
+        marker[0] = (_tags(FRAME, int(keyframe)), self.frame_count, time)
+        self._append(marker.view(RECORD))
+        present = np.zeros(len(self.alive), dtype=bool)
+        present[ids] = True
+        stopped = np.flatnonzero(self.alive & ~present)
+        if len(stopped):
+            records = np.zeros(len(stopped), dtype=RECORD)
+            records['tag'] = _tags(STOP, stopped)
+            self._append(records)
+            self.seen[stopped] = False
+        delta = quantized - self.positions[ids]
+        if keyframe:
+            key_mask = np.ones(len(ids), dtype=bool)
+        else:
+            key_mask = ~self.seen[ids] | (np.abs(delta) > DELTA_LIMIT).any(axis=1)
+        delta_mask = ~key_mask & (delta != 0).any(axis=1)
+        if key_mask.any():
+            shapes = ids[key_mask]
+            records = np.zeros(2 * len(shapes), dtype=KEY_RECORD)
+            records['tag'][0::2] = _tags(KEY, shapes)
+            records['tag'][1::2] = _tags(KEY_TAIL, shapes)
+            records['values'] = quantized[key_mask].reshape(-1, 3)
+            self._append(records.view(RECORD))
+        if delta_mask.any():
+            records = np.zeros(np.count_nonzero(delta_mask), dtype=DELTA_RECORD)
+            records['tag'] = _tags(DELTA, ids[delta_mask])
+            records['values'] = delta[delta_mask]
+            self._append(records.view(RECORD))
+        self.positions[ids] = quantized
+        self.seen[ids] = True
+        self.alive = present
+        self.frame_count += 1
+
+    def flush(self):
+        """
+            Дописывает накопленные записи в файл одной операцией.
+
+        """
+        if self.count:
+            self.file.write(self.buffer[:self.count].tobytes())
+            self.count = 0
+        self.file.flush()
+
+    def close(self):
+        """
+            Сбрасывает буфер, отключается от цикла анимации и закрывает файл.
+
+        """
+        if self.animation_loop is not None:
+            if self.on_frame in self.animation_loop.frame_hooks:
+                self.animation_loop.frame_hooks.remove(self.on_frame)
+            if self.record_starts in self.animation_loop.start_hooks:
+                self.animation_loop.start_hooks.remove(self.record_starts)
+        self.animation_loop = None
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _append(self, records):
+        if self.count + len(records) > len(self.buffer):
+            self.file.write(self.buffer[:self.count].tobytes())
+            self.count = 0
+            if len(records) > len(self.buffer):
+                self.file.write(records.tobytes())
+                return
+        self.buffer[self.count:self.count + len(records)] = records
+        self.count += len(records)
+
+    def _id(self, key, name=None):
+        shape = self.ids.get(key)
+        if shape is not None:
+            return shape
+        shape = self.ids[key] = len(self.ids)
+        if shape > SHAPE_MASK:
+            raise ValueError("Слишком много фигур в одном сеансе записи")
+        encoded = str(key if name is None else name).encode('utf-8') or b' '
+        chunks = [encoded[start:start + 12] for start in range(0, len(encoded), 12)]
+        records = np.zeros(len(chunks), dtype=NAME_RECORD)
+        records['tag'] = _tags(NAME, shape)
+        records['text'] = chunks
+        self._append(records.view(RECORD))
+        if shape >= len(self.alive):
+            size = max(16, 2 * len(self.alive))
+            self.positions = np.concatenate((self.positions, np.zeros((size - len(self.positions), 6), dtype=np.int64)))
+            self.alive = np.concatenate((self.alive, np.zeros(size - len(self.alive), dtype=bool)))
+            self.seen = np.concatenate((self.seen, np.zeros(size - len(self.seen), dtype=bool)))
+        return shape
+
+    def _slot_ids(self, keys):
+        if keys is not self.slot_keys or len(keys) != self.slot_count:
+            self.slot_ids = np.array([self._id(key) for key in keys], dtype=np.int64)
+            self.slot_keys = keys
+            self.slot_count = len(keys)
+        return self.slot_ids
+
+    def _part_ids(self, keys, offsets):
+        if keys is not self.part_keys:
+            counts = np.diff(offsets)
+            parts = (counts + 2) // 3
+            owners = np.repeat(np.arange(len(counts)), parts)
+            indices = np.arange(len(owners)) - np.repeat(np.cumsum(parts) - parts, parts)
+            vertices = np.minimum(3 * indices[:, None] + np.arange(3), counts[owners, None] - 1)
+            self.part_vertices = (offsets[owners, None] + vertices).reshape(-1)
+            self.part_ids = np.array([self._part_id(keys[owner], index, count) for owner, index, count
+                                      in zip(owners.tolist(), indices.tolist(), counts[owners].tolist())],
+                                     dtype=np.int64)
+            self.part_keys = keys
+        return self.part_ids, self.part_vertices
+
+    def _part_id(self, key, index, count):
+        part = (PART, key, count, index)
+        shape = self.ids.get(part)
+        if shape is not None:
+            return shape
+        owner = self._id(key)
+        shape = self._id(part, f'{key}#{index}')
+        record = np.zeros(1, dtype=PART_RECORD)
+        record[0] = (_tags(PART, shape), (owner, index, count))
+        self._append(record.view(RECORD))
+        return shape
+
+
+class SessionLog:
+    """
+       Класс чтения журнала сеанса через отображение файла в память.
+
+       Ключевые атрибуты:
+           records (numpy.ndarray): Записи журнала (numpy.memmap только для чтения).
+           scale (int): Количество единиц фиксированной точки на пиксель.
+           frame_index (numpy.ndarray): Номер записи FRAME каждого кадра.
+           keyframes (numpy.ndarray): Номера опорных кадров.
+           times (numpy.ndarray): Время каждого кадра в секундах.
+           names (list): Ключи фигур по номеру фигуры сеанса.
+           parts (numpy.ndarray): Для каждой фигуры сеанса номер фигуры многоугольника, номер
+               части и число его вершин формы (len(names), 3); -1 у треугольников.
+
+       Методы:
+
+           frame(self, number):
+               Восстанавливает положения фигур в кадре с указанным номером.
+
+           iter_frames(self, start=0, stop=None):
+               Последовательно декодирует кадры журнала.
+
+           outlines(self, shapes, coords):
+               Собирает контуры фигур кадра, объединяя части многоугольников.
+
+           starts(self):
+               Возвращает записанные запуски вращений.
+
+    """
+
+    def __init__(self, path):
+        header = np.fromfile(path, dtype=SESSION_HEADER, count=1)
+        if len(header) != 1 or header['magic'][0] != SESSION_MAGIC:
+            raise ValueError("Файл не является журналом сеанса")
+        if header['version'][0] != SESSION_VERSION or header['record_size'][0] != RECORD.itemsize:
+            raise ValueError(f"Неподдерживаемая версия журнала сеанса: {header['version'][0]}")
+        self.scale = int(header['scale'][0])
+        self.keyframe_interval = int(header['keyframe_interval'][0])
+        with open(path, 'rb') as file:
+            file.seek(0, 2)
+            count = (file.tell() - SESSION_HEADER.itemsize) // RECORD.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=RECORD, mode='r', offset=SESSION_HEADER.itemsize, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD)
+        tags = self.records['tag']
+        self.kinds = (tags >> SHAPE_BITS).astype(np.uint8)
+        self.shapes = (tags & SHAPE_MASK).astype(np.int64)
+        self.frame_index = np.flatnonzero(self.kinds == FRAME)
+        scalars = self.records.view(SCALAR_RECORD)
+        self.times = np.asarray(scalars['value'][self.frame_index])
+        self.keyframes = np.flatnonzero(self.shapes[self.frame_index] == 1)
+        self.names = self._names()
+        self.parts = self._parts()
+
+    def __len__(self):
+        return len(self.frame_index)
+
+    def frame(self, number):
+        """
+            Восстанавливает положения фигур в кадре с указанным номером.
+
+            Ключевые атрибуты:
+                number (int): Номер кадра; отрицательные номера считаются с конца.
+
+            Возвращаемое значение:
+                tuple: (time, shapes, coords) - время кадра, номера фигур сеанса формы (M,) и
+                    координаты их вершин формы (M, 6) в пикселях.
+
+            Описание:
+                Декодирование начинается с ближайшего предшествующего опорного кадра, поэтому
+                стоимость не зависит от длины журнала.
+
+        """
+        if number < 0:
+            number += len(self)
+        if not 0 <= number < len(self):
+            raise IndexError("Номер кадра вне журнала")
+        keyframe = self.keyframes[np.searchsorted(self.keyframes, number, side='right') - 1]
+        positions, alive = self._state()
+        for current in range(int(keyframe), number + 1):
+            self._apply(current, positions, alive)
+        return self._output(number, positions, alive)
+
+    def iter_frames(self, start=0, stop=None):
+        """
+            Последовательно декодирует кадры журнала.
+
+            Возвращаемое значение:
+                generator: Кортежи (number, time, shapes, coords), как у frame.
+
+            Описание:
+                Первый кадр восстанавливается через frame, а каждый следующий - применением
+                только его собственных записей, поэтому проигрывание не ограничено реальным
+                временем и идет со скоростью декодирования.
+
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        keyframe = self.keyframes[np.searchsorted(self.keyframes, start, side='right') - 1]
+        positions, alive = self._state()
+        for current in range(int(keyframe), start):
+            self._apply(current, positions, alive)
+        for current in range(start, stop):
+            self._apply(current, positions, alive)
+            yield (current,) + self._output(current, positions, alive)
+
+    def outlines(self, shapes, coords):
+        """
+            Собирает контуры фигур кадра, объединяя части многоугольников.
+
+            Ключевые атрибуты:
+                shapes (numpy.ndarray): Номера фигур сеанса, как у frame.
+                coords (numpy.ndarray): Координаты их вершин формы (M, 6).
+
+            Возвращаемое значение:
+                list: Пары (shape, flat): номер фигуры сеанса (у многоугольника - номер фигуры
+                    его ключа) и плоский список координат вершин.
+
+        """
+        owners, indices, counts = self.parts[shapes].T
+        outlines = [(shape, flat) for shape, flat, owner in zip(shapes.tolist(), coords.tolist(), owners.tolist())
+                    if owner < 0]
+        parts = np.flatnonzero(owners >= 0)
+        polygons = {}
+        for position in parts[np.lexsort((indices[parts], owners[parts]))].tolist():
+            polygons.setdefault(int(owners[position]), []).append(position)
+        for owner, positions in polygons.items():
+            outlines.append((owner, coords[positions].reshape(-1)[:2 * counts[positions[0]]].tolist()))
+        return outlines
+
+    def starts(self):
+        """
+            Возвращает записанные запуски вращений.
+
+            Возвращаемое значение:
+                list: Кортежи (frame, key, triangle, center, angular_speed), frame - номер кадра,
+                    после которого был запуск.
+
+        """
+        indices = np.flatnonzero(self.kinds == START)
+        scalars = self.records.view(SCALAR_RECORD)
+        starts = []
+        for first in indices[scalars['index'][indices] == 0].tolist():
+            values = scalars['value'][first:first + 9].tolist()
+            frame = int(np.searchsorted(self.frame_index, first)) - 1
+            starts.append((frame, self.names[self.shapes[first]], tuple(values[0:6]), tuple(values[6:8]), values[8]))
+        return starts
+
+    def _names(self):
+        indices = np.flatnonzero(self.kinds == NAME)
+        chunks = {}
+        texts = self.records.view(NAME_RECORD)['text'][indices].tolist()
+        for shape, text in zip(self.shapes[indices].tolist(), texts):
+            chunks.setdefault(shape, []).append(text)
+        names = [None] * (max(chunks) + 1 if chunks else 0)
+        for shape, parts in chunks.items():
+            names[shape] = b''.join(parts).decode('utf-8')
+        return names
+
+    def _parts(self):
+        parts = np.full((len(self.names), 3), -1, dtype=np.int64)
+        indices = np.flatnonzero(self.kinds == PART)
+        parts[self.shapes[indices]] = self.records.view(PART_RECORD)['values'][indices]
+        return parts
+
+    def _state(self):
+        return np.zeros((len(self.names), 6), dtype=np.int64), np.zeros(len(self.names), dtype=bool)
+
+    def _apply(self, number, positions, alive):
+        begin = self.frame_index[number]
+        end = self.frame_index[number + 1] if number + 1 < len(self.frame_index) else len(self.records)
+        kinds = self.kinds[begin:end]
+        shapes = self.shapes[begin:end]
+        stopped = kinds == STOP
+        if stopped.any():
+            alive[shapes[stopped]] = False
+        keys = np.flatnonzero(kinds == KEY)
+        if len(keys):
+            values = self.records.view(KEY_RECORD)['values']
+            positions[shapes[keys], 0:3] = values[begin + keys]
+            positions[shapes[keys], 3:6] = values[begin + keys + 1]
+            alive[shapes[keys]] = True
+        deltas = np.flatnonzero(kinds == DELTA)
+        if len(deltas):
+            positions[shapes[deltas]] += self.records.view(DELTA_RECORD)['values'][begin + deltas]
+            alive[shapes[deltas]] = True
+
+    def _output(self, number, positions, alive):
+        shapes = np.flatnonzero(alive)
+        return float(self.times[number]), shapes, positions[shapes] / self.scale
+
+
+class SessionPlayer:
+    """
+       Класс воспроизведения журнала сеанса на холсте.
+
+       Ключевые атрибуты:
+           canvas (tk.Canvas): Холст, таймер которого используется для смены кадров.
+           draw_shape (function): Функция отрисовки фигуры draw_shape(key, coords).
+           remove_shape (function): Функция удаления фигуры remove_shape(key).
+           log (SessionLog): Воспроизводимый журнал.
+           speed (float): Множитель скорости воспроизведения относительно записи.
+           prefix (str): Префикс ключей фигур на холсте.
+
+       Методы:
+
+           start(self, frame=0):
+               Начинает воспроизведение с указанного кадра.
+
+           step(self):
+               Рисует очередной кадр и планирует следующий.
+
+           stop(self):
+               Останавливает воспроизведение и убирает фигуры с холста.
+
+    """
+
+    def __init__(self, canvas, draw_shape, remove_shape, log, speed=1.0, prefix='replay'):
+        self.canvas = canvas
+        self.draw_shape = draw_shape
+        self.remove_shape = remove_shape
+        self.log = log
+        self.speed = speed
+        self.prefix = prefix
+        self.frames = None
+        self.previous_time = None
+        self.shown = set()
+        self.after_id = None
+
+    def start(self, frame=0):
+        """
+            Начинает воспроизведение с указанного кадра.
+
+        """
+        self.stop()
+        self.frames = self.log.iter_frames(frame)
+        self.previous_time = None
+        self.step()
+
+    def step(self):
+        """
+            Рисует очередной кадр и планирует следующий.
+
+            Описание:
+                Задержка до следующего кадра равна интервалу между кадрами записи, деленному на
+                speed, поэтому при speed > 1 сеанс проигрывается быстрее реального времени.
+
+        """
+        self.after_id = None
+        try:
+            number, time, shapes, coords = next(self.frames)
+        except StopIteration:
+            return
+        outlines = [(f'{self.prefix}{shape}', flat) for shape, flat in self.log.outlines(shapes, coords)]
+        keys = [key for key, flat in outlines]
+        for key in self.shown.difference(keys):
+            self.remove_shape(key)
+        for key, flat in outlines:
+            self.draw_shape(key, flat)
+        self.shown = set(keys)
+        if number + 1 < len(self.log):
+            delay = (self.log.times[number + 1] - time) / self.speed
+            self.after_id = self.canvas.after(max(1, int(round(delay * 1000))), self.step)
+
+    def stop(self):
+        """
+            Останавливает воспроизведение и убирает фигуры с холста.
+
+        """
+        if self.after_id is not None:
+            self.canvas.after_cancel(self.after_id)
+            self.after_id = None
+        for key in self.shown:
+            self.remove_shape(key)
+        self.shown = set()
@@ -0,0 +1,135 @@
+import numpy as np
+
+try:
+    from hit_testing import point_in_triangle
+except ImportError:
+    from src.hit_testing import point_in_triangle
+
+
+class UniformGrid:
+    """
+       Класс пространственного индекса треугольников на равномерной сетке.
+
+       Ключевые атрибуты:
+           cell_size (float): Размер ячейки сетки в пикселях.
+           triangles (numpy.ndarray): Координаты вершин проиндексированных треугольников формы (N, 6).
+           origin (tuple): Координаты левого верхнего угла сетки.
+           columns (int): Количество столбцов сетки.
+           rows (int): Количество строк сетки.
+           cell_keys (numpy.ndarray): Отсортированные номера ячеек.
+           cell_items (numpy.ndarray): Индексы треугольников, соответствующие cell_keys.
+
+       Методы:
+
+           build(self, triangles):
+               Строит индекс по текущим положениям треугольников.
+
+           candidates(self, x, y):
+               Возвращает индексы треугольников, ограничивающий прямоугольник которых покрывает ячейку точки.
+
+           query(self, x, y):
+               Находит верхний треугольник, содержащий точку.
+
+           query_points(self, points):
+               Находит верхний треугольник для каждой точки.
+
+    """
+
+    def __init__(self, cell_size=64.0):
+        self.cell_size = float(cell_size)
+        self.build(np.empty((0, 6)))
+
+    def build(self, triangles):
+        """
+            Строит индекс по текущим положениям треугольников.
+
+            Ключевые атрибуты:
+                triangles (array_like): Координаты вершин треугольников формы (N, 6).
+
+            Описание:
+                Каждый треугольник заносится во все ячейки, которые пересекает его ограничивающий
+                прямоугольник. Пары (ячейка, треугольник) формируются векторно и сортируются по
+                номеру ячейки, поэтому поиск кандидатов сводится к двоичному поиску.
+
+        """
+        self.triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+        if len(self.triangles) == 0:
+            self.origin = (0.0, 0.0)
+            self.columns = self.rows = 0
+            self.cell_keys = np.empty(0, dtype=np.int64)
+            self.cell_items = np.empty(0, dtype=np.int64)
+            return
+        xs = self.triangles[:, 0::2]
+        ys = self.triangles[:, 1::2]
+        origin_x = xs.min()
+        origin_y = ys.min()
+        self.origin = (origin_x, origin_y)
+        cx0 = np.floor((xs.min(axis=1) - origin_x) / self.cell_size).astype(np.int64)
+        cx1 = np.floor((xs.max(axis=1) - origin_x) / self.cell_size).astype(np.int64)
+        cy0 = np.floor((ys.min(axis=1) - origin_y) / self.cell_size).astype(np.int64)
+        cy1 = np.floor((ys.max(axis=1) - origin_y) / self.cell_size).astype(np.int64)
+        self.columns = int(cx1.max()) + 1
+        self.rows = int(cy1.max()) + 1
+        widths = cx1 - cx0 + 1
+        counts = widths * (cy1 - cy0 + 1)
+        owners = np.repeat(np.arange(len(self.triangles)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        keys = (cy0[owners] + local // widths[owners]) * self.columns + cx0[owners] + local % widths[owners]
+        order = np.argsort(keys, kind='stable')
+        self.cell_keys = keys[order]
+        self.cell_items = owners[order]
+
+    def candidates(self, x, y):
+        """
+            Возвращает индексы треугольников, ограничивающий прямоугольник которых покрывает ячейку точки.
+
+            Ключевые атрибуты:
+                x, y (float): Координаты точки.
+
+            Возвращаемое значение:
+                numpy.ndarray: Индексы треугольников-кандидатов по возрастанию.
+
+        """
+        column = int(np.floor((x - self.origin[0]) / self.cell_size))
+        row = int(np.floor((y - self.origin[1]) / self.cell_size))
+        if not (0 <= column < self.columns and 0 <= row < self.rows):
+            return self.cell_items[:0]
+        key = row * self.columns + column
+        start = np.searchsorted(self.cell_keys, key, side='left')
+        end = np.searchsorted(self.cell_keys, key, side='right')
+        return self.cell_items[start:end]
+
+    def query(self, x, y):
+        """
+            Находит верхний треугольник, содержащий точку.
+
+            Ключевые атрибуты:
+                x, y (float): Координаты точки.
+
+            Возвращаемое значение:
+                int: Индекс треугольника с наибольшим номером, содержащего точку, или -1.
+
+            Описание:
+                Точная проверка векторным произведением выполняется только для кандидатов
+                из ячейки точки, а не для всех треугольников. Кандидатов обычно единицы,
+                поэтому они проверяются скалярно, начиная с верхнего.
+
+        """
+        candidates = self.candidates(x, y)
+        for index in reversed(candidates.tolist()):
+            if point_in_triangle(*self.triangles[index].tolist(), x, y):
+                return index
+        return -1
+
+    def query_points(self, points):
+        """
+            Находит верхний треугольник для каждой точки.
+
+            Ключевые атрибуты:
+                points (array_like): Координаты точек формы (M, 2).
+
+            Возвращаемое значение:
+                numpy.ndarray: Индексы треугольников формы (M,), -1 - промах.
+
+        """
+        return np.array([self.query(x, y) for x, y in np.asarray(points, dtype=float).reshape(-1, 2)], dtype=np.int64)
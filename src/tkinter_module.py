@@ -36,9 +36,21 @@ class TkinterModule:
             close_window(self, event):
                 Закрывает окно приложения при нажатии клавиши Escape.
 
-            create_button(self, text, command):
+            create_button(self, text, command, row=10):
                 Создает кнопку с указанным текстом и функцией-обработчиком команды.
 
+            bind_key(self, sequence, handler):
+                Привязывает обработчик к сочетанию клавиш главного окна.
+
+            add_menu_command(self, menu_label, label, command):
+                Добавляет команду в меню строки меню, создавая меню при необходимости.
+
+            open_text_dialog(self, title, button_text, command):
+                Открывает окно с многострочным полем ввода текста.
+
+            get_clipboard(self):
+                Возвращает текст из буфера обмена.
+
             create_error_label(self):
                 Создает виджет метки для отображения ошибок.
 
@@ -70,15 +82,16 @@ class TkinterModule:
         self.y2_entry = self.create_input_field("y2:")
         self.x3_entry = self.create_input_field("x3:")
         self.y3_entry = self.create_input_field("y3:")
-        self.speed_entry = self.create_input_field("Угловая скорость:")
+        self.speed_entry = self.create_input_field("Угловая скорость, град/с:")
         self.center_x_entry = self.create_input_field("Точка вращения x:")
         self.center_y_entry = self.create_input_field("Точка вращения y:")
 
         self.menu_bar = tk.Menu(self.root)
         self.file_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.file_menu.add_command(label="О программе", command=open_about_window)
-        self.file_menu.add_command(label="Версия", command=get_version)
+        self.file_menu.add_command(label="Версия", command=lambda: get_version(self.root))
         self.menu_bar.add_cascade(label="Справка", menu=self.file_menu)
+        self.menus = {"Справка": self.file_menu}
         self.root.config(menu=self.menu_bar)
 
         self.root.bind('<Escape>', self.close_window)
@@ -156,13 +169,14 @@ class TkinterModule:
         """
         self.root.destroy()
 
-    def create_button(self, text, command):
+    def create_button(self, text, command, row=10):
         """
             Создает кнопку на панели ввода.
 
             Ключевые атрибуты:
                 text (str): Текст, отображаемый на кнопке.
                 command (function): Функция, которая будет выполнена при нажатии кнопки.
+                row (int): Строка сетки панели ввода, в которой размещается кнопка.
 
             Описание:
                 Этот метод создает кнопку с текстом `text` и связывает ее с функцией `command`,
@@ -170,7 +184,72 @@ class TkinterModule:
 
         """
         button = tk.Button(self.input_frame, text=text, command=command)
-        button.grid(row=10, column=0, columnspan=2, pady=5)
+        button.grid(row=row, column=0, columnspan=2, pady=5)
+
+    def bind_key(self, sequence, handler):
+        """
+            Привязывает обработчик к сочетанию клавиш главного окна.
+
+            Ключевые атрибуты:
+                sequence (str): Последовательность событий tkinter, например '<F3>'.
+                handler (function): Обработчик события.
+
+        """
+        self.root.bind(sequence, handler)
+
+    def add_menu_command(self, menu_label, label, command):
+        """
+            Добавляет команду в меню строки меню, создавая меню при необходимости.
+
+            Ключевые атрибуты:
+                menu_label (str): Название меню в строке меню.
+                label (str): Текст пункта меню.
+                command (function): Функция, которая будет выполнена при выборе пункта.
+
+        """
+        menu = self.menus.get(menu_label)
+        if menu is None:
+            menu = tk.Menu(self.menu_bar, tearoff=0)
+            self.menu_bar.insert_cascade(0, label=menu_label, menu=menu)
+            self.menus[menu_label] = menu
+        menu.add_command(label=label, command=command)
+
+    def open_text_dialog(self, title, button_text, command):
+        """
+            Открывает окно с многострочным полем ввода текста.
+
+            Ключевые атрибуты:
+                title (str): Заголовок окна.
+                button_text (str): Текст кнопки подтверждения.
+                command (function): Функция command(text), вызываемая при нажатии кнопки; если она
+                    возвращает True, окно закрывается.
+
+            Возвращаемое значение:
+                tk.Toplevel: Созданное окно.
+
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        text = tk.Text(dialog, width=80, height=20)
+        text.pack(fill="both", expand=True, padx=10, pady=5)
+
+        def submit():
+            if command(text.get("1.0", "end")):
+                dialog.destroy()
+
+        tk.Button(dialog, text=button_text, command=submit).pack(pady=5)
+        text.focus_set()
+        return dialog
+
+    def get_clipboard(self):
+        """
+            Возвращает текст из буфера обмена или пустую строку, если буфер пуст.
+
+        """
+        try:
+            return self.root.clipboard_get()
+        except tk.TclError:
+            return ""
 
     def create_error_label(self):
         """
@@ -0,0 +1,241 @@
+import hashlib
+import os
+
+import numpy as np
+
+try:
+    from trajectory_cli import iter_trajectory_chunks
+except ImportError:
+    from src.trajectory_cli import iter_trajectory_chunks
+
+"""
+    Описание:
+        Постоянный кэш рассчитанных траекторий на диске. Траектория (frame_count, N, 6)
+        сохраняется в файл .npy, имя которого - хэш параметров вращения: вершин, центров,
+        угловых скоростей, шага dt и количества кадров. При повторном запуске с теми же
+        параметрами файл открывается через отображение в память, и кадры подгружаются
+        операционной системой по мере обращения к ним, без расчета синусов и косинусов.
+
+        Общий размер кэша ограничен max_bytes; при превышении удаляются файлы, к которым
+        дольше всего не обращались (время обращения хранится во времени изменения файла).
+
+"""
+
+TRAJECTORY_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "rotation_of_the_triangle", "trajectories")
+TRAJECTORY_CACHE_VERSION = 1
+
+
+def trajectory_key(triangles, centers, speeds, dt, frame_count):
+    """
+        Вычисляет ключ кэша по параметрам вращения.
+
+        Ключевые аргументы:
+            triangles (array_like): Исходные координаты вершин формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+            speeds (array_like): Угловые скорости в градусах в секунду формы (N,).
+            dt (float): Шаг по времени между кадрами в секундах.
+            frame_count (int): Количество кадров.
+
+        Возвращаемое значение:
+            str: Шестнадцатеричный хэш SHA-256.
+
+        Описание:
+            Хэшируются двоичные представления float64, поэтому ключи совпадают только для
+            побитово равных параметров, а значит, и для побитово равных траекторий.
+
+    """
+    digest = hashlib.sha256()
+    digest.update(np.array((TRAJECTORY_CACHE_VERSION, frame_count), dtype='<i8').tobytes())
+    digest.update(np.array(dt, dtype='<f8').tobytes())
+    for values, width in ((triangles, 6), (centers, 2), (speeds, 1)):
+        digest.update(np.ascontiguousarray(values, dtype='<f8').reshape(-1, width).tobytes())
+    return digest.hexdigest()
+
+
+class TrajectoryCache:
+    """
+       Класс дискового кэша траекторий с отображением файлов в память и вытеснением LRU.
+
+       Ключевые атрибуты:
+           directory (str): Каталог кэша (переменная окружения ROTATION_TRAJECTORY_CACHE).
+           max_bytes (int): Максимальный общий размер файлов кэша в байтах.
+           hits (int): Количество попаданий в кэш.
+           misses (int): Количество промахов, после которых траектория была рассчитана.
+
+       Методы:
+
+           get(self, key):
+               Открывает траекторию из кэша через отображение в память.
+
+           put(self, key, triangles, centers, speeds, dt, frame_count):
+               Рассчитывает траекторию, сохраняет ее в кэш и открывает через отображение в память.
+
+           load(self, triangles, centers, speeds, dt, frame_count):
+               Возвращает траекторию из кэша, рассчитывая ее при промахе.
+
+           evict(self, keep=None):
+               Удаляет давно не использованные файлы, пока размер кэша превышает max_bytes.
+
+           size(self):
+               Возвращает общий размер файлов кэша в байтах.
+
+           clear(self):
+               Удаляет все файлы кэша.
+
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024, chunk_size=4096):
+        self.directory = directory or os.environ.get("ROTATION_TRAJECTORY_CACHE", TRAJECTORY_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def get(self, key):
+        """
+            Открывает траекторию из кэша через отображение в память.
+
+            Ключевые аргументы:
+                key (str): Ключ trajectory_key.
+
+            Возвращаемое значение:
+                numpy.memmap: Траектория формы (frame_count, N, 6) только для чтения или None.
+
+            Описание:
+                Данные не читаются с диска: страницы файла подгружаются лениво при обращении к
+                кадрам. Время изменения файла обновляется, отмечая его как недавно использованный.
+
+        """
+        path = self.path(key)
+        try:
+            frames = np.load(path, mmap_mode='r')
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        self.hits += 1
+        return frames
+
+    def put(self, key, triangles, centers, speeds, dt, frame_count):
+        """
+            Рассчитывает траекторию, сохраняет ее в кэш и открывает через отображение в память.
+
+            Возвращаемое значение:
+                numpy.memmap: Сохраненная траектория формы (frame_count, N, 6) только для чтения.
+
+            Описание:
+                Кадры рассчитываются блоками trajectory_cli.iter_trajectory_chunks прямо в
+                отображенный временный файл, который затем атомарно переименовывается, поэтому
+                другой запуск программы никогда не увидит файл записанным частично.
+
+        """
+        self.misses += 1
+        triangles = np.asarray(triangles, dtype=float).reshape(-1, 6)
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        frames = np.lib.format.open_memmap(temporary_path, mode='w+', dtype='<f8',
+                                           shape=(frame_count, len(triangles), 6))
+        try:
+            start = 0
+            for chunk in iter_trajectory_chunks(triangles, centers, speeds, frame_count, dt, self.chunk_size):
+                frames[start:start + len(chunk)] = chunk
+                start += len(chunk)
+            frames.flush()
+            frames = None
+            os.replace(temporary_path, path)
+        except BaseException:
+            frames = None
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        self.evict(keep=key)
+        return np.load(path, mmap_mode='r')
+
+    def load(self, triangles, centers, speeds, dt, frame_count):
+        """
+            Возвращает траекторию из кэша, рассчитывая ее при промахе.
+
+            Ключевые аргументы:
+                triangles (array_like): Исходные координаты вершин формы (N, 6).
+                centers (array_like): Центры вращения формы (N, 2).
+                speeds (array_like): Угловые скорости в градусах в секунду формы (N,).
+                dt (float): Шаг по времени между кадрами в секундах.
+                frame_count (int): Количество кадров.
+
+            Возвращаемое значение:
+                numpy.memmap: Траектория формы (frame_count, N, 6) только для чтения.
+
+        """
+        key = trajectory_key(triangles, centers, speeds, dt, frame_count)
+        frames = self.get(key)
+        if frames is None:
+            frames = self.put(key, triangles, centers, speeds, dt, frame_count)
+        return frames
+
+    def entries(self):
+        """
+            Возвращает файлы кэша от давно использованных к недавним.
+
+            Возвращаемое значение:
+                list: Кортежи (время изменения, размер, путь).
+
+        """
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith('.npy'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self, keep=None):
+        """
+            Удаляет давно не использованные файлы, пока размер кэша превышает max_bytes.
+
+            Ключевые аргументы:
+                keep (str): Ключ файла, который нельзя удалять, например только что записанного.
+
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        keep_path = self.path(keep) if keep is not None else None
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep_path:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def size(self):
+        """
+            Возвращает общий размер файлов кэша в байтах.
+
+        """
+        return sum(size for _, size, _ in self.entries())
+
+    def clear(self):
+        """
+            Удаляет все файлы кэша.
+
+        """
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,164 @@
+import argparse
+import sys
+
+import numpy as np
+
+try:
+    from rotation_engine import batch_trajectories
+    from scene import load_scene
+except ImportError:
+    from src.rotation_engine import batch_trajectories
+    from src.scene import load_scene
+
+"""
+    Описание:
+        Консольная программа для пакетного расчета траекторий без окна tkinter.
+        Вершины рассчитываются rotation_engine.batch_trajectories по тем же формулам и в том же
+        порядке операций, что и rotate_vertices в цикле анимации AnimationLoop, поэтому кадр k
+        совпадает с кадром интерфейса в момент k * dt. Кадры вычисляются блоками и сразу
+        записываются в stdout или файл в формате CSV или .npy, поэтому потребление памяти не
+        зависит от количества кадров.
+        С параметром --processes большие сцены рассчитываются в пуле процессов
+        (parallel_trajectories.TrajectoryPool) с тем же побитовым результатом, а с --cache
+        траектория берется из дискового кэша trajectory_cache.TrajectoryCache.
+
+        Пример:
+            python src/trajectory_cli.py --triangle 0 0 200 0 100 100 --center 100 50 --speed 90
+                --frames 1000000 --dt 0.02 --format npy --output trajectory.npy
+
+"""
+
+
+def iter_trajectory_chunks(triangles, centers, speeds, frame_count, dt, chunk_size=4096):
+    """
+        Генерирует траектории треугольников блоками кадров.
+
+        Ключевые аргументы:
+            triangles (array_like): Исходные координаты вершин формы (N, 6).
+            centers (array_like): Центры вращения формы (N, 2).
+            speeds (array_like): Угловые скорости в градусах в секунду формы (N,).
+            frame_count (int): Количество кадров.
+            dt (float): Шаг по времени между кадрами в секундах.
+            chunk_size (int): Количество кадров в блоке.
+
+        Возвращаемое значение:
+            generator: Массивы формы (K, N, 6), K <= chunk_size.
+
+    """
+    for start in range(0, frame_count, chunk_size):
+        times = np.arange(start, min(start + chunk_size, frame_count)) * dt
+        yield batch_trajectories(triangles, centers, speeds, times)
+
+
+def iter_trajectory(triangles, centers, speeds, frame_count, dt, chunk_size=4096):
+    """
+        Генерирует траектории треугольников по одному кадру.
+
+        Возвращаемое значение:
+            generator: Массивы формы (N, 6), по одному на кадр.
+
+    """
+    for chunk in iter_trajectory_chunks(triangles, centers, speeds, frame_count, dt, chunk_size):
+        yield from chunk
+
+
+def write_csv(chunks, stream, shape_count):
+    """
+        Записывает блоки кадров в CSV: номер кадра и 6 * N координат в строке.
+
+    """
+    columns = ','.join(f'{name}_{i}' for i in range(shape_count) for name in ('x1', 'y1', 'x2', 'y2', 'x3', 'y3'))
+    stream.write(f'frame,{columns}\n'.encode())
+    frame = 0
+    for chunk in chunks:
+        rows = np.hstack((np.arange(frame, frame + len(chunk))[:, np.newaxis], chunk.reshape(len(chunk), -1)))
+        np.savetxt(stream, rows, delimiter=',', fmt=['%d'] + ['%.17g'] * (rows.shape[1] - 1))
+        frame += len(chunk)
+
+
+def write_npy(chunks, stream, frame_count, shape_count):
+    """
+        Записывает блоки кадров в формате .npy с формой (frame_count, N, 6).
+
+        Описание:
+            Форма массива известна заранее, поэтому заголовок .npy записывается до данных,
+            а блоки дописываются по мере расчета.
+
+    """
+    header = {'descr': np.lib.format.dtype_to_descr(np.dtype('<f8')), 'fortran_order': False,
+              'shape': (frame_count, shape_count, 6)}
+    np.lib.format.write_array_header_1_0(stream, header)
+    for chunk in chunks:
+        stream.write(np.ascontiguousarray(chunk, dtype='<f8').tobytes())
+
+
+def main(argv=None):
+    """
+        Точка входа командной строки.
+
+    """
+    parser = argparse.ArgumentParser(description="Пакетный расчет траекторий вращения треугольников")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--triangle', type=float, nargs=6, metavar=('X1', 'Y1', 'X2', 'Y2', 'X3', 'Y3'))
+    source.add_argument('--scene', help="файл сцены (.csv, .jsonl, .trsc)")
+    parser.add_argument('--center', type=float, nargs=2, metavar=('X', 'Y'))
+    parser.add_argument('--speed', type=float, help="угловая скорость, град/с")
+    parser.add_argument('--frames', type=int, required=True)
+    parser.add_argument('--dt', type=float, default=0.02, help="шаг по времени между кадрами, с")
+    parser.add_argument('--format', choices=('csv', 'npy'), default='csv')
+    parser.add_argument('--output', default='-', help="путь к файлу или - для stdout")
+    parser.add_argument('--chunk-size', type=int, default=4096)
+    parser.add_argument('--cache', action='store_true',
+                        help="брать траекторию из дискового кэша и сохранять ее туда при промахе")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="количество процессов для расчета больших сцен, 0 - по числу ядер")
+    args = parser.parse_args(argv)
+    if args.frames < 0:
+        parser.error("--frames не может быть отрицательным")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size должен быть не меньше 1")
+    if args.processes < 0:
+        parser.error("--processes не может быть отрицательным")
+    if args.scene:
+        if args.center is not None or args.speed is not None:
+            parser.error("--center и --speed задаются в файле сцены и не используются вместе с --scene")
+        scene = load_scene(args.scene)
+        triangles, centers, speeds = scene.triangles, scene.centers, scene.speeds
+    else:
+        if args.center is None or args.speed is None:
+            parser.error("для --triangle необходимо указать --center и --speed")
+        triangles, centers, speeds = [args.triangle], [args.center], [args.speed]
+    shape_count = len(np.asarray(triangles).reshape(-1, 6))
+    pool = None
+    if args.cache:
+        try:
+            from trajectory_cache import TrajectoryCache
+        except ImportError:
+            from src.trajectory_cache import TrajectoryCache
+        frames = TrajectoryCache().load(triangles, centers, speeds, args.dt, args.frames)
+        chunks = (frames[start:start + args.chunk_size] for start in range(0, args.frames, args.chunk_size))
+    elif args.processes == 1:
+        chunks = iter_trajectory_chunks(triangles, centers, speeds, args.frames, args.dt, args.chunk_size)
+    else:
+        try:
+            from parallel_trajectories import TrajectoryPool
+        except ImportError:
+            from src.parallel_trajectories import TrajectoryPool
+        pool = TrajectoryPool(triangles, centers, speeds, args.processes or None)
+        chunks = pool.iter_chunks(args.frames, args.dt, args.chunk_size)
+    stream = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+    try:
+        if args.format == 'csv':
+            write_csv(chunks, stream, shape_count)
+        else:
+            write_npy(chunks, stream, args.frames, shape_count)
+    finally:
+        chunks.close()
+        if pool is not None:
+            pool.close()
+        if stream is not sys.stdout.buffer:
+            stream.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,10 @@
+import json
+import os
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
-import requests
 
 def open_about_window():
     """
@@ -20,23 +24,184 @@ def open_about_window():
     with open("data_utils/program_description.txt", "r", encoding="utf-8") as f:
         about_text.insert(tk.END, f.read())
 
-def get_version():
+VERSION_URL = "https://api.github.com/repos/Zhukkovaa/Rotation_of_the_triangle/releases/latest"
+VERSION_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "rotation_of_the_triangle", "version.json")
+
+
+class VersionChecker:
     """
-        Получает версию программы из GitHub репозитория и отображает ее в сообщении.
+        Класс для неблокирующего получения версии программы с кэшированием на диске.
 
-        Описание:
-        Эта функция отправляет GET-запрос к GitHub API, чтобы получить информацию о последнем
-        релизе программы. Если запрос успешен, версия программы извлекается из данных о релизе
-        и отображается в информационном диалоговом окне. В случае ошибки при выполнении запроса,
-        отображается сообщение об ошибке.
+        Ключевые атрибуты:
+            url (str): Адрес API релизов. Переменная окружения ROTATION_VERSION_URL позволяет
+                направить запрос на локальный тестовый сервер.
+            cache_path (str): Путь к файлу кэша (переменная окружения ROTATION_VERSION_CACHE).
+            ttl (float): Время жизни кэша в секундах.
+            timeout (float): Таймаут сетевого запроса в секундах.
+            clock (function): Источник текущего времени для проверки срока жизни кэша.
+
+        Методы:
+
+            read_cache(self):
+                Возвращает версию из кэша, если он существует и не устарел.
+
+            write_cache(self, version):
+                Сохраняет версию в кэш.
+
+            fetch(self):
+                Запрашивает версию последнего релиза из сети.
+
+            check(self, root, callback, poll_ms=50):
+                Получает версию без блокировки главного потока tkinter и передает ее в callback.
+
+    """
+
+    def __init__(self, url=None, cache_path=None, ttl=3600, timeout=3.0, clock=time.time):
+        self.url = url or os.environ.get("ROTATION_VERSION_URL", VERSION_URL)
+        self.cache_path = cache_path or os.environ.get("ROTATION_VERSION_CACHE", VERSION_CACHE_PATH)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.clock = clock
+        self.pending = None
+        self.callbacks = []
+
+    def read_cache(self):
+        """
+            Возвращает версию из кэша, если он существует и не устарел.
+
+            Возвращаемое значение:
+                str: Версия программы или None.
+
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or self.clock() - data.get("timestamp", 0) > self.ttl:
+            return None
+        return data.get("version")
+
+    def write_cache(self, version):
+        """
+            Сохраняет версию в кэш.
+
+            Ключевые атрибуты:
+                version (str): Версия программы.
+
+            Описание:
+                Файл записывается во временный файл и атомарно заменяется, чтобы одновременные
+                запуски программы не прочитали его частично записанным.
+
+        """
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        temporary_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "timestamp": self.clock()}, f)
+        os.replace(temporary_path, self.cache_path)
+
+    def fetch(self):
+        """
+            Запрашивает версию последнего релиза из сети.
+
+            Возвращаемое значение:
+                str: Значение tag_name последнего релиза или None, если его нет в ответе.
+
+            Описание:
+                Библиотека requests импортируется только здесь, при первом сетевом запросе,
+                чтобы не замедлять запуск программы.
 
         """
-    url = "https://api.github.com/repos/Zhukkovaa/Rotation_of_the_triangle/releases/latest"
-    try:
-        response = requests.get(url)
+        import requests
+        response = requests.get(self.url, timeout=self.timeout)
         response.raise_for_status()
-        release_data = response.json()
-        version = release_data.get("tag_name", "Версия не найдена")
+        return response.json().get("tag_name")
+
+    def check(self, root, callback, poll_ms=50):
+        """
+            Получает версию без блокировки главного потока tkinter и передает ее в callback.
+
+            Ключевые атрибуты:
+                root (tk.Misc): Виджет, через таймер которого результат возвращается в поток интерфейса.
+                callback (function): Функция callback(version, error), вызываемая в потоке интерфейса.
+                poll_ms (int): Период опроса результата в миллисекундах.
+
+            Описание:
+                При свежем кэше callback вызывается сразу. Иначе запрос выполняется в фоновом
+                потоке со строгим таймаутом, а результат передается через очередь, которую поток
+                интерфейса опрашивает с помощью root.after. Любая ошибка запроса, включая
+                отсутствие библиотеки requests, передается в callback, поэтому опрос всегда
+                завершается. Версия кэшируется, только если она найдена в ответе. Повторные
+                вызовы во время запроса не создают новых потоков, а ждут результата того же запроса.
+
+        """
+        cached = self.read_cache()
+        if cached is not None:
+            callback(cached, None)
+            return
+        self.callbacks.append(callback)
+        if self.pending is not None:
+            return
+        self.pending = queue.Queue(maxsize=1)
+        threading.Thread(target=self._fetch_in_background, args=(self.pending,), daemon=True).start()
+        root.after(poll_ms, self._poll, root, poll_ms)
+
+    def _fetch_in_background(self, result_queue):
+        try:
+            version = self.fetch()
+        except Exception as e:
+            result_queue.put((None, e))
+            return
+        if version is not None:
+            try:
+                self.write_cache(version)
+            except OSError:
+                pass
+        result_queue.put((version, None))
+
+    def _poll(self, root, poll_ms):
+        try:
+            version, error = self.pending.get_nowait()
+        except queue.Empty:
+            root.after(poll_ms, self._poll, root, poll_ms)
+            return
+        callbacks, self.callbacks, self.pending = self.callbacks, [], None
+        for callback in callbacks:
+            callback(version, error)
+
+
+version_checker = VersionChecker()
+
+
+def show_version(version, error):
+    """
+        Отображает версию программы или ошибку ее получения в диалоговом окне.
+
+        Ключевые аргументы:
+            version (str): Версия программы или None, если она не найдена.
+            error (Exception): Ошибка при получении версии или None.
+
+    """
+    if error is not None:
+        messagebox.showerror("Ошибка", f"Ошибка при получении версии: {error}")
+    elif version is None:
+        messagebox.showinfo("Версия", "Версия не найдена")
+    else:
         messagebox.showinfo("Версия", f"Версия программы: {version}")
-    except requests.exceptions.RequestException as e:
-        messagebox.showerror("Ошибка", f"Ошибка при получении версии: {e}")
\ No newline at end of file
+
+
+def get_version(root):
+    """
+        Получает версию программы из GitHub репозитория и отображает ее в сообщении.
+
+        Ключевые аргументы:
+            root (tk.Misc): Виджет главного окна, через который результат возвращается в поток интерфейса.
+
+        Описание:
+        Эта функция получает информацию о последнем релизе программы через GitHub API.
+        Запрос выполняется в фоновом потоке с таймаутом, поэтому интерфейс и анимация не
+        замирают при медленной сети, а результат кэшируется на диске на час. Версия или
+        сообщение об ошибке отображаются в диалоговом окне.
+
+        """
+    version_checker.check(root, show_version)
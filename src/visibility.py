@@ -0,0 +1,119 @@
+from functools import reduce
+
+import numpy as np
+
+"""
+    Описание:
+        Отбор видимых изменений кадра цикла анимации. Фигура отправляется на холст, только если
+        хотя бы одна ее вершина сместилась не меньше чем на min_pixel_change пикселей относительно
+        последних отправленных координат и ограничивающий прямоугольник фигуры в новом или в
+        отправленном положении пересекает viewport. Фигура, уходящая за край, поэтому один раз
+        перерисуется за краем, и на холсте не остается ее след. Отправленные координаты NaN
+        означают, что фигура еще не нарисована, и она рисуется, как только попадает в viewport.
+
+        Координаты треугольников обрабатываются по столбцам (x1, y1, ..., y3), а не редукциями по
+        строкам: редукции по оси 1 массива (N, 6) идут по несмежной памяти и заметно медленнее.
+
+"""
+
+
+def triangle_bounds(coords):
+    """
+        Возвращает ограничивающие прямоугольники треугольников.
+
+        Ключевые аргументы:
+            coords (numpy.ndarray): Координаты вершин формы (N, 6).
+
+        Возвращаемое значение:
+            tuple: Массивы (x_min, y_min, x_max, y_max) формы (N,).
+
+    """
+    x1, y1, x2, y2, x3, y3 = coords.T
+    return (np.minimum(np.minimum(x1, x2), x3), np.minimum(np.minimum(y1, y2), y3),
+            np.maximum(np.maximum(x1, x2), x3), np.maximum(np.maximum(y1, y2), y3))
+
+
+def polygon_bounds(vertices, starts):
+    """
+        Возвращает ограничивающие прямоугольники многоугольников упакованного буфера.
+
+        Ключевые аргументы:
+            vertices (numpy.ndarray): Вершины всех многоугольников формы (V, 2).
+            starts (numpy.ndarray): Смещения первых вершин многоугольников формы (N,).
+
+        Возвращаемое значение:
+            tuple: Массивы (x_min, y_min, x_max, y_max) формы (N,).
+
+    """
+    return (np.minimum.reduceat(vertices[:, 0], starts), np.minimum.reduceat(vertices[:, 1], starts),
+            np.maximum.reduceat(vertices[:, 0], starts), np.maximum.reduceat(vertices[:, 1], starts))
+
+
+class VisibilityFilter:
+    """
+       Класс отбора фигур, изменения которых видны на холсте.
+
+       Ключевые атрибуты:
+           viewport (tuple): Видимая область холста (x_min, y_min, x_max, y_max) или None, чтобы не
+               отсекать фигуры за ее пределами.
+           min_pixel_change (float): Наименьшее смещение вершины в пикселях, при котором фигура
+               перерисовывается; 0 - перерисовывать при любом изменении.
+
+       Методы:
+
+           triangle_changes(self, coords, submitted):
+               Возвращает маску треугольников, которые нужно перерисовать.
+
+           polygon_changes(self, vertices, submitted, starts):
+               Возвращает маску многоугольников упакованного буфера, которые нужно перерисовать.
+
+    """
+
+    def __init__(self, viewport=None, min_pixel_change=0.0):
+        self.viewport = viewport
+        self.min_pixel_change = min_pixel_change
+
+    @property
+    def enabled(self):
+        return self.viewport is not None or self.min_pixel_change > 0
+
+    def triangle_changes(self, coords, submitted):
+        """
+            Возвращает маску треугольников, которые нужно перерисовать.
+
+            Ключевые аргументы:
+                coords (numpy.ndarray): Новые координаты вершин формы (N, 6).
+                submitted (numpy.ndarray): Последние отправленные на холст координаты формы (N, 6).
+
+            Возвращаемое значение:
+                numpy.ndarray: Булева маска формы (N,).
+
+        """
+        shifts = reduce(np.maximum, np.abs(coords - submitted).T)
+        return self._visible_changes(shifts, triangle_bounds(coords), triangle_bounds(submitted))
+
+    def polygon_changes(self, vertices, submitted, starts):
+        """
+            Возвращает маску многоугольников упакованного буфера, которые нужно перерисовать.
+
+            Ключевые аргументы:
+                vertices (numpy.ndarray): Новые вершины всех многоугольников формы (V, 2).
+                submitted (numpy.ndarray): Последние отправленные на холст вершины формы (V, 2).
+                starts (numpy.ndarray): Смещения первых вершин многоугольников формы (N,).
+
+            Возвращаемое значение:
+                numpy.ndarray: Булева маска формы (N,).
+
+        """
+        shifts = np.maximum.reduceat(np.abs(vertices - submitted).max(axis=1), starts)
+        return self._visible_changes(shifts, polygon_bounds(vertices, starts), polygon_bounds(submitted, starts))
+
+    def _visible_changes(self, shifts, bounds, submitted_bounds):
+        changed = ~(shifts < self.min_pixel_change) if self.min_pixel_change > 0 else ~(shifts <= 0)
+        if self.viewport is not None:
+            changed &= self._in_view(bounds) | self._in_view(submitted_bounds)
+        return changed
+
+    def _in_view(self, bounds):
+        x_min, y_min, x_max, y_max = self.viewport
+        return (bounds[2] >= x_min) & (bounds[0] <= x_max) & (bounds[3] >= y_min) & (bounds[1] <= y_max)
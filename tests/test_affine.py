@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from src.affine import PolygonBuffer, compose, identity, orbit, rotation, scaling, translation
+from src.rotation_engine import rotate_triangles
+
+class TestAffine(unittest.TestCase):
+
+    def test_triangles_match_rotate_triangles(self):
+        rng = np.random.default_rng(3)
+        triangles = rng.uniform(0, 500, (50, 6))
+        centers = rng.uniform(0, 500, (50, 2))
+        angles = rng.uniform(0, 360, 50)
+        buffer = PolygonBuffer.from_triangles(triangles).transform(rotation(angles, centers[:, 0], centers[:, 1]))
+        expected = rotate_triangles(triangles, centers, angles)
+        np.testing.assert_allclose(buffer.vertices.reshape(-1, 6), expected, atol=1e-9)
+
+    def test_compose_applies_first_matrix_first(self):
+        matrix = compose(translation(10, 0), scaling(2))
+        buffer = PolygonBuffer.from_polygons([(1, 1)]).transform(matrix)
+        np.testing.assert_allclose(buffer.vertices, [[22, 2]])
+        np.testing.assert_allclose(compose(identity(1), translation([5], [6]))[0], translation(5, 6))
+
+    def test_scaling_about_center(self):
+        buffer = PolygonBuffer.from_polygons([(0, 0, 20, 0, 20, 20, 0, 20)])
+        scaled = buffer.transform(scaling(0.5, center_x=10, center_y=10))
+        np.testing.assert_allclose(scaled.polygon(0), [[5, 5], [15, 5], [15, 15], [5, 15]])
+
+    def test_orbit_moves_center_around_pivot(self):
+        buffer = PolygonBuffer.from_polygons([(10, 0)])
+        moved = buffer.transform(orbit([90.0], [10.0], [0.0], [90.0], [0.0], [0.0]))
+        np.testing.assert_allclose(moved.vertices, [[0, 10]], atol=1e-12)
+
+    def test_mixed_polygon_sizes(self):
+        polygons = [(0, 0, 10, 0, 0, 10), (0, 0, 10, 0, 10, 10, 0, 10), (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)]
+        buffer = PolygonBuffer.from_polygons(polygons)
+        self.assertEqual(len(buffer), 3)
+        np.testing.assert_array_equal(buffer.counts, [3, 4, 5])
+        moved = buffer.transform(translation([1, 2, 3], [0, 0, 0]))
+        coords = moved.coords()
+        self.assertEqual([len(flat) for flat in coords], [6, 8, 10])
+        self.assertEqual(coords[1][:2], [2.0, 0.0])
+        self.assertEqual(coords[2][:2], [4.0, 2.0])
+
+    def test_inconsistent_offsets_rejected(self):
+        with self.assertRaises(ValueError):
+            PolygonBuffer(np.zeros((4, 2)), [0, 3])
@@ -0,0 +1,273 @@
+import unittest
+from unittest.mock import Mock, patch
+import numpy as np
+from src.animation_loop import AnimationLoop
+from src.frame_scheduler import FrameScheduler
+from src.rotation_engine import rotate_triangles
+from src.scene import Scene
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class CanvasStub:
+
+    def after(self, delay_ms, callback):
+        return 'after#0'
+
+    def after_cancel(self, after_id):
+        pass
+
+class TestAnimationLoop(unittest.TestCase):
+
+    def setUp(self):
+        self.canvas = Mock()
+        self.draw_shape = Mock()
+        self.remove_shape = Mock()
+        self.clock = FakeClock()
+        self.loop = AnimationLoop(self.canvas, self.draw_shape, self.remove_shape,
+                                  scheduler=FrameScheduler(50, clock=self.clock))
+
+    def test_single_timer_for_many_rotations(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.loop.start('b', (10, 0, 0, 0, 0, 10), (0, 0), 45.0)
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 30.0)
+        self.canvas.after.assert_called_once_with(20, self.loop.frame)
+        self.assertEqual(self.loop.keys, ['a', 'b'])
+        self.assertEqual(self.loop.shape('a').speed, 30.0)
+
+    def test_frame_rotates_by_elapsed_time(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.clock.now = 1.0
+        self.loop.frame()
+        key, coords = self.draw_shape.call_args[0]
+        self.assertEqual(key, 'a')
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected)
+        self.assertEqual(self.canvas.after.call_count, 2)
+
+    def test_pause_keeps_angle_and_cancels_timer(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.clock.now = 0.5
+        self.loop.pause('a')
+        self.canvas.after_cancel.assert_called_once()
+        self.clock.now = 5.0
+        self.loop.resume('a')
+        self.clock.now = 5.5
+        self.loop.frame()
+        coords = self.draw_shape.call_args[0][1]
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_polygon_rotates_with_triangles(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.loop.start_polygon('p', (10, 0, 0, 10, -10, 0, 0, -10), (0, 0), 90.0)
+        self.clock.now = 1.0
+        self.loop.frame()
+        drawn = {call[0][0]: call[0][1] for call in self.draw_shape.call_args_list}
+        np.testing.assert_allclose(drawn['p'], (0, 10, -10, 0, 0, -10, 10, 0), atol=1e-9)
+        np.testing.assert_allclose(drawn['a'], (0, 10, 0, 0, -10, 0), atol=1e-9)
+        self.loop.pause('p')
+        self.assertEqual(self.loop.polygons['p'].base_angle, 90.0)
+        self.assertFalse(self.loop.polygons['p'].running)
+        self.loop.stop('a')
+        self.canvas.after_cancel.assert_called()
+        self.clock.now = 5.0
+        self.loop.resume('p')
+        self.assertEqual(self.loop.polygons['p'].angle(6.0), 180.0)
+        self.assertIn('p', self.loop)
+        self.loop.stop_all()
+        self.remove_shape.assert_called_with('p')
+        self.assertEqual(len(self.loop), 0)
+
+    def test_culling_skips_offscreen_and_subpixel_changes(self):
+        loop = AnimationLoop(self.canvas, self.draw_shape, self.remove_shape,
+                             scheduler=FrameScheduler(50, clock=self.clock), viewport=(0, 0, 100, 100),
+                             min_pixel_change=0.5)
+        loop.start('slow', (50, 50, 60, 50, 50, 60), (50, 50), 0.01)
+        loop.start('far', (1000, 1000, 1010, 1000, 1000, 1010), (1000, 1000), 90.0)
+        loop.start('fast', (50, 50, 60, 50, 50, 60), (50, 50), 90.0)
+        loop.start('leaving', (90, 0, 110, 0, 90, 10), (200, 0), 180.0)
+        loop.start_polygon('square', (40, 40, 60, 40, 60, 60, 40, 60), (50, 50), 0.01)
+        self.draw_shape.reset_mock()
+        self.clock.now = 1.0
+        loop.frame()
+        self.assertEqual([call[0][0] for call in self.draw_shape.call_args_list], ['fast', 'leaving'])
+        self.assertEqual((loop.last_drawn, loop.last_skipped), (2, 3))
+        self.draw_shape.reset_mock()
+        self.clock.now = 1.1
+        loop.frame()
+        self.assertEqual([call[0][0] for call in self.draw_shape.call_args_list], ['fast'])
+        self.assertEqual((loop.drawn_shapes, loop.skipped_shapes), (3, 7))
+
+    def test_update_many_continues_from_current_position(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.loop.start_polygon('p', (10, 0, 0, 10, -10, 0), (0, 0), 90.0)
+        self.clock.now = 1.0
+        self.assertEqual(self.loop.update_many(['a', 'p', 'missing'], [(5, 5), None, None], [0.0, 0.0, None]), ['a', 'p'])
+        self.assertEqual(self.loop.shape('a').center, (5.0, 5.0))
+        self.clock.now = 3.0
+        self.loop.frame()
+        drawn = {call[0][0]: call[0][1] for call in self.draw_shape.call_args_list}
+        np.testing.assert_allclose(drawn['a'], (0, 10, 0, 0, -10, 0), atol=1e-9)
+        np.testing.assert_allclose(drawn['p'], (0, 10, -10, 0, 0, -10), atol=1e-9)
+
+    def test_stop_removes_shape_and_timer(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.loop.stop('a')
+        self.remove_shape.assert_called_once_with('a')
+        self.canvas.after_cancel.assert_called_once()
+        self.assertIsNone(self.loop.after_id)
+
+    def test_incremental_rotation_accumulates(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 45.0, incremental=True)
+        self.clock.now = 1.0
+        self.loop.frame()
+        self.clock.now = 2.0
+        self.loop.frame()
+        coords = self.draw_shape.call_args[0][1]
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_pick_uses_current_positions(self):
+        self.loop.start('a', (0, 0, 10, 0, 0, 10), (0, 0), 180.0)
+        self.loop.start('b', (100, 100, 110, 100, 100, 110), (100, 100), 0.0)
+        self.assertEqual(self.loop.pick(2, 2), 'a')
+        self.assertEqual(self.loop.pick(102, 102), 'b')
+        self.clock.now = 1.0
+        self.loop.frame()
+        self.assertIsNone(self.loop.pick(2, 2))
+        self.assertEqual(self.loop.pick(-2, -2), 'a')
+        self.loop.stop('b')
+        self.assertIsNone(self.loop.pick(102, 102))
+
+    def test_frame_hooks_receive_timings(self):
+        hook = Mock()
+        self.loop.frame_hooks.append(hook)
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.clock.now = 0.025
+        self.loop.frame()
+        compute_time, draw_time, lateness, shape_count = hook.call_args[0]
+        self.assertGreaterEqual(compute_time, 0)
+        self.assertGreaterEqual(draw_time, 0)
+        self.assertAlmostEqual(lateness, 0.005)
+        self.assertEqual(shape_count, 1)
+
+    def test_start_scene_and_stop_many(self):
+        scene = Scene([(10, 0, 0, 0, 0, 10), (110, 100, 100, 100, 100, 110)], [(0, 0), (100, 100)], [90.0, 0.0])
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 45.0)
+        self.loop.start_scene(['s0', 's1'], scene)
+        self.assertEqual(self.loop.keys, ['a', 's0', 's1'])
+        self.canvas.after.assert_called_once()
+        self.loop.stop_many(['a', 's1', 'missing'])
+        self.assertEqual(self.loop.keys, ['s0'])
+        self.assertEqual(self.loop.slots, {'s0': 0})
+        self.clock.now = 1.0
+        self.loop.frame()
+        key, coords = self.draw_shape.call_args[0]
+        self.assertEqual(key, 's0')
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_float32_storage(self):
+        loop = AnimationLoop(self.canvas, self.draw_shape, self.remove_shape,
+                             scheduler=FrameScheduler(50, clock=self.clock), dtype=np.float32)
+        loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.assertEqual(loop.shapes.dtype, np.float32)
+        self.clock.now = 1.0
+        loop.frame()
+        coords = self.draw_shape.call_args[0][1]
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected, places=5)
+
+    def test_replay_reads_frames_until_trajectory_ends(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        frames = np.arange(30, dtype=float).reshape(5, 6)
+        self.loop.replay('a', frames, 0.5)
+        self.clock.now = 1.0
+        self.loop.frame()
+        self.assertEqual(self.draw_shape.call_args[0][1], frames[2].tolist())
+        self.clock.now = 3.0
+        self.loop.frame()
+        coords = self.draw_shape.call_args[0][1]
+        for value, expected in zip(coords, (0, -10, 0, 0, 10, 0)):
+            self.assertAlmostEqual(value, expected)
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.assertEqual(self.loop.replays, {})
+
+    def test_periodic_rotation_replays_one_cycle(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.assertEqual(len(self.loop.orbit_store.tables['a']), 200)
+        self.clock.now = 1.0 + 400 * 0.02
+        with patch('src.animation_loop.rotate_vertices') as rotate:
+            self.loop.frame()
+        rotate.assert_not_called()
+        coords = self.draw_shape.call_args[0][1]
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_irrational_period_falls_back_to_rotation(self):
+        self.loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.loop.start('b', (10, 0, 0, 0, 0, 10), (0, 0), np.sqrt(2.0))
+        self.assertNotIn('b', self.loop.orbit_store.tables)
+        self.clock.now = 1.0
+        self.loop.frame()
+        coords = self.draw_shape.call_args_list[-2][0][1]
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_orbit_tables_cover_a_subset_of_shapes(self):
+        triangle = (10, 0, 0, 0, 0, 10)
+        speeds = [90.0, 90.0, 90.0, np.sqrt(2.0)]
+        self.loop.start_scene(['a', 'b', 'c', 'd'], Scene([triangle] * 4, [(0, 0)] * 4, speeds))
+        self.assertEqual(sorted(self.loop.orbit_store.tables), ['a', 'b', 'c'])
+        self.clock.now = 1.011
+        self.loop.frame()
+        snapped = rotate_triangles(triangle, (0, 0), 90.0 * 51 * 0.02)
+        np.testing.assert_allclose(self.loop.current[0:3], [snapped] * 3, atol=1e-9)
+        np.testing.assert_allclose(self.loop.current[3], rotate_triangles(triangle, (0, 0), np.sqrt(2.0) * 1.011),
+                                   atol=1e-9)
+
+    def test_orbit_budget_bounds_tables(self):
+        loop = AnimationLoop(self.canvas, self.draw_shape, self.remove_shape,
+                             scheduler=FrameScheduler(50, clock=self.clock), orbit_budget=200 * 48)
+        loop.start_scene(['b', 'c'], Scene([(10, 0, 0, 0, 0, 10)] * 2, [(0, 0)] * 2, [90.0, 90.0]))
+        self.assertEqual(loop.orbit_store.tables, {})
+        loop.start('a', (10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        self.assertEqual(list(loop.orbit_store.tables), ['a'])
+        loop.stop('a')
+        self.assertEqual(loop.orbit_store.size, 0)
+        self.clock.now = 1.0
+        loop.frame()
+        coords = self.draw_shape.call_args[0][1]
+        for value, expected in zip(coords, (0, 10, 0, 0, -10, 0)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_closed_form_drift_bounded_after_million_frames(self):
+        triangle = np.array((0, 0, 100, 0, 50, 100), dtype=float)
+        center = np.array((50.0, 50.0))
+        speed = 5.0 * np.sqrt(2.0)
+        loop = AnimationLoop(CanvasStub(), lambda key, coords: None, lambda key: None,
+                             scheduler=FrameScheduler(50, clock=self.clock))
+        loop.start('closed', triangle, center, speed)
+        loop.start('incremental', triangle, center, speed, incremental=True)
+        self.assertEqual(loop.orbit_store.tables, {})
+        frames = 10 ** 6
+        for number in range(1, frames + 1):
+            self.clock.now = number * 0.02
+            loop.frame()
+        closed, incremental = loop.current[0], loop.current[1]
+        expected = rotate_triangles(triangle, center, np.mod(speed * self.clock.now, 360.0))
+        np.testing.assert_allclose(closed, expected, rtol=0, atol=1e-9)
+        radii = np.hypot(triangle[0::2] - center[0], triangle[1::2] - center[1])
+        np.testing.assert_allclose(np.hypot(closed[0::2] - center[0], closed[1::2] - center[1]), radii,
+                                   rtol=0, atol=1e-9)
+        self.assertLess(np.abs(closed - incremental).max(), 1e-6)
+        self.assertLessEqual(np.abs(closed - expected).max(), np.abs(incremental - expected).max())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import importlib.util
+import unittest
+from pathlib import Path
+
+def load_benchmark(name):
+    path = Path(__file__).resolve().parent.parent / 'benchmarks' / f'{name}.py'
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+run_benchmarks = load_benchmark('run_benchmarks')
+compare, run = run_benchmarks.compare, run_benchmarks.run
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_compare_reports_regressions_past_threshold(self):
+        baseline = {'results': {'a': {'seconds': 1.0}, 'b': {'seconds': 1.0}, 'c': {'seconds': 1.0}}}
+        current = {'results': {'a': {'seconds': 1.2}, 'b': {'seconds': 1.3}, 'd': {'seconds': 9.0}}}
+        self.assertEqual(compare(current, baseline, 0.25), [('b', 1.0, 1.3)])
+
+    def test_run_selected_benchmark(self):
+        results = run(['get_input_values'], repeats=1)
+        self.assertEqual(list(results['results']), ['get_input_values'])
+        self.assertGreater(results['results']['get_input_values']['seconds'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import Mock
+import numpy as np
+from src.animation_loop import AnimationLoop
+from src.collision import CollisionDetector, circle_pairs, colliding_pairs, rotation_radii, triangles_intersect
+from src.frame_scheduler import FrameScheduler
+from src.hit_testing import points_in_triangles
+from src.scene import Scene
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def segments_cross(a, b):
+    def orientation(p, q, r):
+        return np.sign((q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0]))
+    return (orientation(a[0], a[1], b[0]) != orientation(a[0], a[1], b[1]) and
+            orientation(b[0], b[1], a[0]) != orientation(b[0], b[1], a[1]))
+
+def reference_intersect(first, second):
+    a = np.asarray(first, dtype=float).reshape(3, 2)
+    b = np.asarray(second, dtype=float).reshape(3, 2)
+    if points_in_triangles(a, second).any() or points_in_triangles(b, first).any():
+        return True
+    return any(segments_cross((a[i], a[(i + 1) % 3]), (b[j], b[(j + 1) % 3])) for i in range(3) for j in range(3))
+
+class TestCollision(unittest.TestCase):
+
+    def test_separating_axis_cases(self):
+        base = (0, 0, 10, 0, 0, 10)
+        cases = {(2, 2, 20, 2, 2, 20): True,
+                 (1, 1, 3, 1, 1, 3): True,
+                 (10, 0, 20, 0, 10, 10): True,
+                 (6, 6, 20, 6, 6, 20): False,
+                 (11, 0, 20, 0, 11, 10): False,
+                 (-5, 4, 15, 4, 5, 30): True}
+        first = np.array([base] * len(cases), dtype=float)
+        second = np.array(list(cases), dtype=float)
+        self.assertEqual(triangles_intersect(first, second).tolist(), list(cases.values()))
+
+    def test_matches_reference_on_random_triangles(self):
+        rng = np.random.default_rng(2)
+        first = rng.uniform(0, 40, size=(300, 6))
+        second = rng.uniform(0, 40, size=(300, 6))
+        expected = [reference_intersect(a, b) for a, b in zip(first, second)]
+        self.assertEqual(triangles_intersect(first, second).tolist(), expected)
+
+    def test_broad_phase_finds_all_overlapping_circles(self):
+        rng = np.random.default_rng(3)
+        centers = rng.uniform(0, 500, size=(400, 2))
+        radii = rng.uniform(1, 30, size=400)
+        first, second = circle_pairs(centers, radii)
+        i, j = np.triu_indices(400, 1)
+        overlapping = np.hypot(*(centers[i] - centers[j]).T) <= radii[i] + radii[j]
+        np.testing.assert_array_equal(first, i[overlapping])
+        np.testing.assert_array_equal(second, j[overlapping])
+
+    def test_colliding_pairs_match_all_pairs(self):
+        rng = np.random.default_rng(4)
+        triangles = (rng.uniform(0, 400, size=(300, 1, 2)) + rng.uniform(-15, 15, size=(300, 3, 2))).reshape(300, 6)
+        centers = triangles.reshape(300, 3, 2).mean(axis=1)
+        first, second = colliding_pairs(triangles, centers)
+        i, j = np.triu_indices(300, 1)
+        hits = triangles_intersect(triangles[i], triangles[j])
+        np.testing.assert_array_equal(first, i[hits])
+        np.testing.assert_array_equal(second, j[hits])
+        self.assertTrue(np.all(rotation_radii(triangles, centers) > 0))
+
+    def test_detector_reuses_broad_phase_between_frames(self):
+        clock = FakeClock()
+        loop = AnimationLoop(Mock(), Mock(), Mock(), scheduler=FrameScheduler(50, clock=clock))
+        detector = CollisionDetector()
+        detector.attach(loop)
+        hook = Mock()
+        detector.collision_hooks.append(hook)
+        scene = Scene([(0, 9, 20, 9, 0, 11), (9, 17, 11, 17, 10, 19), (300, 300, 310, 300, 300, 310)],
+                      [(10, 10), (10, 18), (305, 305)], [90.0, 0.0, 90.0])
+        loop.start_scene(['a', 'b', 'c'], scene)
+        clock.now = 0.02
+        loop.frame()
+        self.assertEqual(detector.key_pairs(), [])
+        hook.assert_not_called()
+        clock.now = 1.0
+        loop.frame()
+        self.assertEqual(detector.key_pairs(), [('a', 'b')])
+        hook.assert_called_once_with([('a', 'b')])
+        self.assertEqual(detector.rebuilds, 1)
+        loop.update_many(['c'], [(200, 200)])
+        clock.now = 1.02
+        loop.frame()
+        self.assertEqual(detector.rebuilds, 2)
+        detector.detach()
+        self.assertEqual(loop.frame_hooks, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import select
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+from src.animation_loop import AnimationLoop
+from src.control_client import ControlClient
+from src.control_server import ControlServer, apply_commands, parse_address
+from src.drawing_module import DrawingModule
+from src.frame_scheduler import FrameScheduler
+
+TRIANGLE = [10, 0, 0, 0, 0, 10]
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestApplyCommands(unittest.TestCase):
+
+    def setUp(self):
+        self.draw_shape = Mock()
+        self.clock = FakeClock()
+        self.loop = AnimationLoop(Mock(), self.draw_shape, Mock(), scheduler=FrameScheduler(50, clock=self.clock))
+
+    def test_commands_of_one_frame_are_coalesced(self):
+        self.loop.start_scene = Mock(wraps=self.loop.start_scene)
+        self.loop.update_many = Mock(wraps=self.loop.update_many)
+        requests = [{'command': 'start', 'id': 1, 'jobs': [{'key': 'a', 'triangle': TRIANGLE, 'center': [0, 0], 'speed': 10}]},
+                    {'command': 'start', 'jobs': [{'key': 'b', 'triangle': TRIANGLE, 'center': [0, 0], 'speed': 10}]},
+                    {'command': 'update', 'updates': [{'key': 'a', 'speed': 90}]},
+                    {'command': 'stop', 'keys': ['b']},
+                    {'command': 'query', 'keys': ['a', 'b']}]
+        replies = apply_commands(self.loop, requests)
+        self.loop.start_scene.assert_called_once()
+        self.loop.update_many.assert_not_called()
+        self.assertEqual(self.loop.keys, ['a'])
+        self.assertEqual(self.loop.shape('a').speed, 90.0)
+        self.assertEqual(replies[0], {'started': 1, 'ok': True, 'id': 1})
+        self.assertEqual(replies[4]['positions'], {'a': TRIANGLE, 'b': None})
+        self.assertEqual(self.draw_shape.call_count, 0)
+        self.clock.now += 0.02
+        self.loop.frame()
+        self.assertEqual(self.draw_shape.call_count, 1)
+
+    def test_updates_keep_last_value_per_key(self):
+        self.loop.start('a', TRIANGLE, (0, 0), 90.0)
+        self.loop.update_many = Mock(wraps=self.loop.update_many)
+        apply_commands(self.loop, [{'command': 'update', 'updates': [{'key': 'a', 'speed': speed}]} for speed in range(100)]
+                       + [{'command': 'update', 'updates': [{'key': 'a', 'center': [1, 1]}]}])
+        self.loop.update_many.assert_called_once_with(['a'], [[1.0, 1.0]], [99.0])
+
+    def test_invalid_command_is_rejected(self):
+        replies = apply_commands(self.loop, [{'command': 'start', 'jobs': [{'key': 'a', 'triangle': [1, 2], 'center': [0, 0],
+                                                                          'speed': 1}]},
+                                             {'command': 'explode'}])
+        self.assertFalse(replies[0]['ok'])
+        self.assertFalse(replies[1]['ok'])
+        self.assertEqual(len(self.loop), 0)
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address('localhost:8765'), ('localhost', 8765))
+        self.assertEqual(parse_address('8765'), ('127.0.0.1', 8765))
+        self.assertEqual(parse_address('/tmp/rotation.sock'), '/tmp/rotation.sock')
+
+class TestControlServer(unittest.TestCase):
+
+    def test_tk_is_touched_only_from_the_tk_thread(self):
+        canvas = Mock()
+        server = ControlServer(DrawingModule(canvas), poll_interval_ms=20)
+        server.start()
+        fd, _, on_signal = canvas.tk.createfilehandler.call_args[0]
+        sender = threading.Thread(target=lambda: [server._enqueue({'command': 'ping'}, Mock()) for _ in range(3)])
+        sender.start()
+        sender.join()
+        canvas.after.assert_not_called()
+        self.assertTrue(select.select([fd], [], [], 1.0)[0])
+        on_signal(fd, None)
+        canvas.after.assert_called_once_with(20, server.poll)
+        self.assertFalse(select.select([fd], [], [], 0)[0])
+        server.poll()
+        self.assertEqual(server.commands, 3)
+        self.assertIsNone(server.after_id)
+        canvas.after.assert_called_once()
+        server.stop()
+        canvas.tk.deletefilehandler.assert_called_once_with(fd)
+        canvas.after_cancel.assert_not_called()
+
+    def test_client_round_trip(self):
+        canvas = Mock()
+        server = ControlServer(DrawingModule(canvas))
+        address = server.start()
+        results = {}
+
+        def client():
+            with ControlClient(address) as control:
+                control.start([('a', TRIANGLE, (0, 0), 90.0), ('b', TRIANGLE, (0, 0), 45.0)])
+                control.update('b', speed=30.0)
+                results['positions'] = control.query(['a'])
+                results['errors'] = 0
+                try:
+                    control.request('explode')
+                except ValueError:
+                    results['errors'] += 1
+
+        thread = threading.Thread(target=client)
+        thread.start()
+        deadline = time.monotonic() + 10
+        while thread.is_alive() and time.monotonic() < deadline:
+            server.process_commands()
+            time.sleep(0.001)
+        thread.join()
+        server.stop()
+        self.assertEqual(results['positions'], {'a': TRIANGLE})
+        self.assertEqual(results['errors'], 1)
+        self.assertEqual(server.drawing_module.animation_loop.shape('b').speed, 30.0)
+        canvas.tk.deletefilehandler.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
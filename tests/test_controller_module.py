@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock
 from src.controller_module import ControllerModule
+from src.input_module import InputModule
 
 class TestControllerModule(unittest.TestCase):
 
@@ -38,5 +39,27 @@ class TestControllerModule(unittest.TestCase):
         self.storage_module.set_input_values.assert_not_called()
         self.drawing_module.rotate_segment.assert_not_called()
 
+    def test_load_scene_passes_chunks_to_drawing_module(self):
+        self.controller.load_scene('scene.csv')
+        self.drawing_module.load_scene.assert_called_once()
+        self.input_module.error_label.config.assert_called_with(text="")
+
+    def test_load_scene_unknown_format(self):
+        self.controller.load_scene('scene.xyz')
+        self.drawing_module.load_scene.assert_not_called()
+        self.assertIn("Ошибка загрузки сцены", self.input_module.error_label.config.call_args[1]['text'])
+
+    def test_load_bulk_text_starts_scene(self):
+        self.controller.input_module = InputModule(Mock())
+        self.assertTrue(self.controller.load_bulk_text("0,0,200,0,100,100,100,50,90\n\n0 0 20 0 10 10 10 5 -45\n"))
+        scene = self.drawing_module.load_scene.call_args[0][0]
+        self.assertEqual(len(scene), 2)
+        self.assertEqual(scene.speeds.tolist(), [90.0, -45.0])
+
+    def test_load_bulk_text_rejects_block_with_errors(self):
+        self.controller.input_module = InputModule(Mock())
+        self.assertFalse(self.controller.load_bulk_text("0,0,200,0,100,100,100,50,90\n1,2,3\n"))
+        self.drawing_module.load_scene.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
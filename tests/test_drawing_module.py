@@ -1,6 +1,10 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 from src.drawing_module import DrawingModule
+from src.scene import Scene
+from src.session_log import SessionLog
 
 class TestDrawingModule(unittest.TestCase):
 
@@ -23,5 +27,95 @@ class TestDrawingModule(unittest.TestCase):
         rotated_segment = self.canvas.create_polygon.call_args[0]
         self.assertEqual(rotated_segment, original_triangle)
 
+    def test_rotate_triangle_registers_in_animation_loop(self):
+        original_triangle = (0, 0, 100, 0, 50, 100)
+        self.drawing_module.rotate_triangle(original_triangle, (50, 50), 10.0)
+        self.drawing_module.rotate_triangle(original_triangle, (50, 50), 20.0)
+        self.assertEqual(self.drawing_module.animation_loop.keys, ['triangle'])
+        self.assertEqual(self.drawing_module.animation_loop.shape('triangle').speed, 20.0)
+        self.canvas.after.assert_called_once()
+
+    def test_rotate_polygon(self):
+        square = (0, 0, 100, 0, 100, 100, 0, 100)
+        self.drawing_module.rotate_polygon(square, (50, 50), 10.0)
+        self.assertEqual(self.canvas.create_polygon.call_args[0], square)
+        self.assertIn('polygon', self.drawing_module.animation_loop)
+
+    def test_enable_collision_detection(self):
+        detector = self.drawing_module.enable_collision_detection()
+        self.assertIs(self.drawing_module.enable_collision_detection(), detector)
+        self.assertEqual(self.drawing_module.animation_loop.frame_hooks, [detector.on_frame])
+
+    def test_stop_rotation(self):
+        self.drawing_module.rotate_triangle((0, 0, 100, 0, 50, 100), (50, 50), 10.0)
+        self.drawing_module.stop_rotation()
+        self.assertEqual(len(self.drawing_module.animation_loop), 0)
+        self.canvas.after_cancel.assert_called_once()
+
+    def test_rotate_triangle_incremental_mode(self):
+        drawing_module = DrawingModule(self.canvas, closed_form=False)
+        drawing_module.rotate_triangle((0, 0, 100, 0, 50, 100), (50, 50), 0.0)
+        self.assertTrue(drawing_module.animation_loop.incremental[drawing_module.animation_loop.slots['triangle']])
+
+    def test_draw_shape_reuses_canvas_item(self):
+        self.canvas.create_polygon.return_value = 7
+        self.drawing_module.draw_shape('triangle', (0, 0, 100, 0, 50, 100))
+        self.drawing_module.draw_shape('triangle', (1, 1, 101, 1, 51, 101))
+        self.canvas.create_polygon.assert_called_once()
+        self.canvas.coords.assert_called_once_with(7, 1, 1, 101, 1, 51, 101)
+        self.canvas.delete.assert_not_called()
+
+    def test_remove_shape(self):
+        self.canvas.create_polygon.return_value = 7
+        self.drawing_module.draw_shape('triangle', (0, 0, 100, 0, 50, 100))
+        self.drawing_module.remove_shape('triangle')
+        self.canvas.delete.assert_called_once_with(7)
+        self.assertEqual(self.drawing_module.items, {})
+
+    def test_load_scene_replaces_previous_scene(self):
+        scene = Scene([(0, 0, 10, 0, 0, 10), (20, 20, 30, 20, 20, 30)], [(1, 1), (21, 21)], [90.0, -45.0])
+        self.drawing_module.load_scene(scene)
+        self.drawing_module.load_scene([Scene([(0, 0, 10, 0, 0, 10)], [(1, 1)], [10.0])])
+        self.assertEqual(self.drawing_module.scene_keys, ['scene0'])
+        self.assertEqual(self.drawing_module.animation_loop.keys, ['scene0'])
+        self.assertEqual(self.drawing_module.animation_loop.shape('scene0').speed, 10.0)
+
+    def test_recording_logs_scene_and_triangle_starts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'session.trsl')
+            self.drawing_module.start_recording(path)
+            self.drawing_module.load_scene(Scene([(0, 0, 10, 0, 0, 10)], [(1, 1)], [90.0]))
+            self.drawing_module.rotate_triangle((0, 0, 100, 0, 50, 100), (50, 50), 10.0)
+            self.drawing_module.stop_recording()
+            starts = SessionLog(path).starts()
+        self.assertEqual([(key, speed) for _, key, _, _, speed in starts], [('scene0', 90.0), ('triangle', 10.0)])
+
+    def test_instrumentation_enabled_on_demand(self):
+        self.assertEqual(self.drawing_module.animation_loop.frame_hooks, [])
+        self.drawing_module.toggle_overlay()
+        self.assertEqual(len(self.drawing_module.animation_loop.frame_hooks), 2)
+        self.assertTrue(self.drawing_module.overlay.visible)
+        self.drawing_module.toggle_overlay()
+        self.assertEqual(len(self.drawing_module.animation_loop.frame_hooks), 2)
+
+    def test_cached_trajectory_is_replayed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.dict(os.environ, {'ROTATION_TRAJECTORY_CACHE': directory}):
+                drawing_module = DrawingModule(self.canvas, cache_trajectories=True, cached_frames=10)
+                drawing_module.rotate_triangle((0, 0, 100, 0, 50, 100), (50, 50), 45.0)
+                DrawingModule(self.canvas, cache_trajectories=True, cached_frames=10).rotate_triangle(
+                    (0, 0, 100, 0, 50, 100), (50, 50), 45.0)
+            self.assertEqual(len(os.listdir(directory)), 1)
+        frames, dt = drawing_module.animation_loop.replays['triangle']
+        self.assertEqual(frames.shape, (10, 6))
+        self.assertEqual(dt, 0.02)
+
+    def test_unwritable_trajectory_cache_falls_back_to_computed_rotation(self):
+        drawing_module = DrawingModule(self.canvas, cache_trajectories=True, cached_frames=10)
+        drawing_module._trajectory_cache = Mock(load=Mock(side_effect=PermissionError('read-only')))
+        drawing_module.rotate_triangle((0, 0, 100, 0, 50, 100), (50, 50), 45.0)
+        self.assertIn('triangle', drawing_module.animation_loop)
+        self.assertNotIn('triangle', drawing_module.animation_loop.replays)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from src.frame_scheduler import FrameScheduler
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestFrameScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = FrameScheduler(50, clock=self.clock)
+
+    def test_tick_returns_dt(self):
+        self.clock.now = 0.02
+        self.assertAlmostEqual(self.scheduler.tick(), 0.02)
+        self.clock.now = 0.05
+        self.assertAlmostEqual(self.scheduler.tick(), 0.03)
+        self.assertAlmostEqual(self.scheduler.elapsed(), 0.05)
+
+    def test_late_frames_are_dropped(self):
+        self.clock.now = 0.0
+        self.scheduler.tick()
+        self.clock.now = 0.105
+        self.scheduler.tick()
+        self.assertEqual(self.scheduler.dropped_frames, 4)
+        self.assertEqual(self.scheduler.delay_ms(), 15)
+
+    def test_delay_ms_aligned_to_frame_grid(self):
+        self.clock.now = 0.004
+        self.scheduler.tick()
+        self.clock.now = 0.006
+        self.assertEqual(self.scheduler.delay_ms(), 14)
+
+    def test_achieved_fps_and_jitter(self):
+        for now in (0.0, 0.02, 0.04, 0.06):
+            self.clock.now = now
+            self.scheduler.tick()
+        self.assertAlmostEqual(self.scheduler.achieved_fps(), 50.0)
+        self.assertAlmostEqual(self.scheduler.jitter(), 0.0)
+        self.clock.now = 0.1
+        self.scheduler.tick()
+        self.assertLess(self.scheduler.achieved_fps(), 50.0)
+        self.assertGreater(self.scheduler.jitter(), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+import numpy as np
+from src.frame_stats import FrameStats, PerformanceOverlay
+
+class TestFrameStats(unittest.TestCase):
+
+    def setUp(self):
+        self.now = [0.0]
+        self.stats = FrameStats(capacity=4, clock=lambda: self.now[0])
+
+    def record_frames(self, count):
+        for i in range(count):
+            self.now[0] = i * 0.02
+            self.stats.record(0.001 * (i + 1), 0.001, 0.0, 10)
+
+    def test_ring_buffer_keeps_latest(self):
+        self.record_frames(6)
+        records = self.stats.snapshot()
+        self.assertEqual(len(records), 4)
+        np.testing.assert_allclose(records['compute_time'], (0.003, 0.004, 0.005, 0.006))
+
+    def test_summary(self):
+        self.record_frames(4)
+        summary = self.stats.summary()
+        self.assertAlmostEqual(summary['fps'], 50.0)
+        self.assertAlmostEqual(summary['p50'], 0.0035)
+        self.assertGreater(summary['p99'], summary['p50'])
+        self.assertEqual(FrameStats().summary(), {'fps': 0.0, 'p50': 0.0, 'p99': 0.0})
+
+    def test_dump(self):
+        self.record_frames(3)
+        with tempfile.TemporaryDirectory() as directory:
+            self.stats.dump(os.path.join(directory, 'stats.csv'))
+            self.stats.dump(os.path.join(directory, 'stats.npy'))
+            rows = np.loadtxt(os.path.join(directory, 'stats.csv'), delimiter=',', skiprows=1)
+            self.assertEqual(rows.shape, (3, 5))
+            self.assertEqual(len(np.load(os.path.join(directory, 'stats.npy'))), 3)
+
+class TestPerformanceOverlay(unittest.TestCase):
+
+    def test_toggle_and_throttled_refresh(self):
+        canvas = Mock()
+        now = [0.0]
+        overlay = PerformanceOverlay(canvas, FrameStats(), refresh_interval=0.5, clock=lambda: now[0])
+        overlay.on_frame(0.001, 0.001, 0.0, 1)
+        canvas.create_text.assert_not_called()
+        overlay.toggle()
+        canvas.create_text.assert_called_once()
+        for now[0] in (0.1, 0.2, 0.3, 0.6):
+            overlay.on_frame(0.001, 0.001, 0.0, 1)
+        self.assertEqual(canvas.itemconfigure.call_count, 1)
+        overlay.toggle()
+        canvas.delete.assert_called_once()
+        self.assertIsNone(overlay.item)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import Mock
+import numpy as np
+from src.controller_module import ControllerModule
+from src.hit_testing import point_in_triangle, points_in_triangles, points_in_own_triangles, hit_indices, pick_triangles
+
+class TestHitTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.triangles = np.array([(0, 0, 200, 0, 100, 100), (100, 0, 300, 0, 200, 100)])
+        self.points = np.array([(100, 0), (500, 500), (150, 20), (200, 100)])
+
+    def test_points_in_triangles_mask(self):
+        mask = points_in_triangles(self.points, self.triangles)
+        expected = [[True, True], [False, False], [True, True], [False, True]]
+        np.testing.assert_array_equal(mask, expected)
+
+    def test_matches_scalar_version(self):
+        controller = ControllerModule(Mock(), Mock(), Mock())
+        rng = np.random.default_rng(1)
+        points = rng.uniform(-50, 350, size=(200, 2))
+        mask = points_in_triangles(points, self.triangles, chunk_size=7)
+        for i, (x, y) in enumerate(points):
+            for j, triangle in enumerate(self.triangles):
+                self.assertEqual(mask[i, j], controller.point_in_triangle_cross_product(*triangle, x, y))
+                self.assertEqual(mask[i, j], point_in_triangle(*triangle, x, y))
+
+    def test_points_in_own_triangles_is_the_diagonal(self):
+        points = self.points[[0, 2]]
+        np.testing.assert_array_equal(points_in_own_triangles(points, self.triangles),
+                                      np.diag(points_in_triangles(points, self.triangles)))
+        self.assertEqual(points_in_own_triangles(np.empty((0, 2)), np.empty((0, 6))).shape, (0,))
+
+    def test_hit_indices(self):
+        point_indices, triangle_indices = hit_indices(self.points, self.triangles)
+        self.assertEqual(list(zip(point_indices, triangle_indices)), [(0, 0), (0, 1), (2, 0), (2, 1), (3, 1)])
+
+    def test_pick_triangles_returns_topmost(self):
+        np.testing.assert_array_equal(pick_triangles(self.points, self.triangles), [1, -1, 1, 1])
+        np.testing.assert_array_equal(pick_triangles(self.points, np.empty((0, 6))), [-1, -1, -1, -1])
+
+if __name__ == '__main__':
+    unittest.main()
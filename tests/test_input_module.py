@@ -37,6 +37,48 @@ class TestInputModule(unittest.TestCase):
         input_module.validate_input(event_mock)
         error_label.config.assert_called_with(text="Введите числовое значение!")
 
+    def test_validate_input_accepts_decimals_and_exponents(self):
+        error_label = Mock()
+        input_module = InputModule(error_label)
+        for text in ("-2.5", ".5", "1e3", "+4.", "-1.5E-2"):
+            input_module.validate_input(Mock(widget=Mock(get=Mock(return_value=text))))
+            error_label.config.assert_called_with(text="")
+
+    def test_schedule_validation_is_debounced(self):
+        error_label = Mock()
+        input_module = InputModule(error_label)
+        first = Mock(get=Mock(return_value="1"))
+        second = Mock(get=Mock(return_value="1x"))
+        for widget in (first, first, second):
+            input_module.schedule_validation(Mock(widget=widget))
+        self.assertEqual(error_label.after.call_count, 3)
+        self.assertEqual(error_label.after_cancel.call_count, 2)
+        error_label.config.assert_not_called()
+        input_module.validate_pending()
+        error_label.config.assert_called_once_with(text="Введите числовое значение!")
+        self.assertEqual(input_module.pending_entries, {})
+
+    def test_parse_bulk_input_reports_every_bad_line(self):
+        input_module = InputModule(Mock())
+        text = ("# x1,y1,x2,y2,x3,y3,cx,cy,speed\n"
+                "0,0,200,0,100,100,100,50,90\n"
+                "0,0,200,0,100,100,100,50\n"
+                "0; 0; 20; 0; 10; 10; 10; 5; 1e1\n"
+                "0,0,200,0,100,100,500,500,90\n"
+                "a,0,200,0,100,100,100,50,90\n")
+        records, errors = input_module.parse_bulk_input(text)
+        self.assertEqual(records[:, 8].tolist(), [90.0, 10.0])
+        self.assertEqual([number for number, _ in errors], [3, 5, 6])
+        self.assertEqual(errors[1], (5, "точка вращения вне треугольника"))
+
+    def test_report_bulk_errors_limits_listed_lines(self):
+        error_label = Mock()
+        InputModule(error_label).report_bulk_errors([(number, "ожидается 9 чисел") for number in range(1, 14)])
+        text = error_label.config.call_args[1]['text']
+        self.assertIn("строка 10: ожидается 9 чисел", text)
+        self.assertNotIn("строка 11", text)
+        self.assertIn("и еще 3 строк", text)
+
     def test_get_input_values(self):
         x1, y1, x2, y2, x3, y3 = "100", "200", "300", "400", "500", "600"
         speed_entry, center_x_entry, center_y_entry = "700", "800", "900"
@@ -0,0 +1,95 @@
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+from unittest.mock import patch
+import numpy as np
+from src.offline_renderer import rasterize_triangles, render_frames, write_png, export_png_sequence, export_gif
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+class TestOfflineRenderer(unittest.TestCase):
+
+    def test_rasterize_triangles(self):
+        frame = np.zeros((10, 10), dtype=np.uint8)
+        rasterize_triangles(frame, [(0, 0, 10, 0, 0, 10)])
+        self.assertEqual(frame[0, 0], 1)
+        self.assertEqual(frame[9, 9], 0)
+        self.assertEqual(frame.sum(), 55)
+
+    def test_render_frames_reuses_buffer(self):
+        frames = render_frames([(0, 0, 200, 0, 100, 100)], [(100, 50)], [90.0], 5, width=300, height=200)
+        buffers = [frame for frame in frames]
+        self.assertEqual(len(buffers), 5)
+        self.assertTrue(all(frame is buffers[0] for frame in buffers))
+        self.assertEqual(buffers[0].shape, (200, 300))
+
+    def test_write_png(self):
+        frame = np.zeros((4, 3), dtype=np.uint8)
+        frame[1, 2] = 1
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'frame.png')
+            write_png(path, frame)
+            with open(path, 'rb') as f:
+                data = f.read()
+        self.assertTrue(data.startswith(b'\x89PNG\r\n\x1a\n'))
+        width, height = struct.unpack('>II', data[16:24])
+        self.assertEqual((width, height), (3, 4))
+        idat_start = data.index(b'IDAT') + 4
+        idat_length = struct.unpack('>I', data[idat_start - 8:idat_start - 4])[0]
+        rows = np.frombuffer(zlib.decompress(data[idat_start:idat_start + idat_length]), dtype=np.uint8)
+        np.testing.assert_array_equal(rows.reshape(4, 4)[:, 1:], frame)
+
+    def test_export_png_sequence(self):
+        frames = render_frames([(0, 0, 20, 0, 10, 10)], [(10, 5)], [90.0], 3, width=30, height=20)
+        with tempfile.TemporaryDirectory() as directory:
+            count = export_png_sequence(frames, directory)
+            self.assertEqual(count, 3)
+            self.assertEqual(sorted(os.listdir(directory)), ['frame_00000.png', 'frame_00001.png', 'frame_00002.png'])
+
+    @unittest.skipIf(Image is None, "Pillow не установлен")
+    def test_export_gif(self):
+        frames = render_frames([(0, 0, 20, 0, 10, 10)], [(10, 5)], [90.0], 4, width=30, height=20)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'rotation.gif')
+            self.assertEqual(export_gif(frames, path), 4)
+            with Image.open(path) as image:
+                self.assertEqual(image.size, (30, 20))
+                self.assertEqual(image.n_frames, 4)
+
+    @unittest.skipIf(Image is None, "Pillow не установлен")
+    def test_export_gif_encodes_each_frame_before_reading_the_next(self):
+        from PIL import GifImagePlugin
+        getdata = GifImagePlugin.getdata
+        events = []
+
+        def frames():
+            for frame in render_frames([(0, 0, 20, 0, 10, 10)], [(10, 5)], [90.0], 5, width=30, height=20):
+                events.append('frame')
+                yield frame
+
+        def encode(*args, **kwargs):
+            events.append('encode')
+            return getdata(*args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as directory, patch.object(GifImagePlugin, 'getdata', encode):
+            path = os.path.join(directory, 'rotation.gif')
+            self.assertEqual(export_gif(frames(), path), 5)
+            with Image.open(path) as image:
+                self.assertEqual(image.n_frames, 5)
+        self.assertEqual(events, ['frame', 'encode'] * 5)
+
+    @unittest.skipIf(Image is None, "Pillow не установлен")
+    def test_export_gif_rejects_empty_frames(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'empty.gif')
+            with self.assertRaises(ValueError):
+                export_gif(iter(()), path)
+            self.assertFalse(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
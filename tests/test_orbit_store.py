@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from src.orbit_store import OrbitStore
+from src.rotation_engine import rotate_triangles
+
+class TestOrbitStore(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = ['a', 'b']
+        self.triangles = np.array([[0.0, 0, 10, 0, 0, 10], [5, 5, 15, 5, 5, 15]])
+        self.centers = np.array([[0.0, 0], [5, 5]])
+        self.speeds = np.array([90.0, 90.0 * np.sqrt(2)])
+
+    def test_plan_builds_tables_for_periodic_rotations(self):
+        store = OrbitStore()
+        store.plan(self.keys, np.arange(2), self.triangles, self.centers, self.speeds, 0.02)
+        self.assertIn('a', store)
+        self.assertNotIn('b', store)
+        self.assertEqual(len(store.tables['a']), 200)
+        self.assertEqual(store.size, store.tables['a'].nbytes)
+        store.drop('a')
+        self.assertEqual((store.tables, store.size), ({}, 0))
+
+    def test_apply_replays_frames_and_leaves_the_rest(self):
+        store = OrbitStore()
+        keys = ['a', 'c']
+        triangles = self.triangles[[0, 0]]
+        centers = self.centers[[0, 0]]
+        speeds = np.array([90.0, 45.0])
+        store.plan(keys, np.arange(2), triangles, centers, speeds, 0.02)
+        current = np.zeros((2, 6))
+        mask = store.apply(keys, np.array([True, True]), 1.0, current, speeds, np.zeros(2), np.zeros(2), 0.02)
+        self.assertEqual(mask.tolist(), [False, False])
+        np.testing.assert_allclose(current, rotate_triangles(triangles, centers, speeds * 1.0), atol=1e-9)
+
+    def test_zero_budget_disables_tables(self):
+        store = OrbitStore(budget=0)
+        store.plan(self.keys, np.arange(2), self.triangles, self.centers, self.speeds, 0.02)
+        self.assertEqual(store.tables, {})
+
+if __name__ == '__main__':
+    unittest.main()
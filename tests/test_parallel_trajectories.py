@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from src.parallel_trajectories import SharedArray, TrajectoryPool, _compute_block, precompute_trajectories
+from src.trajectory_cli import iter_trajectory_chunks, main
+
+class TestParallelTrajectories(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.triangles = rng.uniform(0, 700, size=(37, 6))
+        self.centers = rng.uniform(0, 700, size=(37, 2))
+        self.speeds = rng.uniform(-720, 720, size=37)
+
+    def test_bit_identical_to_single_process(self):
+        expected = np.concatenate(list(iter_trajectory_chunks(self.triangles, self.centers, self.speeds, 50, 0.02)))
+        actual = precompute_trajectories(self.triangles, self.centers, self.speeds, 50, 0.02, processes=2)
+        self.assertEqual(actual.tobytes(), expected.tobytes())
+
+    def test_iter_chunks_reuses_buffer(self):
+        expected = list(iter_trajectory_chunks(self.triangles, self.centers, self.speeds, 10, 0.5, chunk_size=4))
+        with TrajectoryPool(self.triangles, self.centers, self.speeds, processes=2) as pool:
+            chunks = [chunk.copy() for chunk in pool.iter_chunks(10, 0.5, chunk_size=4)]
+        self.assertEqual([chunk.shape for chunk in chunks], [(4, 37, 6), (4, 37, 6), (2, 37, 6)])
+        for actual, chunk in zip(chunks, expected):
+            self.assertEqual(actual.tobytes(), chunk.tobytes())
+
+    def test_shared_array_attach(self):
+        with SharedArray.create((2, 3)) as shared:
+            shared.array[:] = 7.0
+            attached = SharedArray.attach(shared.name, (2, 3))
+            np.testing.assert_array_equal(attached.array, np.full((2, 3), 7.0))
+            attached.close()
+
+    def test_task_computes_its_frame_range(self):
+        expected = np.concatenate(list(iter_trajectory_chunks(self.triangles, self.centers, self.speeds, 9, 0.02)))
+        with SharedArray.create((37, 9)) as records, SharedArray.create((4, 37, 6)) as output:
+            records.array[:] = np.column_stack([self.triangles, self.centers, self.speeds])
+            self.assertEqual(_compute_block((records.name, (37, 9), output.name, (4, 37, 6), 5, 20, 5, 9, 0.02, 0)), 15)
+            self.assertEqual(output.array[:, 5:20].tobytes(), expected[5:9, 5:20].tobytes())
+
+    def test_failed_pool_does_not_leak_shared_memory(self):
+        with patch.object(SharedArray, 'create', wraps=SharedArray.create) as create:
+            with self.assertRaises(ValueError):
+                TrajectoryPool(self.triangles, self.centers, self.speeds, processes=-2)
+            with self.assertRaises(ValueError):
+                TrajectoryPool(self.triangles, self.centers[:5], self.speeds, processes=2)
+        create.assert_not_called()
+
+    def test_cli_processes_option(self):
+        with tempfile.TemporaryDirectory() as directory:
+            single = os.path.join(directory, 'single.npy')
+            parallel = os.path.join(directory, 'parallel.npy')
+            arguments = ['--triangle', '0', '0', '200', '0', '100', '100', '--center', '100', '50', '--speed', '37.5',
+                         '--frames', '20', '--format', 'npy', '--chunk-size', '7']
+            main(arguments + ['--output', single])
+            main(arguments + ['--output', parallel, '--processes', '2'])
+            self.assertEqual(np.load(single).tobytes(), np.load(parallel).tobytes())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from src.polygon_store import PolygonStore
+from src.visibility import VisibilityFilter
+
+class TestPolygonStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = PolygonStore()
+        self.store.start('p', (10, 0, 0, 10, -10, 0, 0, -10), (0, 0), 90.0, 0.0)
+
+    def test_frame_rotates_running_polygons(self):
+        drawn, count = self.store.frame(1.0)
+        self.assertEqual(count, 1)
+        self.assertEqual([key for key, _ in drawn], ['p'])
+        np.testing.assert_allclose(drawn[0][1], [0, 10, -10, 0, 0, -10, 10, 0], atol=1e-9)
+
+    def test_pause_resume_and_rebase(self):
+        self.store.pause('p', 1.0)
+        self.assertFalse(self.store.has_running())
+        self.assertEqual(self.store.frame(2.0), ([], 0))
+        self.assertTrue(self.store.resume('p', 2.0))
+        self.assertFalse(self.store.resume('p', 2.0))
+        self.store.rebase('p', 3.0, speed=0.0)
+        np.testing.assert_allclose(self.store['p'].vertices, [[-10, 0], [0, -10], [10, 0], [0, 10]], atol=1e-9)
+        self.assertEqual(self.store['p'].base_angle, 0.0)
+
+    def test_visibility_skips_unchanged_polygons(self):
+        self.store.start('q', (0, 0, 1, 0, 0, 1), (0, 0), 0.0, 0.0)
+        drawn, count = self.store.frame(1.0, VisibilityFilter(min_pixel_change=0.5))
+        self.assertEqual(([key for key, _ in drawn], count), (['p'], 2))
+
+    def test_start_rejects_empty_polygon_and_drop(self):
+        with self.assertRaises(ValueError):
+            self.store.start('e', (), (0, 0), 1.0, 0.0)
+        self.assertTrue(self.store.drop('p'))
+        self.assertFalse(self.store.drop('p'))
+        self.assertEqual(len(self.store), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+from src.rotation_engine import (rotate_triangles, rotation_angles, batch_trajectories,
+                                 rotate_vertices, orbit_period, orbit_tables)
+
+class TestRotationEngine(unittest.TestCase):
+
+    def test_rotate_triangles_no_rotation(self):
+        triangle = (0, 0, 100, 0, 50, 100)
+        result = rotate_triangles(triangle, (50, 50), 0.0)
+        np.testing.assert_allclose(result, triangle)
+
+    def test_rotate_triangles_quarter_turn(self):
+        result = rotate_triangles((10, 0, 0, 0, 0, 10), (0, 0), 90.0)
+        np.testing.assert_allclose(result, (0, 10, 0, 0, -10, 0), atol=1e-12)
+
+    def test_rotation_angles_shape_and_range(self):
+        angles = rotation_angles([90.0, -90.0], [0.0, 1.0, 5.0])
+        self.assertEqual(angles.shape, (3, 2))
+        np.testing.assert_allclose(angles[2], (90.0, 270.0))
+
+    def test_batch_trajectories_shape_and_layout(self):
+        triangles = np.array([[0, 0, 100, 0, 50, 100], [10, 10, 20, 10, 15, 20]])
+        centers = np.array([[50, 50], [15, 15]])
+        trajectories = batch_trajectories(triangles, centers, [45.0, 10.0], np.arange(4))
+        self.assertEqual(trajectories.shape, (4, 2, 6))
+        self.assertTrue(trajectories.flags['C_CONTIGUOUS'])
+        np.testing.assert_allclose(trajectories[0], triangles)
+        np.testing.assert_allclose(trajectories[3, 0], rotate_triangles(triangles[0], centers[0], 135.0))
+
+    def test_closed_form_error_bounded_after_million_frames(self):
+        triangle = np.array((0, 0, 100, 0, 50, 100), dtype=float)
+        center = np.array((50.0, 50.0))
+        speed = 7.3
+        radii = np.hypot(triangle[0::2] - center[0], triangle[1::2] - center[1])
+        max_error = 0.0
+        for start in range(0, 10 ** 6 + 1, 100000):
+            frames = np.arange(start, min(start + 100000, 10 ** 6 + 1))
+            rotated = rotate_triangles(triangle, center, np.mod(speed * frames, 360.0))
+            rotated_radii = np.hypot(rotated[:, 0::2] - center[0], rotated[:, 1::2] - center[1])
+            max_error = max(max_error, np.abs(rotated_radii - radii).max())
+        self.assertLess(max_error, 1e-9)
+        last = rotated[-1]
+        centroid_offset = np.hypot(*(triangle.reshape(3, 2).mean(axis=0) - center))
+        self.assertAlmostEqual(np.hypot(*(last.reshape(3, 2).mean(axis=0) - center)), centroid_offset, places=9)
+
+    def test_rotate_vertices_bit_identical_to_rotate_triangles(self):
+        rng = np.random.default_rng(2)
+        triangles = rng.uniform(0, 700, size=(20, 6))
+        centers = rng.uniform(0, 700, size=(20, 2))
+        angles = rng.uniform(0, 360, size=20)
+        x, y = rotate_vertices(triangles[:, 0::2].T, triangles[:, 1::2].T, centers[:, 0], centers[:, 1], angles)
+        expected = rotate_triangles(triangles, centers, angles)
+        self.assertEqual(x.T.tobytes(), np.ascontiguousarray(expected[:, 0::2]).tobytes())
+        self.assertEqual(y.T.tobytes(), np.ascontiguousarray(expected[:, 1::2]).tobytes())
+
+    def test_orbit_period(self):
+        self.assertEqual(orbit_period(90.0 * 0.02), 200)
+        self.assertEqual(orbit_period(37.5 * 0.02), 480)
+        self.assertEqual(orbit_period(-45.0 * 0.02), 400)
+        self.assertEqual(orbit_period(0.0), 1)
+        self.assertIsNone(orbit_period(np.sqrt(2.0)))
+        self.assertIsNone(orbit_period(1.0 * 0.02))
+        self.assertEqual(orbit_period(1.0 * 0.02, max_period=18000), 18000)
+
+    def test_orbit_table_closes_the_cycle(self):
+        triangle = (0, 0, 100, 0, 50, 100)
+        table = orbit_tables([triangle], [(50, 50)], [37.5], 0.02, 480)
+        self.assertEqual(table.shape, (480, 1, 6))
+        np.testing.assert_allclose(rotate_triangles(triangle, (50, 50), 37.5 * 0.02 * 480), table[0, 0], atol=1e-9)
+        self.assertEqual(table.tobytes(), batch_trajectories([triangle], [(50, 50)], [37.5], np.arange(480) * 0.02).tobytes())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.scene import Scene, Triangle, load_scene, save_scene, iter_scene_chunks, open_binary_scene
+
+class TestScene(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.scene = Scene(rng.uniform(0, 700, size=(10, 6)), rng.uniform(0, 700, size=(10, 2)),
+                           rng.uniform(-90, 90, size=10))
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def assert_scene_equal(self, actual, expected, **kwargs):
+        np.testing.assert_allclose(actual.to_records(), expected.to_records(), **kwargs)
+
+    def test_round_trip_all_formats(self):
+        for name in ('scene.csv', 'scene.jsonl', 'scene.trsc'):
+            save_scene(self.scene, self.path(name))
+            self.assert_scene_equal(load_scene(self.path(name)), self.scene)
+
+    def test_float32_binary(self):
+        save_scene(self.scene, self.path('scene.trsc'), item_size=4)
+        self.assertEqual(open_binary_scene(self.path('scene.trsc')).dtype, np.float32)
+        self.assert_scene_equal(load_scene(self.path('scene.trsc')), self.scene, rtol=1e-6)
+
+    def test_chunked_reading(self):
+        for name in ('scene.csv', 'scene.jsonl', 'scene.trsc'):
+            save_scene(self.scene, self.path(name))
+            chunks = list(iter_scene_chunks(self.path(name), chunk_size=4))
+            self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+            self.assert_scene_equal(Scene.concatenate(chunks), self.scene)
+
+    def test_csv_without_header_and_with_comments(self):
+        with open(self.path('scene.csv'), 'w') as f:
+            f.write('# comment\n0,0,200,0,100,100,100,50,90\n\n1,1,2,1,1,2,1,1,-10\n')
+        scene = load_scene(self.path('scene.csv'))
+        self.assertEqual(len(scene), 2)
+        self.assertEqual(scene.speeds.tolist(), [90.0, -10.0])
+
+    def test_bad_inputs(self):
+        with open(self.path('scene.jsonl'), 'w') as f:
+            f.write('{"triangle": [0, 0, 1, 0, 0, 1], "center": [0, 0]}\n')
+        with self.assertRaisesRegex(ValueError, 'scene.jsonl:1'):
+            load_scene(self.path('scene.jsonl'))
+        with open(self.path('scene.csv'), 'w') as f:
+            f.write('0,0,200,0,100,100,100,50,90\n0,0,1,0,0,1\n0,0,1,0,0,1\n0,0,1,0,0,1\n')
+        with self.assertRaisesRegex(ValueError, 'scene.csv:2'):
+            load_scene(self.path('scene.csv'))
+        with open(self.path('scene.csv'), 'w') as f:
+            f.write('0,0,1,0,0,1\n0,0,1,0,0,1\n0,0,1,0,0,1\n')
+        with self.assertRaisesRegex(ValueError, 'scene.csv:1'):
+            load_scene(self.path('scene.csv'))
+        with open(self.path('scene.csv'), 'w') as f:
+            f.write('x1,y1,x2,y2,x3,y3,cx,cy,speed\n' + '0,0,1,0,0,1,0,0,1\n' * 2 + '0,0,1,0,abc,1,0,0,1\n')
+        with self.assertRaisesRegex(ValueError, 'scene.csv:4:'):
+            load_scene(self.path('scene.csv'))
+        with self.assertRaises(ValueError):
+            Scene.from_records(np.zeros((3, 6)))
+        with open(self.path('scene.trsc'), 'wb') as f:
+            f.write(b'XXXX' + bytes(12))
+        with self.assertRaises(ValueError):
+            load_scene(self.path('scene.trsc'))
+        with self.assertRaises(ValueError):
+            load_scene(self.path('scene.xyz'))
+
+    def test_structure_of_arrays_layout(self):
+        records = self.scene.to_records()
+        self.assertTrue(self.scene.data.flags['C_CONTIGUOUS'])
+        np.testing.assert_array_equal(self.scene.x, records[:, 0:6:2].T)
+        np.testing.assert_array_equal(self.scene.y, records[:, 1:6:2].T)
+        np.testing.assert_array_equal(self.scene.triangles, records[:, 0:6])
+        np.testing.assert_array_equal(self.scene.centers, records[:, 6:8])
+
+    def test_triangle_view_writes_through(self):
+        triangle = self.scene[-1]
+        self.assertIsInstance(triangle, Triangle)
+        self.assertFalse(hasattr(triangle, '__dict__'))
+        triangle.vertices = (0, 0, 10, 0, 0, 10)
+        triangle.center = (1, 2)
+        triangle.speed = 45.0
+        self.assertEqual(self.scene.to_records()[-1].tolist(), [0, 0, 10, 0, 0, 10, 1, 2, 45])
+        self.assertTrue(triangle.contains(2, 2))
+        self.assertFalse(triangle.contains(20, 20))
+        with self.assertRaises(IndexError):
+            self.scene[10]
+
+    def test_append_and_remove_keep_order(self):
+        scene = Scene()
+        for index in range(40):
+            self.assertEqual(scene.append((index, 0, 1, 0, 0, 1), (0, 0), index), index)
+        scene.remove([0, 5])
+        self.assertEqual(len(scene), 38)
+        self.assertEqual(scene.speeds[:5].tolist(), [1, 2, 3, 4, 6])
+        scene.extend(self.scene)
+        self.assert_scene_equal(Scene.from_records(scene.to_records()[38:]), self.scene)
+
+    def test_float32_storage(self):
+        save_scene(self.scene, self.path('scene.csv'))
+        scene = load_scene(self.path('scene.csv'), dtype=np.float32)
+        self.assertEqual(scene.data.dtype, np.float32)
+        self.assertEqual(scene.data.nbytes * 2, Scene.from_records(scene.to_records()).data.nbytes)
+        self.assert_scene_equal(scene, self.scene, rtol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+import numpy as np
+from src.animation_loop import AnimationLoop
+from src.frame_scheduler import FrameScheduler
+from src.scene import Scene
+from src.session_log import RECORD, SESSION_HEADER, SessionLog, SessionPlayer, SessionRecorder
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestSessionLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'session.trsl')
+        self.clock = FakeClock()
+        self.loop = AnimationLoop(Mock(), Mock(), Mock(), scheduler=FrameScheduler(50, clock=self.clock))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, frame_count=120, keyframe_interval=16):
+        rng = np.random.default_rng(0)
+        triangles = rng.uniform(0, 700, size=(20, 6))
+        scene = Scene(triangles, triangles.reshape(20, 3, 2).mean(axis=1), rng.uniform(-90, 90, size=20))
+        expected = []
+        with SessionRecorder(self.path, keyframe_interval=keyframe_interval, buffer_records=64) as recorder:
+            recorder.attach(self.loop)
+            self.loop.start('triangle', (0, 0, 200, 0, 100, 100), (100, 50), 90.0)
+            self.loop.start_scene([f'scene{index}' for index in range(20)], scene)
+            for number in range(frame_count):
+                self.clock.now += 0.02
+                if number == 50:
+                    self.loop.stop_many(['scene3', 'scene4'])
+                if number == 70:
+                    self.loop.pause('scene5')
+                self.loop.frame()
+                expected.append(dict(zip(self.loop.keys, self.loop.current[:len(self.loop.keys)].tolist())))
+        self.assertEqual(self.loop.frame_hooks, [])
+        return expected
+
+    def decoded(self, log, shapes, coords):
+        return {log.names[shape]: flat for shape, flat in zip(shapes.tolist(), coords.tolist())}
+
+    def test_seek_reconstructs_every_frame(self):
+        expected = self.record()
+        log = SessionLog(self.path)
+        self.assertEqual(len(log), 120)
+        for number in (0, 1, 15, 16, 17, 51, 119, 64, 3):
+            time, shapes, coords = log.frame(number)
+            self.assertAlmostEqual(time, 0.02 * (number + 1))
+            decoded = self.decoded(log, shapes, coords)
+            self.assertEqual(set(decoded), set(expected[number]))
+            for key, flat in decoded.items():
+                np.testing.assert_allclose(flat, expected[number][key], atol=0.5 / log.scale)
+
+    def test_sequential_replay_matches_seek(self):
+        self.record()
+        log = SessionLog(self.path)
+        for number, time, shapes, coords in log.iter_frames(10, 40):
+            _, seek_shapes, seek_coords = log.frame(number)
+            np.testing.assert_array_equal(shapes, seek_shapes)
+            np.testing.assert_array_equal(coords, seek_coords)
+
+    def test_log_is_compact_fixed_size_records(self):
+        self.record()
+        size = os.path.getsize(self.path) - SESSION_HEADER.itemsize
+        self.assertEqual(size % RECORD.itemsize, 0)
+        self.assertLess(size, 120 * 21 * 6 * 8 / 2)
+
+    def test_start_inputs_are_recorded(self):
+        self.record()
+        starts = SessionLog(self.path).starts()
+        self.assertEqual(starts[0], (-1, 'triangle', (0.0, 0.0, 200.0, 0.0, 100.0, 100.0), (100.0, 50.0), 90.0))
+        self.assertEqual([start[1] for start in starts[1:]], [f'scene{index}' for index in range(20)])
+        rng = np.random.default_rng(0)
+        triangles = rng.uniform(0, 700, size=(20, 6))
+        self.assertEqual(starts[5][0], -1)
+        self.assertEqual(starts[5][2], tuple(triangles[4].tolist()))
+        self.assertEqual(starts[5][3], tuple(triangles[4].reshape(3, 2).mean(axis=0).tolist()))
+        self.assertEqual(self.loop.start_hooks, [])
+
+    def test_player_draws_faster_than_real_time(self):
+        self.record(frame_count=5)
+        canvas = Mock()
+        draw_shape = Mock()
+        remove_shape = Mock()
+        player = SessionPlayer(canvas, draw_shape, remove_shape, SessionLog(self.path), speed=4.0)
+        player.start(3)
+        self.assertEqual(draw_shape.call_count, 21)
+        canvas.after.assert_called_once_with(5, player.step)
+        player.step()
+        player.stop()
+        self.assertEqual(remove_shape.call_count, 21)
+
+    def test_polygons_are_recorded_and_replayed(self):
+        expected = []
+        with SessionRecorder(self.path, keyframe_interval=8) as recorder:
+            recorder.attach(self.loop)
+            self.loop.start('triangle', (0, 0, 200, 0, 100, 100), (100, 50), 90.0)
+            self.loop.start_polygon('pentagon', (100, 0, 200, 50, 180, 150, 20, 150, 0, 50), (100, 80), -45.0)
+            for number in range(30):
+                self.clock.now += 0.02
+                if number == 10:
+                    self.loop.start_polygon('triangle', (0, 0, 100, 0, 100, 100, 0, 100), (50, 50), 30.0)
+                if number == 20:
+                    self.loop.pause('pentagon')
+                self.loop.frame()
+                outlines = dict(zip(self.loop.keys, self.loop.current[:len(self.loop.keys)].tolist()))
+                outlines.update(zip(self.loop.polygons.keys, self.loop.polygons.current.coords()))
+                expected.append(outlines)
+        log = SessionLog(self.path)
+        self.assertEqual(len(log.starts()), 1)
+        for number in (0, 9, 10, 11, 25, 29):
+            _, shapes, coords = log.frame(number)
+            decoded = {log.names[shape]: flat for shape, flat in log.outlines(shapes, coords)}
+            self.assertEqual(set(decoded), set(expected[number]))
+            for key, flat in decoded.items():
+                self.assertEqual(len(flat), len(expected[number][key]))
+                np.testing.assert_allclose(flat, expected[number][key], atol=0.5 / log.scale)
+        draw_shape = Mock()
+        player = SessionPlayer(Mock(), draw_shape, Mock(), log, prefix='')
+        player.start(29)
+        drawn = {log.names[int(key)]: flat for (key, flat), _ in draw_shape.call_args_list}
+        self.assertEqual(len(drawn['triangle']), 8)
+        self.assertEqual(len(drawn['pentagon']), 10)
+
+    def test_invalid_file_rejected(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a session log')
+        with self.assertRaises(ValueError):
+            SessionLog(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
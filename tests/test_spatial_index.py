@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+from src.hit_testing import pick_triangles
+from src.spatial_index import UniformGrid
+
+class TestUniformGrid(unittest.TestCase):
+
+    def test_query_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        corners = rng.uniform(0, 700, size=(300, 1, 2))
+        triangles = (corners + rng.uniform(-40, 40, size=(300, 3, 2))).reshape(300, 6)
+        points = rng.uniform(-20, 720, size=(500, 2))
+        grid = UniformGrid(cell_size=50)
+        grid.build(triangles)
+        np.testing.assert_array_equal(grid.query_points(points), pick_triangles(points, triangles))
+
+    def test_candidates_only_nearby(self):
+        grid = UniformGrid(cell_size=10)
+        grid.build([(0, 0, 5, 0, 0, 5), (100, 100, 105, 100, 100, 105)])
+        self.assertEqual(list(grid.candidates(1, 1)), [0])
+        self.assertEqual(len(grid.candidates(50, 50)), 0)
+        self.assertEqual(len(grid.candidates(-500, 1)), 0)
+
+    def test_empty_index(self):
+        grid = UniformGrid()
+        self.assertEqual(grid.query(10, 10), -1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import importlib.util
+import unittest
+from pathlib import Path
+
+def load_benchmark(name):
+    path = Path(__file__).resolve().parent.parent / 'benchmarks' / f'{name}.py'
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+bench_startup = load_benchmark('bench_startup')
+measure_imports = bench_startup.measure_imports
+STARTUP_MODULES = bench_startup.STARTUP_MODULES
+STARTUP_BUDGET_MS = bench_startup.STARTUP_BUDGET_MS
+
+class TestStartup(unittest.TestCase):
+
+    def setUp(self):
+        self.timings = min((measure_imports() for _ in range(3)),
+                           key=lambda timings: sum(timings.get(module, 0) for module in STARTUP_MODULES))
+
+    def test_heavy_dependencies_not_imported(self):
+        for module in ('requests', 'urllib3', 'ssl', 'numpy'):
+            self.assertNotIn(module, self.timings)
+
+    def test_startup_within_budget(self):
+        total = sum(self.timings[module] for module in STARTUP_MODULES) / 1000
+        self.assertLess(total, STARTUP_BUDGET_MS)
+
+if __name__ == '__main__':
+    unittest.main()
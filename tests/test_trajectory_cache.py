@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from src.trajectory_cache import TrajectoryCache, trajectory_key
+from src.trajectory_cli import iter_trajectory_chunks
+
+class TestTrajectoryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = TrajectoryCache(self.directory.name, chunk_size=16)
+        self.parameters = ([(0, 0, 200, 0, 100, 100)], [(100, 50)], [37.5])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key_depends_on_every_parameter(self):
+        key = trajectory_key(*self.parameters, 0.02, 100)
+        self.assertEqual(key, trajectory_key(*self.parameters, 0.02, 100))
+        self.assertNotEqual(key, trajectory_key(*self.parameters, 0.02, 101))
+        self.assertNotEqual(key, trajectory_key(*self.parameters, 0.01, 100))
+        self.assertNotEqual(key, trajectory_key([(0, 0, 200, 0, 100, 101)], [(100, 50)], [37.5], 0.02, 100))
+        self.assertNotEqual(key, trajectory_key([(0, 0, 200, 0, 100, 100)], [(100, 51)], [37.5], 0.02, 100))
+        self.assertNotEqual(key, trajectory_key([(0, 0, 200, 0, 100, 100)], [(100, 50)], [37.0], 0.02, 100))
+
+    def test_miss_then_hit_without_recomputing(self):
+        frames = self.cache.load(*self.parameters, 0.02, 100)
+        expected = np.concatenate(list(iter_trajectory_chunks(*self.parameters, 100, 0.02)))
+        self.assertEqual(np.asarray(frames).tobytes(), expected.tobytes())
+        with patch('src.trajectory_cache.iter_trajectory_chunks') as compute:
+            cached = self.cache.load(*self.parameters, 0.02, 100)
+        compute.assert_not_called()
+        self.assertIsInstance(cached, np.memmap)
+        self.assertFalse(cached.flags.writeable)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_failed_replace_removes_temporary_file(self):
+        with patch('src.trajectory_cache.os.replace', side_effect=PermissionError('read-only')):
+            with self.assertRaises(PermissionError):
+                self.cache.load(*self.parameters, 0.02, 100)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_lru_eviction_respects_size_cap(self):
+        keys = []
+        for index, speed in enumerate((10.0, 20.0, 30.0)):
+            self.cache.load([(0, 0, 1, 0, 0, 1)], [(0, 0)], [speed], 0.02, 100)
+            keys.append(trajectory_key([(0, 0, 1, 0, 0, 1)], [(0, 0)], [speed], 0.02, 100))
+            os.utime(self.cache.path(keys[-1]), ns=(index * 10 ** 9, index * 10 ** 9))
+        file_size = os.path.getsize(self.cache.path(keys[0]))
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.cache.max_bytes = 2 * file_size
+        self.cache.evict()
+        self.assertTrue(os.path.exists(self.cache.path(keys[0])))
+        self.assertFalse(os.path.exists(self.cache.path(keys[1])))
+        self.assertTrue(os.path.exists(self.cache.path(keys[2])))
+        self.assertLessEqual(self.cache.size(), self.cache.max_bytes)
+        self.cache.clear()
+        self.assertEqual(self.cache.size(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+import numpy as np
+from src.animation_loop import AnimationLoop
+from src.frame_scheduler import FrameScheduler
+from src.scene import Scene, save_scene
+from src.trajectory_cli import iter_trajectory, write_npy, iter_trajectory_chunks, main
+
+class TestTrajectoryCli(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_matches_animation_loop_exactly(self):
+        now = [0.0]
+        draw_shape = Mock()
+        loop = AnimationLoop(Mock(), draw_shape, Mock(), scheduler=FrameScheduler(50, clock=lambda: now[0]))
+        loop.start('triangle', (0, 0, 200, 0, 100, 100), (100, 50), 37.5)
+        frames = list(iter_trajectory([(0, 0, 200, 0, 100, 100)], [(100, 50)], [37.5], 400, 0.02, chunk_size=64))
+        for frame in (1, 5, 123, 399):
+            now[0] = frame * 0.02
+            loop.frame()
+            self.assertEqual(draw_shape.call_args[0][1], frames[frame][0].tolist())
+
+    def test_chunks_bounded(self):
+        chunks = list(iter_trajectory_chunks([(0, 0, 1, 0, 0, 1)], [(0, 0)], [10.0], 10, 0.1, chunk_size=4))
+        self.assertEqual([chunk.shape for chunk in chunks], [(4, 1, 6), (4, 1, 6), (2, 1, 6)])
+
+    def test_npy_output(self):
+        main(['--triangle', '0', '0', '200', '0', '100', '100', '--center', '100', '50', '--speed', '90',
+              '--frames', '10', '--dt', '0.5', '--format', 'npy', '--output', self.path('out.npy'), '--chunk-size', '3'])
+        trajectory = np.load(self.path('out.npy'))
+        self.assertEqual(trajectory.shape, (10, 1, 6))
+        np.testing.assert_allclose(trajectory[2, 0], (150, -50, 150, 150, 50, 50), atol=1e-9)
+        np.testing.assert_allclose(trajectory[4, 0], (200, 100, 0, 100, 100, 0), atol=1e-9)
+
+    def test_csv_output_from_scene(self):
+        save_scene(Scene([(0, 0, 10, 0, 0, 10), (5, 5, 6, 5, 5, 6)], [(1, 1), (5, 5)], [90.0, 0.0]), self.path('s.csv'))
+        main(['--scene', self.path('s.csv'), '--frames', '3', '--output', self.path('out.csv')])
+        rows = np.loadtxt(self.path('out.csv'), delimiter=',', skiprows=1)
+        self.assertEqual(rows.shape, (3, 13))
+        np.testing.assert_array_equal(rows[:, 0], (0, 1, 2))
+        np.testing.assert_allclose(rows[:, 7:], [(5, 5, 6, 5, 5, 6)] * 3)
+
+    def test_rejects_invalid_arguments(self):
+        save_scene(Scene([(0, 0, 10, 0, 0, 10)], [(1, 1)], [90.0]), self.path('s.csv'))
+        for argv in (['--triangle', '0', '0', '1', '0', '0', '1', '--center', '0', '0', '--speed', '1', '--frames', '-1'],
+                     ['--scene', self.path('s.csv'), '--speed', '10', '--frames', '3'],
+                     ['--scene', self.path('s.csv'), '--center', '1', '1', '--frames', '3'],
+                     ['--scene', self.path('s.csv'), '--frames', '3', '--processes', '-2'],
+                     ['--scene', self.path('s.csv'), '--frames', '3', '--chunk-size', '0'],
+                     ['--scene', self.path('s.csv'), '--frames', '3', '--chunk-size', '-5']):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                main(argv + ['--output', self.path('out.csv')])
+        self.assertFalse(os.path.exists(self.path('out.csv')))
+
+    def test_write_npy_header(self):
+        stream = io.BytesIO()
+        write_npy(iter([np.zeros((2, 1, 6))]), stream, 2, 1)
+        stream.seek(0)
+        self.assertEqual(np.load(stream).shape, (2, 1, 6))
+
+if __name__ == '__main__':
+    unittest.main()
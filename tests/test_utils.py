@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.utils import VersionChecker
+
+class StubReleaseHandler(BaseHTTPRequestHandler):
+    delay = 0.0
+    requests_served = 0
+    release = {"tag_name": "v9.9.9"}
+
+    def do_GET(self):
+        StubReleaseHandler.requests_served += 1
+        time.sleep(self.delay)
+        body = json.dumps(self.release).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class FakeRoot:
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay, callback, *args):
+        self.callbacks.append((callback, args))
+
+    def run_until(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and self.callbacks and time.monotonic() < deadline:
+            callback, args = self.callbacks.pop(0)
+            time.sleep(0.01)
+            callback(*args)
+
+class TestVersionChecker(unittest.TestCase):
+
+    def setUp(self):
+        StubReleaseHandler.delay = 0.0
+        StubReleaseHandler.requests_served = 0
+        StubReleaseHandler.release = {"tag_name": "v9.9.9"}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubReleaseHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/releases/latest"
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.directory.name, "version.json")
+        self.results = []
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def make_checker(self, **kwargs):
+        return VersionChecker(url=self.url, cache_path=self.cache_path, **kwargs)
+
+    def collect(self, version, error):
+        self.results.append((version, error))
+
+    def test_check_fetches_in_background_and_caches(self):
+        checker = self.make_checker()
+        root = FakeRoot()
+        checker.check(root, self.collect)
+        checker.check(root, self.collect)
+        self.assertEqual(self.results, [])
+        root.run_until(lambda: len(self.results) == 2)
+        self.assertEqual(self.results, [("v9.9.9", None), ("v9.9.9", None)])
+        self.assertEqual(StubReleaseHandler.requests_served, 1)
+        self.assertEqual(checker.read_cache(), "v9.9.9")
+
+    def test_cache_hit_skips_network(self):
+        checker = self.make_checker()
+        checker.write_cache("v1.0")
+        checker.check(FakeRoot(), self.collect)
+        self.assertEqual(self.results, [("v1.0", None)])
+        self.assertEqual(StubReleaseHandler.requests_served, 0)
+
+    def test_stale_cache_ignored(self):
+        now = [1000.0]
+        checker = self.make_checker(ttl=60, clock=lambda: now[0])
+        checker.write_cache("v1.0")
+        now[0] += 61
+        self.assertIsNone(checker.read_cache())
+
+    def test_timeout_reports_error(self):
+        StubReleaseHandler.delay = 1.0
+        checker = self.make_checker(timeout=0.1)
+        root = FakeRoot()
+        started = time.monotonic()
+        checker.check(root, self.collect)
+        root.run_until(lambda: self.results)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertIsNone(self.results[0][0])
+        self.assertIsNotNone(self.results[0][1])
+
+    def test_missing_tag_is_not_cached(self):
+        StubReleaseHandler.release = {}
+        checker = self.make_checker()
+        root = FakeRoot()
+        checker.check(root, self.collect)
+        root.run_until(lambda: self.results)
+        self.assertEqual(self.results, [(None, None)])
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_any_fetch_error_ends_polling(self):
+        checker = self.make_checker()
+        root = FakeRoot()
+        with patch.object(checker, 'fetch', side_effect=ImportError("No module named 'requests'")):
+            checker.check(root, self.collect)
+            root.run_until(lambda: self.results)
+        self.assertIsInstance(self.results[0][1], ImportError)
+        self.assertEqual(root.callbacks, [])
+        self.assertIsNone(checker.pending)
+
+if __name__ == '__main__':
+    unittest.main()
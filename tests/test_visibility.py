@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from src.visibility import VisibilityFilter, polygon_bounds, triangle_bounds
+
+class TestVisibility(unittest.TestCase):
+
+    def test_bounds(self):
+        bounds = triangle_bounds(np.array([[0.0, 5, 10, 0, 4, 8]]))
+        self.assertEqual([b.tolist() for b in bounds], [[0.0], [0.0], [10.0], [8.0]])
+        vertices = np.array([[0.0, 0], [2, 3], [5, 5], [7, 1], [6, 9]])
+        bounds = polygon_bounds(vertices, np.array([0, 2]))
+        self.assertEqual([b.tolist() for b in bounds], [[0.0, 5.0], [0.0, 1.0], [2.0, 7.0], [3.0, 9.0]])
+
+    def test_disabled_by_default(self):
+        self.assertFalse(VisibilityFilter().enabled)
+        self.assertTrue(VisibilityFilter(min_pixel_change=0.5).enabled)
+        self.assertTrue(VisibilityFilter(viewport=(0, 0, 10, 10)).enabled)
+
+    def test_triangle_changes(self):
+        visibility = VisibilityFilter((0, 0, 100, 100), min_pixel_change=0.5)
+        submitted = np.array([[10.0, 10, 20, 10, 15, 20], [10, 10, 20, 10, 15, 20],
+                              [200, 200, 210, 200, 205, 210], [90, 10, 98, 10, 95, 20]])
+        coords = submitted + [[0.1, 0, 0, 0, 0, 0], [1, 0, 0, 0, 0, 0], [5, 0, 0, 0, 0, 0],
+                              [20, 0, 20, 0, 20, 0]]
+        self.assertEqual(visibility.triangle_changes(coords, submitted).tolist(), [False, True, False, True])
+
+    def test_undrawn_triangles_are_drawn_once_in_view(self):
+        visibility = VisibilityFilter((0, 0, 100, 100))
+        coords = np.array([[10.0, 10, 20, 10, 15, 20], [200, 200, 210, 200, 205, 210]])
+        submitted = np.full((2, 6), np.nan)
+        self.assertEqual(visibility.triangle_changes(coords, submitted).tolist(), [True, False])
+
+    def test_polygon_changes(self):
+        visibility = VisibilityFilter(min_pixel_change=1.0)
+        submitted = np.array([[0.0, 0], [1, 0], [0, 1], [5, 5], [6, 5], [6, 6], [5, 6]])
+        vertices = submitted.copy()
+        vertices[4] += 2
+        changes = visibility.polygon_changes(vertices, submitted, np.array([0, 3]))
+        self.assertEqual(changes.tolist(), [False, True])
+
+if __name__ == '__main__':
+    unittest.main()